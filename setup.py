@@ -64,7 +64,7 @@ setup(
     },
     packages=find_packages(
         where="src",
-        exclude=["*.tests", "*.tests.*", "tests.*", "tests"],
+        exclude=["*.tests", "*.tests.*", "tests.*", "tests", "*.benchmarks", "*.benchmarks.*"],
     ),
     include_package_data=True,
     install_requires=read_requirements("requirements.txt"),
@@ -38,7 +38,18 @@ bp.cli.short_help = "Manage aaz commands in azure-cli and azure-cli-extensions."
     required=True,
     help="Name of the module in azure-cli or the extension in azure-cli-extensions"
 )
-def regenerate_code(extension_or_module_name, cli_path=None, cli_extension_path=None):
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    help="The number of processes to render command files in parallel. Commands are rendered one by one by default."
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    default=False,
+    help="Only check whether the aaz code is up to date with command models, exit with 1 if any file is changed."
+)
+def regenerate_code(extension_or_module_name, cli_path=None, cli_extension_path=None, jobs=None, check=False):
     from utils.config import Config
     from utils.exceptions import InvalidAPIUsage
     from cli.controller.az_module_manager import AzExtensionManager, AzMainManager
@@ -63,8 +74,16 @@ def regenerate_code(extension_or_module_name, cli_path=None, cli_extension_path=
             raise ValueError(f"Cannot find module or extension `{extension_or_module_name}`")
         logger.info(f"Load module `{extension_or_module_name}`")
         module = manager.load_module(extension_or_module_name)
+        if check:
+            logger.info(f"Check module `{extension_or_module_name}`")
+            paths = manager.check_module(extension_or_module_name, module.profiles, jobs=jobs)
+            for path in paths:
+                logger.error(f"Out of date: {path}")
+            if paths:
+                sys.exit(1)
+            return
         logger.info(f"Regenerate module `{extension_or_module_name}`")
-        manager.update_module(extension_or_module_name, module.profiles)
+        manager.update_module(extension_or_module_name, module.profiles, jobs=jobs)
     except InvalidAPIUsage as err:
         logger.error(err)
         sys.exit(1)
@@ -128,7 +147,13 @@ def regenerate_code(extension_or_module_name, cli_path=None, cli_extension_path=
     type=click.Choice(Config.CLI_PROFILES),
     default=Config.CLI_DEFAULT_PROFILE,
 )
-def generate_by_swagger_tag(profile, swagger_tag, extension_or_module_name, cli_path=None, cli_extension_path=None):
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    help="The number of processes to render command files in parallel. Commands are rendered one by one by default."
+)
+def generate_by_swagger_tag(profile, swagger_tag, extension_or_module_name, cli_path=None, cli_extension_path=None,
+                            jobs=None):
     from utils.config import Config
     from utils.exceptions import InvalidAPIUsage
     from cli.controller.az_module_manager import AzExtensionManager, AzMainManager
@@ -187,7 +212,7 @@ def generate_by_swagger_tag(profile, swagger_tag, extension_or_module_name, cli_
 
         module.profiles[profile.name] = profile
         logger.info(f"Regenerate module `{extension_or_module_name}`")
-        manager.update_module(extension_or_module_name, module.profiles)
+        manager.update_module(extension_or_module_name, module.profiles, jobs=jobs)
 
     except InvalidAPIUsage as err:
         logger.error(err)
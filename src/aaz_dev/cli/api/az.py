@@ -150,7 +150,7 @@ def portal_generate_main_module(module_name):
         exceptions.ResourceNotFind("Invalid input module: {0}, please check".format(module_name))
         return
 
-    aaz_spec_manager = AAZSpecsManager()
+    aaz_spec_manager = AAZSpecsManager(readonly=True)
     root = aaz_spec_manager.find_command_group()
     if not root:
         raise exceptions.ResourceNotFind("Command group not exist")
@@ -171,7 +171,7 @@ def portal_generate_extension_module(module_name):
         exceptions.ResourceNotFind("Invalid input module: {0}, please check".format(module_name))
         return
 
-    aaz_spec_manager = AAZSpecsManager()
+    aaz_spec_manager = AAZSpecsManager(readonly=True)
     root = aaz_spec_manager.find_command_group()
     if not root:
         raise exceptions.ResourceNotFind("Command group not exist")
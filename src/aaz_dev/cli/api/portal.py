@@ -47,7 +47,7 @@ def generate_module_command_portal(module):
     from command.controller.specs_manager import AAZSpecsManager
     az_main_manager = AzMainManager()
     az_ext_manager = AzExtensionManager()
-    aaz_spec_manager = AAZSpecsManager()
+    aaz_spec_manager = AAZSpecsManager(readonly=True)
     root = aaz_spec_manager.find_command_group()
     if not root:
         return "Command group spec root not exist"
@@ -3,6 +3,7 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 import logging
+import os
 
 from cli.model.atomic import CLIAtomicProfile, CLIAtomicCommandGroup, CLIAtomicCommandGroupRegisterInfo, \
     CLIAtomicCommand, CLIAtomicCommandRegisterInfo, CLISpecsResource, CLICommandGroupHelp, CLICommandHelp, \
@@ -22,15 +23,18 @@ logger = logging.getLogger('backend')
 
 class AzAtomicProfileBuilder:
 
-    def __init__(self, mod_name, by_patch=False):
+    def __init__(self, mod_name, by_patch=False, jobs=None):
         self._mod_name = mod_name
-        self._aaz_spec_manager = AAZSpecsManager()
+        self._aaz_spec_manager = AAZSpecsManager(readonly=True)
         self._by_patch = by_patch
+        # the number of processes to parse cfg files, 1 to load them one by one
+        self._jobs = jobs or min(8, os.cpu_count() or 1)
 
     def __call__(self, view_profile):
         profile = CLIAtomicProfile()
         profile.name = view_profile.name
         if view_profile.command_groups:
+            self._prefetch_cfg_readers(view_profile)
             cmd_groups = {}
             cmd_clients = {}
             for name, view_cmd_group in view_profile.command_groups.items():
@@ -42,22 +46,49 @@ class AzAtomicProfileBuilder:
                 profile.add_client(client)
         return profile
 
+    def _prefetch_cfg_readers(self, view_profile):
+        """Load the cfg files used by the profile concurrently, so that they're in cache when building commands."""
+        keys = set()
+        for view_command_group in self._iter_view_command_groups(view_profile.command_groups.values()):
+            if not view_command_group.commands or not self._should_load_cfg(view_command_group):
+                continue
+            for view_cmd in view_command_group.commands.values():
+                aaz_cmd = self._aaz_spec_manager.find_command(*view_cmd.names)
+                if not aaz_cmd:
+                    continue
+                for v in (aaz_cmd.versions or []):
+                    if v.name == view_cmd.version:
+                        resource = v.resources[0]
+                        keys.add((resource.plane, resource.id, resource.version))
+                        break
+        self._aaz_spec_manager.prefetch_resource_cfg_readers(sorted(keys), jobs=self._jobs)
+
+    @classmethod
+    def _iter_view_command_groups(cls, view_command_groups):
+        for view_command_group in view_command_groups:
+            yield view_command_group
+            if view_command_group.command_groups:
+                yield from cls._iter_view_command_groups(view_command_group.command_groups.values())
+
+    def _should_load_cfg(self, view_command_group):
+        # always load cfg for full generation
+        if not self._by_patch:
+            return True
+        for view_cmd in view_command_group.commands.values():
+            if view_cmd.modified:
+                # when one or more command modified, load the cfg of all the commands in this command group
+                # BTW, sub command groups are not included
+                return True
+        return False
+
     def _build_command_group(self, view_command_group):
         command_group = self._build_command_group_from_aaz(*view_command_group.names)
         stages = set()
         cmd_clients = {}
 
         if view_command_group.commands:
-            # always load cfg for full generation
-            load_cfg = not self._by_patch
+            load_cfg = self._should_load_cfg(view_command_group)
             cmds = {}
-            if not load_cfg:
-                for name, view_cmd in view_command_group.commands.items():
-                    if view_cmd.modified:
-                        # when one or more command modified, load the cfg of all the commands in this command group
-                        # BTW, sub command groups are not included
-                        load_cfg = True
-                        break
             for name, view_cmd in view_command_group.commands.items():
                 cmd, client = self._build_command(view_cmd, load_cfg)
                 if cmd.register_info is not None:
@@ -150,7 +181,7 @@ class AzAtomicProfileBuilder:
         if load_cfg:
             # load cfg file, which will generate the command in code
             cfg_reader = self._aaz_spec_manager.load_resource_cfg_reader_by_command_with_version(
-                aaz_cmd, version=version)
+                aaz_cmd, version=version, readonly=True)
             cmd_cfg = cfg_reader.find_command(*names)
             assert cmd_cfg is not None, f"command model miss in AAZ: '{' '.join(names)}'"
 
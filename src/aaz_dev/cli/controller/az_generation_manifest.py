@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from utils.config import Config
+
+logger = logging.getLogger('backend')
+
+_generator_digest = None
+_generator_digest_lock = threading.Lock()
+
+
+def _get_tool_version():
+    try:
+        from importlib.metadata import version
+        return version('aaz-dev')
+    except Exception:
+        return None
+
+
+def get_generator_digest():
+    """The digest of the tool version and the sources of aaz_dev package, which are used to render the aaz files."""
+    global _generator_digest
+    with _generator_digest_lock:
+        if _generator_digest is None:
+            package_folder = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            digest = hashlib.sha256()
+            digest.update(f"version:{_get_tool_version()}\n".encode('utf-8'))
+            source_files = []
+            for folder, folder_names, file_names in os.walk(package_folder):
+                folder_names[:] = sorted(name for name in folder_names if name not in ('tests', '__pycache__'))
+                source_files.extend(
+                    os.path.join(folder, name) for name in file_names if name.endswith(('.j2', '.py')))
+            for file_path in sorted(source_files):
+                digest.update(f"file:{os.path.relpath(file_path, package_folder)}\n".encode('utf-8'))
+                with open(file_path, 'rb') as f:
+                    digest.update(f.read())
+            _generator_digest = digest.hexdigest()
+        return _generator_digest
+
+
+def get_content_digest(data):
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def get_inputs_digest(inputs):
+    return hashlib.sha256(
+        json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+
+
+class AzGenerationManifest:
+    """The manifest of generated files in aaz folder.
+
+    It records the digest of inputs and the digest of content for each generated command file. The inputs are the
+    command model, the client and the generator digest, so a command file doesn't need to be rendered again when
+    its inputs are not changed and the file on disk is the one generated. The entries are grouped by profile folder,
+    because every profile is generated by a separate AzProfileGenerator.
+    The manifest is kept in the cache folder of aaz-dev, so nothing is added to the aaz folder of cli repos.
+    """
+
+    FOLDER_NAME = "cli_manifests"
+    VERSION = 1
+
+    def __init__(self, aaz_folder, profile_folder_name):
+        self.aaz_folder = aaz_folder
+        self.profile_folder_name = profile_folder_name
+        self.path = self.get_manifest_path(aaz_folder)
+        self.generator_digest = get_generator_digest()
+        self._entries = {}
+        self._new_entries = {}
+        self._load()
+
+    @classmethod
+    def get_manifest_path(cls, aaz_folder):
+        name = hashlib.sha256(os.path.realpath(aaz_folder).encode('utf-8')).hexdigest()[:32]
+        return os.path.join(Config.get_cache_folder(), cls.FOLDER_NAME, f"{name}.json")
+
+    def _load(self):
+        data = self._read()
+        if not data or data.get('generator') != self.generator_digest:
+            # all the files should be rendered again when generator is changed
+            return
+        prefix = self.profile_folder_name + '/'
+        self._entries = {
+            key: value for key, value in data.get('files', {}).items() if key.startswith(prefix)
+        }
+
+    def _read(self):
+        if not os.path.isfile(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as err:
+            logger.warning(f"AzGenerationManifest: ignore invalid manifest {self.path}: {err}")
+            return None
+        if not isinstance(data, dict) or data.get('version') != self.VERSION or \
+                data.get('aazFolder') != os.path.realpath(self.aaz_folder):
+            return None
+        return data
+
+    def _get_key(self, path):
+        return os.path.relpath(path, self.aaz_folder).replace(os.sep, '/')
+
+    def is_up_to_date(self, path, inputs_digest):
+        """Return True if the file was generated from the same inputs and not modified after that."""
+        key = self._get_key(path)
+        entry = self._entries.get(key, None)
+        if entry is None or entry['inputs'] != inputs_digest:
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if get_content_digest(f.read()) != entry['content']:
+                    return False
+        except (OSError, ValueError):
+            return False
+        self._new_entries[key] = entry
+        return True
+
+    def update(self, path, inputs_digest, data):
+        self._new_entries[self._get_key(path)] = {
+            "inputs": inputs_digest,
+            "content": get_content_digest(data),
+        }
+
+    def reset(self):
+        self._new_entries = {}
+
+    def save(self, writer):
+        data = self._read() or {}
+        files = {}
+        if data.get('generator') == self.generator_digest:
+            # keep the entries of other profiles
+            prefix = self.profile_folder_name + '/'
+            files = {key: value for key, value in data.get('files', {}).items() if not key.startswith(prefix)}
+        files.update(self._new_entries)
+        self._entries, self._new_entries = self._new_entries, {}
+        if not files:
+            writer.remove(self.path)
+            return
+        writer.write(self.path, json.dumps({
+            "version": self.VERSION,
+            "aazFolder": os.path.realpath(self.aaz_folder),
+            "generator": self.generator_digest,
+            "files": dict(sorted(files.items())),
+        }, indent=2, ensure_ascii=False) + '\n')
@@ -1,4 +1,3 @@
-import ast
 import glob
 import json
 import logging
@@ -7,6 +6,7 @@ import pkgutil
 import re
 
 from cli.controller.az_profile_generator import AzProfileGenerator
+from cli.controller.az_view_index import AzViewIndex
 from cli.controller.az_atomic_profile_builder import AzAtomicProfileBuilder
 from cli.model.view import CLIModule, CLIViewProfile, CLIViewCommandGroup, CLIViewCommand
 from cli.templates import get_templates
@@ -18,12 +18,11 @@ logger = logging.getLogger('backend')
 
 
 class AzModuleManager:
-    _command_group_pattern = re.compile(r'^class\s+(.*)\(.*AAZCommandGroup.*\)\s*:\s*$')
-    _command_pattern = re.compile(r'^class\s+(.*)\(.*AAZ(Wait)?Command.*\)\s*:\s*$')
     _is_preview_param = re.compile(r'\s*is_preview\s*=\s*True\s*')
     _is_experimental_param = re.compile(r'\s*is_experimental\s*=\s*True\s*')
-    _def_pattern = re.compile(r'^\s*def\s+')
-    _aaz_info_pattern = re.compile(r'^\s*_aaz_info\s*=\s*({.*)$')
+
+    def __init__(self):
+        self._view_index = AzViewIndex.get_shared()
 
     @staticmethod
     def pkg_name(mod_name):
@@ -72,10 +71,11 @@ class AzModuleManager:
     def update_module(self, mod_name, profiles, **kwargs):
         aaz_folder = self.get_aaz_path(mod_name)
         generators = {}
-        atomic_builder = AzAtomicProfileBuilder(mod_name=mod_name, by_patch=kwargs.pop('by_patch', False))
+        jobs = kwargs.pop('jobs', None)
+        atomic_builder = AzAtomicProfileBuilder(mod_name=mod_name, by_patch=kwargs.pop('by_patch', False), jobs=jobs)
         for profile_name, profile in profiles.items():
             profile = atomic_builder(profile)
-            generators[profile_name] = AzProfileGenerator(aaz_folder, profile)
+            generators[profile_name] = AzProfileGenerator(aaz_folder, profile, jobs=jobs)
         for generator in generators.values():
             generator.generate()
         for generator in generators.values():
@@ -90,6 +90,17 @@ class AzModuleManager:
         module.profiles = profiles
         return module
 
+    def check_module(self, mod_name, profiles, **kwargs):
+        """Return the paths of aaz files and folders which are different from the generated, nothing is saved."""
+        aaz_folder = self.get_aaz_path(mod_name)
+        jobs = kwargs.pop('jobs', None)
+        atomic_builder = AzAtomicProfileBuilder(mod_name=mod_name, jobs=jobs)
+        paths = []
+        for profile in profiles.values():
+            profile = atomic_builder(profile)
+            paths.extend(AzProfileGenerator(aaz_folder, profile, jobs=jobs).check())
+        return sorted(paths)
+
     _def_load_command_table = re.compile("^(\s+)def\s+load_command_table\(\s*self,\s+(\w+)\s*\):(.*)?$")
     _def_import_load_aaz = re.compile("\s+(import\s+(\w+.)*load_aaz_command_table)\s*$")
 
@@ -159,32 +170,36 @@ class AzModuleManager:
         profile.command_groups = self._load_view_command_groups(path=profile_path)
         return profile
 
-    def _load_view_command_groups(self, *names, path):
+    def _load_view_command_groups(self, *names, path, folder_entries=None):
         """Load command groups folder in the folder"""
         command_groups = {}
-        assert os.path.isdir(path), f'Invalid folder path {path}'
-        for name in os.listdir(path):
-            sub_path = os.path.join(path, name)
-            if not name.startswith('_') and os.path.isdir(sub_path):
-                name = name.replace('_', '-')  # transform folder_name to command_group_name
-                command_group = self._load_view_command_group(*names, name,
-                                                              path=sub_path)  # load command group definition
+        if folder_entries is None:
+            assert os.path.isdir(path), f'Invalid folder path {path}'
+            folder_entries = self._view_index.list_folder(path)
+        for entry in folder_entries:
+            if not entry.name.startswith('_') and entry.is_dir:
+                name = entry.name.replace('_', '-')  # transform folder_name to command_group_name
+                command_group = self._load_view_command_group(
+                    *names, name, path=os.path.join(path, entry.name))  # load command group definition
                 if command_group:
                     command_groups[name] = command_group
         if not command_groups:
             return None
         return command_groups
 
-    def _load_view_commands(self, *names, path):
+    def _load_view_commands(self, *names, path, folder_entries=None):
         """Load commands in the folder"""
         commands = {}
         wait_command = None
-        assert os.path.isdir(path), f'Invalid folder path {path}'
-        for name in os.listdir(path):
-            sub_path = os.path.join(path, name)
-            if os.path.isfile(sub_path) and name.endswith('.py') and not name.startswith('__') and name.startswith('_'):
-                name = name[1:-3].replace('_', '-')  # transform file_name to command_name
-                command, is_wait = self._load_view_command(*names, name, path=sub_path)  # load command definition
+        if folder_entries is None:
+            assert os.path.isdir(path), f'Invalid folder path {path}'
+            folder_entries = self._view_index.list_folder(path)
+        for entry in folder_entries:
+            if entry.is_file and entry.name.endswith('.py') and not entry.name.startswith('__') and \
+                    entry.name.startswith('_'):
+                name = entry.name[1:-3].replace('_', '-')  # transform file_name to command_name
+                command, is_wait = self._load_view_command(
+                    *names, name, path=os.path.join(path, entry.name))  # load command definition
                 if command:
                     if is_wait:
                         wait_command = command
@@ -196,94 +211,43 @@ class AzModuleManager:
 
     def _load_view_command_group(self, *names, path):
         assert os.path.isdir(path), f'Invalid folder path {path}'
-        init_file = os.path.join(path, '__init__.py')
-        if not os.path.exists(init_file) or not os.path.isfile(init_file):
-            return None
-        cmd_group_file = os.path.join(path, '__cmd_group.py')
-        if not os.path.exists(cmd_group_file) or not os.path.isfile(cmd_group_file):
+        folder_entries = self._view_index.list_folder(path)
+        file_names = {entry.name for entry in folder_entries if entry.is_file}
+        if '__init__.py' not in file_names or '__cmd_group.py' not in file_names:
             return None
-
-        register_info_lines = None
-        find_command_group = False
-        with open(cmd_group_file, 'r', encoding="utf-8") as f:
-            while f.readable():
-                line = f.readline()
-                if line.startswith('@register_command_group('):
-                    register_info_lines = []
-                if self._command_group_pattern.match(line):
-                    find_command_group = True
-                    break
-                if register_info_lines is not None:
-                    register_info_lines.append(line)
-        if not find_command_group:
+        if not self._view_index.scan_command_group(os.path.join(path, '__cmd_group.py')):
             return None
 
         command_group = CLIViewCommandGroup()
         command_group.names = [*names]
 
-        command_group.command_groups = self._load_view_command_groups(*names, path=path)
-        command_group.commands, command_group.wait_command = self._load_view_commands(*names, path=path)
+        command_group.command_groups = self._load_view_command_groups(
+            *names, path=path, folder_entries=folder_entries)
+        command_group.commands, command_group.wait_command = self._load_view_commands(
+            *names, path=path, folder_entries=folder_entries)
         return command_group
 
     def _load_view_command(self, *names, path):
         assert os.path.isfile(path), f'Invalid file path {path}'
 
-        register_info_lines = None
-        aaz_info_lines = None
-        find_command = False
-        is_wait_command = False
-        with open(path, 'r', encoding="utf-8") as f:
-            while f.readable():
-                line = f.readline()
-                if line.startswith('@register_command('):
-                    register_info_lines = []
-                _command_pattern_match = self._command_pattern.match(line)
-                if _command_pattern_match:
-                    find_command = True
-                    is_wait_command = _command_pattern_match[2] is not None
-                    break
-                if register_info_lines is not None:
-                    register_info_lines.append(line)
-            if not find_command:
-                return None, None
-
-            while f.readable():
-                line = f.readline()
-                if self._def_pattern.findall(line):
-                    break
-                match = self._aaz_info_pattern.match(line)
-                if match:
-                    aaz_info_lines = match[1]
-                    while f.readable():
-                        line = f.readline()
-                        line = line.strip()
-                        aaz_info_lines += ' ' + line
-                        if line.endswith('}'):
-                            break
-                    break
-
-        if not find_command:
+        info = self._view_index.scan_command(path)
+        if info is None:
             return None, None
-
-        if not aaz_info_lines:
+        if info.error:
+            raise exceptions.InvalidAPIUsage(f"Command info invalid in code: '{' '.join(names)}': {info.error}")
+        if info.aaz_info is None:
             raise exceptions.InvalidAPIUsage(f"Command info miss in code: '{' '.join(names)}'")
-
-        try:
-            data = ast.literal_eval(aaz_info_lines)
-            if 'version' not in data and not is_wait_command:
-                logger.info(f"Ignore command without version: '{' '.join(names)}'")
-                return None, None
-            version_name = data.get('version', None)
-        except Exception as err:
-            raise exceptions.InvalidAPIUsage(f"Command info invalid in code: '{' '.join(names)}': {err}: {aaz_info_lines}")
+        if 'version' not in info.aaz_info and not info.is_wait:
+            logger.info(f"Ignore command without version: '{' '.join(names)}'")
+            return None, None
 
         command = CLIViewCommand()
         command.names = [*names]
-        command.version = version_name
+        command.version = info.aaz_info.get('version', None)
 
-        if register_info_lines:
+        if info.registered:
             command.registered = True
-        return command, is_wait_command
+        return command, info.is_wait
 
     def _load_view_wait_command(self, *names, path):
         wait_command = None
@@ -1,25 +1,39 @@
+import multiprocessing
 import os
-import shutil
+from concurrent.futures import ProcessPoolExecutor
 from cli.templates import get_templates
 from command.model.configuration import CMDCommand
 from utils.case import to_snake_case
 from .az_command_generator import AzCommandGenerator
 from .az_client_generator import AzClientsGenerator
+from .az_generation_manifest import AzGenerationManifest, get_inputs_digest
 from utils import exceptions
+from utils.config import Config
+from utils.file_writer import AtomicFileWriter
 
 
 class AzProfileGenerator:
     """Used to generate atomic layer command group"""
 
-    def __init__(self, aaz_folder, profile):
+    def __init__(self, aaz_folder, profile, jobs=None, use_manifest=None):
         self.aaz_folder = aaz_folder
         self.profile = profile
         self.profile_folder_name = profile.profile_folder_name
+        # the number of processes to render command files, they're rendered in current process by default
+        self.jobs = jobs or 1
+        if use_manifest is None:
+            use_manifest = Config.CLI_GENERATION_MANIFEST
+        # skip rendering the command files whose inputs are not changed
+        self._manifest = AzGenerationManifest(aaz_folder, self.profile_folder_name) if use_manifest else None
         self._removed_folders = set()
         self._removed_files = set()
         self._modified_files = {}
+        self._command_tasks = []
 
     def generate(self):
+        if self._manifest:
+            self._manifest.reset()
+
         # check aaz/__init__.py
         file_name = '__init__.py'
         if not self._exist_file(file_name):
@@ -52,24 +66,26 @@ class AzProfileGenerator:
                     remain_folders.remove(command_group_folder_name)
             for name in remain_folders:
                 self._delete_folder(self.profile_folder_name, name)
+            self._render_commands()
 
         return sorted(self._removed_folders), sorted(self._removed_files), self._modified_files
 
     def save(self):
+        writer = AtomicFileWriter()
         for folder in self._removed_folders:
-            shutil.rmtree(folder, ignore_errors=True)
+            writer.remove_folder(folder)
         for file in self._removed_files:
-            try:
-                os.remove(file)
-            except FileNotFoundError:
-                pass
+            writer.remove(file)
         for path, data in self._modified_files.items():
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w', encoding="utf-8") as f:
-                f.write(data)
+            # the unchanged files are skipped
+            writer.write(path, data)
+        if self._manifest:
+            self._manifest.save(writer)
+        writer.log_stats(f"AzProfileGenerator: {self.profile.name}")
         self._removed_folders = set()
         self._removed_files = set()
         self._modified_files = {}
+        return writer.get_stats()
 
     def _generate_by_command_group(self, profile_folder_name, command_group):
         assert command_group.command_groups or command_group.commands
@@ -137,18 +153,73 @@ class AzProfileGenerator:
     def _generate_by_command(self, profile_folder_name, command, is_wait=False):
         assert isinstance(command.cfg, CMDCommand)
         file_name = self._command_file_name(command.names[-1])
-        tmpl = get_templates()['aaz']['command']['_cmd.py']
         client = self.profile.get_client(command)
         assert client is not None
-        try:
-            data = tmpl.render(
-                leaf=AzCommandGenerator(command, client, is_wait=is_wait)
-            )
-        except exceptions.InvalidAPIUsage as err:
-            err.message = f"CommandGenerationError: {' '.join(command.names)}: {err.message}"
-            raise err
-        self._update_file(
-            profile_folder_name, *self._command_group_folder_names(*command.names[:-1]), file_name, data=data)
+        # the command files are rendered after all the command groups are walked, the path is registered here
+        # to keep the order of modified files the same as rendering in place.
+        names = (profile_folder_name, *self._command_group_folder_names(*command.names[:-1]), file_name)
+        self._update_file(*names, data=None)
+        self._command_tasks.append((self._get_path(*names), command, client, is_wait))
+
+    def check(self):
+        """Generate the files and return the paths of files and folders which are different from the generated."""
+        removed_folders, removed_files, modified_files = self.generate()
+        paths = [*removed_folders, *removed_files]
+        for path, data in modified_files.items():
+            try:
+                with open(path, 'r', encoding="utf-8") as f:
+                    if f.read() == data:
+                        continue
+            except (OSError, ValueError):
+                pass
+            paths.append(path)
+        self._removed_folders = set()
+        self._removed_files = set()
+        self._modified_files = {}
+        return sorted(paths)
+
+    def _render_commands(self):
+        tasks = []
+        inputs_digests = {}
+        for task in self._command_tasks:
+            path, command, client, is_wait = task
+            if self._manifest:
+                inputs_digest = self._get_command_inputs_digest(command, client, is_wait)
+                if self._manifest.is_up_to_date(path, inputs_digest):
+                    # the file on disk is generated from the same inputs
+                    del self._modified_files[path]
+                    continue
+                inputs_digests[path] = inputs_digest
+            tasks.append(task)
+        self._command_tasks = []
+        if self.jobs > 1 and len(tasks) > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            # the tasks are passed to the forked workers by initargs, which are inherited instead of pickled,
+            # so that the command models are not pickled and every pool gets the tasks of its own generator.
+            with ProcessPoolExecutor(
+                    max_workers=min(self.jobs, len(tasks)), mp_context=multiprocessing.get_context('fork'),
+                    initializer=_init_render_worker, initargs=(tasks,)
+            ) as executor:
+                results = list(executor.map(_render_command_task, range(len(tasks)), chunksize=8))
+        else:
+            results = [_render_command(*task) for task in tasks]
+
+        # merge the results in the order of tasks
+        for path, data, error in results:
+            if error is not None:
+                raise exceptions.InvalidAPIUsage(*error)
+            self._modified_files[path] = data
+            if path in inputs_digests:
+                self._manifest.update(path, inputs_digests[path], data)
+
+    @staticmethod
+    def _get_command_inputs_digest(command, client, is_wait):
+        return get_inputs_digest({
+            "command": command.to_primitive(),
+            "cfg": command.cfg.to_primitive(),
+            "client": client.to_primitive(),
+            "clientCfg": client.cfg.to_primitive() if client.cfg else None,
+            "isWait": is_wait,
+        })
 
     def _generate_by_clients(self, profile_folder_name, clients):
         generator = AzClientsGenerator(clients)
@@ -219,3 +290,29 @@ class AzProfileGenerator:
     @staticmethod
     def _command_group_folder_names(*names):
         return [name.replace('-', '_') for name in names]
+
+
+# the render tasks of a worker process, which is set by the initializer of pool
+_render_tasks = None
+
+
+def _init_render_worker(tasks):
+    global _render_tasks
+    _render_tasks = tasks
+
+
+def _render_command(path, command, client, is_wait):
+    """Return (path, data, error), the error is the arguments of InvalidAPIUsage, which can't be pickled."""
+    tmpl = get_templates()['aaz']['command']['_cmd.py']
+    try:
+        data = tmpl.render(
+            leaf=AzCommandGenerator(command, client, is_wait=is_wait)
+        )
+    except exceptions.InvalidAPIUsage as err:
+        return path, None, (
+            f"CommandGenerationError: {' '.join(command.names)}: {err.message}", err.status_code, err.payload)
+    return path, data, None
+
+
+def _render_command_task(idx):
+    return _render_command(*_render_tasks[idx])
@@ -0,0 +1,120 @@
+import ast
+import os
+import re
+import threading
+from collections import namedtuple
+
+from utils.config import Config
+from utils.fingerprint import FingerprintCache
+
+AzViewFolderEntry = namedtuple('AzViewFolderEntry', ['name', 'is_dir', 'is_file'])
+
+# the view info of a command file, aaz_info is None when the _aaz_info block is missed or invalid
+AzViewCommandInfo = namedtuple('AzViewCommandInfo', ['is_wait', 'registered', 'aaz_info', 'error'])
+
+
+class AzViewScanner:
+    """Single pass scanner of the heads of aaz command and command group files.
+
+    The scanning stops at the command group class for a command group file, and at the first function definition
+    after the command class for a command file, so the rest of the file is never read.
+    """
+
+    _command_group_pattern = re.compile(r'^class\s+(.*)\(.*AAZCommandGroup.*\)\s*:\s*$')
+    _command_pattern = re.compile(r'^class\s+(.*)\(.*AAZ(Wait)?Command.*\)\s*:\s*$')
+    _def_pattern = re.compile(r'^\s*def\s+')
+    _aaz_info_pattern = re.compile(r'^\s*_aaz_info\s*=\s*({.*)$')
+
+    @classmethod
+    def scan_command_group(cls, path):
+        """Return True if the file defines a command group."""
+        with open(path, 'r', encoding="utf-8") as f:
+            for line in f:
+                if cls._command_group_pattern.match(line):
+                    return True
+        return False
+
+    @classmethod
+    def scan_command(cls, path):
+        """Return the AzViewCommandInfo of the file, or None if it doesn't define a command."""
+        register_info_lines = None
+        is_wait_command = None
+        aaz_info_lines = None
+        with open(path, 'r', encoding="utf-8") as f:
+            for line in f:
+                if is_wait_command is None:
+                    if line.startswith('@register_command('):
+                        register_info_lines = []
+                    command_match = cls._command_pattern.match(line)
+                    if command_match:
+                        is_wait_command = command_match[2] is not None
+                    elif register_info_lines is not None:
+                        register_info_lines.append(line)
+                    continue
+
+                if aaz_info_lines is not None:
+                    line = line.strip()
+                    aaz_info_lines += ' ' + line
+                    if line.endswith('}'):
+                        break
+                    continue
+
+                if cls._def_pattern.match(line):
+                    break
+                match = cls._aaz_info_pattern.match(line)
+                if match:
+                    aaz_info_lines = match[1]
+                    if aaz_info_lines.rstrip().endswith('}'):
+                        break
+
+        if is_wait_command is None:
+            return None
+
+        registered = bool(register_info_lines)
+        if not aaz_info_lines:
+            return AzViewCommandInfo(is_wait_command, registered, None, None)
+        try:
+            aaz_info = ast.literal_eval(aaz_info_lines)
+            if not isinstance(aaz_info, dict):
+                raise ValueError("Not a dict")
+        except Exception as err:
+            return AzViewCommandInfo(is_wait_command, registered, None, f"{err}: {aaz_info_lines}")
+        return AzViewCommandInfo(is_wait_command, registered, aaz_info, None)
+
+
+class AzViewIndex(FingerprintCache):
+    """LRU index of the scanned aaz folders and files shared across module managers.
+
+    Every entry is keyed by path and validated by the fingerprint of the file or folder, so only the folders and
+    files modified after the last loading are listed and scanned again. The folder fingerprint changes when an entry
+    is added, removed or renamed in it.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        max_entries = Config.CLI_VIEW_INDEX_SIZE
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.max_entries != max_entries:
+                cls._shared = cls(max_entries)
+            return cls._shared
+
+    def list_folder(self, path):
+        """Return the sorted AzViewFolderEntry tuple of the folder."""
+        return self.load(path, self._list_folder, key=('folder', path))
+
+    def scan_command_group(self, path):
+        return self.load(path, AzViewScanner.scan_command_group, key=('group', path))
+
+    def scan_command(self, path):
+        return self.load(path, AzViewScanner.scan_command, key=('command', path))
+
+    @staticmethod
+    def _list_folder(path):
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                entries.append(AzViewFolderEntry(entry.name, entry.is_dir(), entry.is_file()))
+        return tuple(sorted(entries))
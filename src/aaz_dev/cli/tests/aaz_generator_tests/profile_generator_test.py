@@ -0,0 +1,177 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from cli.controller.az_generation_manifest import AzGenerationManifest
+from cli.controller.az_profile_generator import AzProfileGenerator
+from cli.model.atomic import CLIAtomicProfile, CLIAtomicCommandGroup, CLIAtomicCommand, CLIAtomicClient
+from command.controller.cfg_reader import CfgReader
+from command.model.configuration import CMDConfiguration, XMLSerializer
+from command.model.specs import CMDSpecsCommandTree
+from utils.config import Config
+from utils.plane import PlaneEnum
+from utils.stage import AAZStageEnum
+
+
+class AzProfileGeneratorTest(TestCase):
+
+    def setUp(self):
+        self.aaz_folder = tempfile.mkdtemp()
+        self.cache_folder = tempfile.mkdtemp()
+        self._cache_folder_config = Config.AAZ_DEV_CACHE_FOLDER
+        Config.AAZ_DEV_CACHE_FOLDER = self.cache_folder
+
+    def tearDown(self):
+        Config.AAZ_DEV_CACHE_FOLDER = self._cache_folder_config
+        shutil.rmtree(self.aaz_folder)
+        shutil.rmtree(self.cache_folder)
+
+    @staticmethod
+    def _build_profile():
+        folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "databricks")
+        with open(os.path.join(folder, "tree.json"), 'r', encoding='utf-8') as f:
+            tree = CMDSpecsCommandTree(json.load(f))
+        with open(os.path.join(folder, "workspace-crud.xml"), 'r', encoding='utf-8') as f:
+            cfg_reader = CfgReader(XMLSerializer.from_xml(CMDConfiguration, f.read()))
+
+        profile = CLIAtomicProfile({"name": "latest"})
+        profile.add_client(CLIAtomicClient({
+            "plane": PlaneEnum.Mgmt,
+            "name": PlaneEnum.http_client(PlaneEnum.Mgmt),
+            "registeredName": PlaneEnum.http_client(PlaneEnum.Mgmt),
+        }))
+        groups = {}
+        for names in (['databricks'], ['databricks', 'workspace']):
+            groups[len(names)] = CLIAtomicCommandGroup({
+                "names": names,
+                "help": {"short": ' '.join(names)},
+                "registerInfo": {"stage": AAZStageEnum.Stable},
+            })
+        groups[1].command_groups = {"workspace": groups[2]}
+        groups[2].commands = {}
+        for cmd_name in ("create", "show", "delete", "update"):
+            cmd = tree.root.command_groups['databricks'].command_groups['workspace'].commands[cmd_name]
+            command = CLIAtomicCommand({
+                "names": cmd.names,
+                "help": {"short": cmd.help.short},
+                "registerInfo": {"stage": cmd.versions[0].stage or AAZStageEnum.Stable},
+                "version": cmd.versions[0].name,
+                "resources": [r.to_primitive() for r in cmd.versions[0].resources],
+            })
+            command.cfg = cfg_reader.find_command('databricks', 'workspace', cmd_name)
+            groups[2].commands[cmd_name] = command
+        profile.command_groups = {"databricks": groups[1]}
+        return profile
+
+    def test_generate_in_parallel(self):
+        profile = self._build_profile()
+        _, _, modified_files = AzProfileGenerator(self.aaz_folder, profile, use_manifest=False).generate()
+        _, _, parallel_modified_files = AzProfileGenerator(
+            self.aaz_folder, profile, jobs=3, use_manifest=False).generate()
+        self.assertEqual(list(parallel_modified_files.items()), list(modified_files.items()))
+        self.assertIn(
+            os.path.join(self.aaz_folder, "latest", "databricks", "workspace", "_create.py"), modified_files)
+        self.assertTrue(all(data for data in modified_files.values()))
+
+    def test_generate_in_parallel_concurrently(self):
+        profile = self._build_profile()
+        aaz_folders = [os.path.join(self.aaz_folder, f"aaz{idx}") for idx in range(4)]
+        expected = [
+            AzProfileGenerator(aaz_folder, profile, use_manifest=False).generate()[2] for aaz_folder in aaz_folders
+        ]
+
+        def _generate(aaz_folder):
+            return AzProfileGenerator(aaz_folder, profile, jobs=2, use_manifest=False).generate()[2]
+
+        # every generation renders its own commands
+        with ThreadPoolExecutor(max_workers=len(aaz_folders)) as executor:
+            results = list(executor.map(_generate, aaz_folders))
+        self.assertEqual(results, expected)
+
+    def test_save_unchanged_files(self):
+        profile = self._build_profile()
+        generator = AzProfileGenerator(self.aaz_folder, profile, use_manifest=False)
+        _, _, modified_files = generator.generate()
+        stats = generator.save()
+        self.assertEqual(stats['written'], len(modified_files))
+
+        cmd_path = os.path.join(self.aaz_folder, "latest", "databricks", "workspace", "_create.py")
+        with open(cmd_path, 'a', encoding='utf-8') as f:
+            f.write("# modified\n")
+        _, _, modified_files = generator.generate()
+        stats = generator.save()
+        self.assertEqual(stats['written'], 1)
+        self.assertEqual(stats['skipped'], len(modified_files) - 1)
+        with open(cmd_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), modified_files[cmd_path])
+
+        mtime = os.stat(cmd_path).st_mtime_ns
+        generator.generate()
+        stats = generator.save()
+        self.assertNotIn('written', stats)
+        self.assertEqual(os.stat(cmd_path).st_mtime_ns, mtime)
+        self.assertEqual([name for name in os.listdir(os.path.dirname(cmd_path)) if name.endswith('.tmp')], [])
+
+    def test_generation_manifest(self):
+        profile = self._build_profile()
+        generator = AzProfileGenerator(self.aaz_folder, profile, use_manifest=True)
+        generator.generate()
+        generator.save()
+        # the manifest is kept out of aaz folder
+        self.assertTrue(os.path.isfile(AzGenerationManifest.get_manifest_path(self.aaz_folder)))
+        self.assertTrue(AzGenerationManifest.get_manifest_path(self.aaz_folder).startswith(self.cache_folder))
+        self.assertEqual(
+            [name for name in os.listdir(self.aaz_folder) if name.startswith('.')], [])
+
+        cmd_folder = os.path.join(self.aaz_folder, "latest", "databricks", "workspace")
+        cmd_paths = [os.path.join(cmd_folder, f"_{name}.py") for name in ("create", "show", "delete", "update")]
+        generator = AzProfileGenerator(self.aaz_folder, profile, use_manifest=True)
+        _, _, modified_files = generator.generate()
+        # the commands with unchanged inputs are not rendered
+        self.assertFalse(set(cmd_paths) & set(modified_files))
+        self.assertEqual(generator.check(), [])
+
+        # modified file is rendered again
+        with open(cmd_paths[0], 'a', encoding='utf-8') as f:
+            f.write("# modified\n")
+        self.assertEqual(AzProfileGenerator(self.aaz_folder, profile, use_manifest=True).check(), [cmd_paths[0]])
+        _, _, modified_files = generator.generate()
+        self.assertEqual(set(cmd_paths) & set(modified_files), {cmd_paths[0]})
+        generator.save()
+
+        # changed command model is rendered again
+        command = profile.command_groups['databricks'].command_groups['workspace'].commands['show']
+        command.help.short = "Changed short summary."
+        generator = AzProfileGenerator(self.aaz_folder, profile, use_manifest=True)
+        self.assertEqual(generator.check(), [cmd_paths[1]])
+        _, _, modified_files = generator.generate()
+        self.assertEqual(set(cmd_paths) & set(modified_files), {cmd_paths[1]})
+
+    def test_save_clean_stale_tmp_files(self):
+        profile = self._build_profile()
+        generator = AzProfileGenerator(self.aaz_folder, profile)
+        generator.generate()
+        generator.save()
+
+        # the temp files left by the crashed process are removed when the folder is written next time
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        cmd_folder = os.path.join(self.aaz_folder, "latest", "databricks", "workspace")
+        stale_tmp_path = os.path.join(cmd_folder, f"._create.py.{process.pid}.0.tmp")
+        running_tmp_path = os.path.join(cmd_folder, f"._create.py.{os.getpid()}.0.tmp")
+        for tmp_path in (stale_tmp_path, running_tmp_path):
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write("# interrupted\n")
+        with open(os.path.join(cmd_folder, "_create.py"), 'a', encoding='utf-8') as f:
+            f.write("# modified\n")
+        generator.generate()
+        stats = generator.save()
+        self.assertEqual(stats['written'], 1)
+        self.assertEqual(stats['removedTmpFiles'], 1)
+        self.assertFalse(os.path.exists(stale_tmp_path))
+        self.assertTrue(os.path.exists(running_tmp_path))
@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+
+from cli.controller.az_module_manager import AzModuleManager
+from cli.controller.az_profile_generator import AzProfileGenerator
+from cli.controller.az_view_index import AzViewIndex
+from cli.tests.aaz_generator_tests import profile_generator_test
+
+
+class AzViewIndexTest(TestCase):
+
+    def setUp(self):
+        self.aaz_folder = tempfile.mkdtemp()
+        generator = AzProfileGenerator(
+            self.aaz_folder, profile_generator_test.AzProfileGeneratorTest._build_profile(), use_manifest=False)
+        generator.generate()
+        generator.save()
+        self.manager = AzModuleManager()
+        self.manager._view_index = AzViewIndex(max_entries=100)
+        self.manager.get_aaz_path = lambda _: self.aaz_folder
+
+    def tearDown(self):
+        shutil.rmtree(self.aaz_folder)
+
+    def _load_workspace_group(self):
+        profile = self.manager._load_view_profile("latest", self.aaz_folder)
+        return profile.command_groups['databricks'].command_groups['workspace']
+
+    def test_load_view_profile(self):
+        group = self._load_workspace_group()
+        self.assertEqual(group.names, ['databricks', 'workspace'])
+        self.assertEqual(sorted(group.commands), ['create', 'delete', 'show', 'update'])
+        command = group.commands['create']
+        self.assertEqual(command.names, ['databricks', 'workspace', 'create'])
+        self.assertEqual(command.version, '2018-04-01')
+        self.assertTrue(command.registered)
+
+        stats = self.manager._view_index.get_stats()
+        self.assertNotIn('hits', stats)
+        misses = stats['misses']
+
+        # nothing is scanned again when the files are not modified
+        self._load_workspace_group()
+        stats = self.manager._view_index.get_stats()
+        self.assertEqual(stats['misses'], misses)
+        self.assertEqual(stats['hits'], misses)
+
+    def test_rescan_modified_file(self):
+        self._load_workspace_group()
+        misses = self.manager._view_index.get_stats()['misses']
+
+        cmd_path = os.path.join(self.aaz_folder, "latest", "databricks", "workspace", "_create.py")
+        with open(cmd_path, 'r', encoding='utf-8') as f:
+            data = f.read()
+        with open(cmd_path, 'w', encoding='utf-8') as f:
+            f.write(data.replace('"version": "2018-04-01"', '"version": "2021-04-01"'))
+        mtime = time.time() + 10
+        os.utime(cmd_path, (mtime, mtime))
+
+        group = self._load_workspace_group()
+        self.assertEqual(group.commands['create'].version, '2021-04-01')
+        stats = self.manager._view_index.get_stats()
+        self.assertEqual(stats['misses'], misses + 1)
+        self.assertEqual(stats['invalidations'], 1)
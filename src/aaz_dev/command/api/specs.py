@@ -1,4 +1,6 @@
-from flask import Blueprint, jsonify, request
+import json
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 
 from utils import exceptions
 from utils.plane import PlaneEnum
@@ -11,7 +13,7 @@ bp = Blueprint('specs', __name__, url_prefix='/AAZ/Specs')
 # modules
 @bp.route("/CommandTree/Simple", methods=("GET",))
 def simple_command_tree():
-    manager = AAZSpecsManager()
+    manager = AAZSpecsManager(readonly=True)
     tree = manager.simple_tree
     if not tree:
         raise exceptions.ResourceNotFind("Command group not exist")
@@ -26,7 +28,7 @@ def command_tree_node(node_names):
         raise exceptions.ResourceNotFind("Command group not exist")
     node_names = node_names[1:]
 
-    manager = AAZSpecsManager()
+    manager = AAZSpecsManager(readonly=True)
     node = manager.find_command_group(*node_names)
     if not node:
         raise exceptions.ResourceNotFind("Command group not exist")
@@ -41,7 +43,7 @@ def command_tree_leaf(node_names, leaf_name):
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = AAZSpecsManager()
+    manager = AAZSpecsManager(readonly=True)
     leaf = manager.find_command(*node_names, leaf_name)
     if not leaf:
         raise exceptions.ResourceNotFind("Command not exist")
@@ -54,7 +56,7 @@ def command_tree_leaf(node_names, leaf_name):
 def command_tree_leaves():
     data = request.get_json()
     result = []
-    manager = AAZSpecsManager()
+    manager = AAZSpecsManager(readonly=True)
 
     for command_names in data:
         if command_names[0] != AAZSpecsManager.COMMAND_TREE_ROOT_NAME:
@@ -73,24 +75,76 @@ def aaz_command_in_version(node_names, leaf_name, version_name):
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = AAZSpecsManager()
-    leaf = manager.find_command(*node_names, leaf_name)
+    manager = AAZSpecsManager(readonly=True)
+    leaf, version = _find_command_version(manager, *node_names, leaf_name, version_name=version_name)
+
+    cfg_reader = manager.load_resource_cfg_reader_by_command_with_version(
+        leaf, version=version, readonly=True)
+    cmd_cfg = _find_command_cfg(leaf, version, cfg_reader)
+    return jsonify(_build_command_version(leaf, version, cmd_cfg))
+
+
+@bp.route("/CommandTree/Nodes/Leaves/Versions", methods=("POST",))
+def aaz_commands_in_versions():
+    """Load the command versions in the request body, the results are streamed as JSON lines in the same order.
+
+    The request body is a list of {"names": [...], "version": "..."} and the names start with the root name. All the
+    command versions and their cfgs are resolved before streaming, so that the errors are responded with status code,
+    and the cfg of every resource is loaded only once.
+    """
+    data = request.get_json()
+    if not isinstance(data, list):
+        raise exceptions.InvalidAPIUsage("Invalid request body")
+    manager = AAZSpecsManager(readonly=True)
+
+    command_versions = []
+    for item in data:
+        if not isinstance(item, dict) or not item.get('version'):
+            raise exceptions.InvalidAPIUsage(f"Invalid request item: {item}")
+        command_names = item.get('names')
+        if not isinstance(command_names, list) or not command_names or \
+                not all(isinstance(name, str) for name in command_names):
+            raise exceptions.InvalidAPIUsage(f"Invalid request item: {item}")
+        if command_names[0] != AAZSpecsManager.COMMAND_TREE_ROOT_NAME:
+            raise exceptions.ResourceNotFind(f"Command not exist: {' '.join(command_names)}")
+        command_versions.append(_find_command_version(manager, *command_names[1:], version_name=item['version']))
+
+    cfg_readers = {}
+    command_cfgs = []
+    for leaf, version in command_versions:
+        resource = version.resources[0]
+        key = (resource.plane, resource.id, resource.version)
+        if key not in cfg_readers:
+            cfg_readers[key] = manager.load_resource_cfg_reader(
+                resource.plane, resource.id, resource.version, readonly=True)
+        command_cfgs.append((leaf, version, _find_command_cfg(leaf, version, cfg_readers[key])))
+
+    def generate():
+        for leaf, version, cmd_cfg in command_cfgs:
+            yield json.dumps(_build_command_version(leaf, version, cmd_cfg), ensure_ascii=False) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+def _find_command_version(manager, *cmd_names, version_name):
+    leaf = manager.find_command(*cmd_names)
     if not leaf:
-        raise exceptions.ResourceNotFind("Command not exist")
+        raise exceptions.ResourceNotFind(f"Command not exist: {' '.join(cmd_names)}")
 
-    version = None
-    for v in (leaf.versions or []):
-        if v.name == version_name:
-            version = v
-            break
+    for version in (leaf.versions or []):
+        if version.name == version_name:
+            return leaf, version
+    raise exceptions.ResourceNotFind(f"Command of version not exist: {' '.join(cmd_names)} {version_name}")
 
-    if not version:
-        raise exceptions.ResourceNotFind("Command of version not exist")
 
-    cfg_reader = manager.load_resource_cfg_reader_by_command_with_version(
-        leaf, version=version)
-    cmd_cfg = cfg_reader.find_command(*leaf.names)
+def _find_command_cfg(leaf, version, cfg_reader):
+    cmd_cfg = cfg_reader.find_command(*leaf.names) if cfg_reader else None
+    if not cmd_cfg:
+        raise exceptions.ResourceNotFind(f"Command cfg not exist: {' '.join(leaf.names)} {version.name}")
+    return cmd_cfg
+
 
+def _build_command_version(leaf, version, cmd_cfg):
     result = cmd_cfg.to_primitive()
     del result['name']
     result.update({
@@ -99,14 +153,13 @@ def aaz_command_in_version(node_names, leaf_name, version_name):
         'stage': version.stage,
     })
     if version.examples:
-        result['examples'] = version.examples.to_primitive()
-
-    return jsonify(result)
+        result['examples'] = [e.to_primitive() for e in version.examples]
+    return result
 
 
 @bp.route("/Resources/<plane>/<base64:resource_id>", methods=("GET", ))
 def get_resource(plane, resource_id):
-    manager = AAZSpecsManager()
+    manager = AAZSpecsManager(readonly=True)
     versions = manager.get_resource_versions(plane, resource_id)
     if versions is None:
         raise exceptions.ResourceNotFind("Resource not exist")
@@ -122,7 +175,7 @@ def filter_resources(plane):
     data = request.get_json()
     if 'resources' not in data:
         raise exceptions.InvalidAPIUsage("Invalid request body")
-    manager = AAZSpecsManager()
+    manager = AAZSpecsManager(readonly=True)
 
     result = {
         'resources': []
@@ -5,7 +5,7 @@ from command.model.configuration import CMDConfiguration, CMDHttpOperation, CMDI
     CMDResponseJson, CMDObjectSchemaBase, CMDArraySchemaBase, CMDSchema, CMDHttpRequestJsonBody, \
     CMDJsonInstanceUpdateAction, CMDHttpResponseJsonBody, CMDObjectSchemaDiscriminator, CMDInstanceCreateOperation, \
     CMDJsonInstanceCreateAction, CMDSchemaBase, CMDArraySchema, CMDObjectSchema, CMDInstanceDeleteOperation, \
-    CMDIdentityObjectSchema
+    CMDIdentityObjectSchema, CMDReadOnlyConfiguration, CMDReadOnlyCommandGroup
 from swagger.utils.tools import swagger_resource_path_to_resource_id
 
 
@@ -23,6 +23,137 @@ class _SchemaIdxEnum:
     Json = "_json"
 
 
+class CfgCommandIndex:
+    """Index of the arguments and schemas in a command.
+
+    The arguments and the schemas are walked only once when they are looked up at the first time. The index is cached
+    in `command.cfg_index`, which is reset when the command is reformatted, linked or its arguments are regenerated.
+    """
+
+    def __init__(self, command):
+        self._command = command
+        self._args = None
+        self._schemas = None
+
+    @classmethod
+    def get(cls, command):
+        index = command.cfg_index
+        if index is None:
+            index = command.cfg_index = cls(command)
+        return index
+
+    # arguments
+    def find_arg_with_parent_by_var(self, arg_var):
+        args = self._get_args()
+        pos = args['vars'].get(arg_var, None)
+        flattened_pos = args['flattened_vars'].get(arg_var, None)
+        if flattened_pos is not None and (pos is None or flattened_pos < pos):
+            # arg_var already been flattened
+            parent, _, _, _ = args['entries'][flattened_pos]
+            return parent, None, None
+        if pos is None:
+            return None, None, None
+        parent, arg, arg_idx, _ = args['entries'][pos]
+        return parent, arg, arg_idx
+
+    def find_arg_cls_definition(self, cls_name):
+        args = self._get_args()
+        pos = args['cls_definitions'].get(cls_name, None)
+        if pos is None:
+            return None, None, None, None
+        return args['entries'][pos]
+
+    def iter_arg_cls_definition(self, cls_name_prefix=None):
+        args = self._get_args()
+        for pos in args['cls_args']:
+            match = args['entries'][pos]
+            if cls_name_prefix is None or match[1].cls.startswith(cls_name_prefix):
+                yield match
+
+    def iter_arg_cls_reference(self, cls_name):
+        args = self._get_args()
+        for pos in args['types'].get(f"@{cls_name}", ()):
+            yield args['entries'][pos]
+
+    def iter_args(self):
+        return iter(self._get_args()['entries'])
+
+    # schemas
+    def iter_schema_by_arg_var(self, arg_var):
+        for parent, schema, schema_idx in self._get_schemas()['arg_vars'].get(arg_var, ()):
+            yield parent, schema, [*schema_idx]
+
+    def iter_schema_cls_reference(self, cls_name):
+        for parent, schema, schema_idx in self._get_schemas()['types'].get(f"@{cls_name}", ()):
+            yield parent, schema, [*schema_idx]
+
+    def _get_args(self):
+        if self._args is not None:
+            return self._args
+
+        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
+            return (_parent, _arg, _arg_idx, _arg_var), False
+
+        entries = []
+        arg_vars = {}
+        flattened_vars = {}
+        cls_args = []
+        cls_definitions = {}
+        types = {}
+        for arg_group in self._command.arg_groups or []:
+            for parent, arg, arg_idx, arg_var in CfgReader._iter_args_in_group(arg_group, arg_filter=arg_filter):
+                pos = len(entries)
+                entries.append((parent, arg, CfgReader.arg_idx_to_str(arg_idx), arg_var))
+                arg_vars.setdefault(arg_var, pos)
+                # the arg_var of the flattened argument is the prefix of its sub arguments' var
+                dot = arg_var.find('.')
+                while dot >= 0:
+                    flattened_vars.setdefault(arg_var[:dot], pos)
+                    dot = arg_var.find('.', dot + 1)
+                cls_name = getattr(arg, 'cls', None)
+                if cls_name is not None:
+                    cls_args.append(pos)
+                    cls_definitions.setdefault(cls_name, pos)
+                types.setdefault(arg.type, []).append(pos)
+
+        self._args = {
+            "entries": entries,
+            "vars": arg_vars,
+            "flattened_vars": flattened_vars,
+            "cls_args": cls_args,
+            "cls_definitions": cls_definitions,
+            "types": types,
+        }
+        return self._args
+
+    def _get_schemas(self):
+        if self._schemas is not None:
+            return self._schemas
+
+        def schema_filter(_parent, _schema, _schema_idx):
+            return (_parent, _schema, _schema_idx), False
+
+        arg_vars = {}
+        types = {}
+        for operation in self._command.operations or []:
+            for parent, schema, schema_idx in CfgReader._iter_schema_in_operation(
+                    operation, schema_filter=schema_filter, with_response=True):
+                entry = (parent, schema, tuple(schema_idx))
+                types.setdefault(schema.type, []).append(entry)
+                if schema_idx[0] == _SchemaIdxEnum.Http and schema_idx[1].startswith(_SchemaIdxEnum.Response):
+                    # the args are not used by the schemas in response
+                    continue
+                arg_var = CfgReader.get_schema_arg_var(parent, schema, schema_idx)
+                if arg_var is not None:
+                    arg_vars.setdefault(arg_var, []).append(entry)
+
+        self._schemas = {
+            "arg_vars": arg_vars,
+            "types": types,
+        }
+        return self._schemas
+
+
 class CfgReader:
 
     def __init__(self, cfg):
@@ -79,7 +210,7 @@ class CfgReader:
         idx = 0
         while idx < len(groups):
             node_names, command_group = groups[idx]
-            assert isinstance(command_group, CMDCommandGroup)
+            assert isinstance(command_group, (CMDCommandGroup, CMDReadOnlyCommandGroup))
             if command_group.commands:
                 for command in command_group.commands:
                     cmd_names = [*node_names, command.name]
@@ -318,31 +449,7 @@ class CfgReader:
     @classmethod
     def find_arg_in_command_with_parent_by_var(cls, command, arg_var):
         assert isinstance(arg_var, str), f"invalid arg_var type: {type(arg_var)}"
-
-        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
-            if arg_var == _arg_var:
-                # find match
-                return (_parent, _arg, _arg_idx, _arg_var), True
-            elif _arg_var.startswith(f'{arg_var}.'):
-                # arg_var already been flattened
-                return (_parent, None, None, None), True
-            return None, False
-
-        if command.arg_groups:
-            for arg_group in command.arg_groups:
-                matches = [match for match in cls._iter_args_in_group(
-                    arg_group, arg_filter=arg_filter
-                )]
-                if not matches:
-                    continue
-                assert len(matches) == 1
-
-                parent, arg, arg_idx, arg_var = matches[0]
-                if arg:
-                    arg_idx = cls.arg_idx_to_str(arg_idx)
-                return parent, arg, arg_idx
-
-        return None, None, None
+        return CfgCommandIndex.get(command).find_arg_with_parent_by_var(arg_var)
 
     @classmethod
     def is_similar_args(cls, arg1, arg2):
@@ -355,6 +462,11 @@ class CfgReader:
 
         return cls._is_similar_args_in_base(arg1, arg2)
 
+    @staticmethod
+    def get_similar_args_signature(arg):
+        """The arguments with different signatures are never similar, see `is_similar_args`."""
+        return frozenset(arg.options), arg.stage, arg.hide
+
     @classmethod
     def _is_similar_args_in_base(cls, arg1, arg2):
         if isinstance(arg1, CMDArrayArgBase) and isinstance(arg2, CMDArrayArgBase):
@@ -403,28 +515,7 @@ class CfgReader:
     def _find_arg_cls_definition(cls, command, cls_name):
 
         assert isinstance(cls_name, str) and not cls_name.startswith('@')
-
-        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
-            if getattr(_arg, 'cls', None) == cls_name:
-                # find match
-                return (_parent, _arg, _arg_idx, _arg_var), True
-            return None, False
-
-        if command.arg_groups:
-            for arg_group in command.arg_groups:
-                matches = [match for match in cls._iter_args_in_group(
-                    arg_group, arg_filter=arg_filter
-                )]
-                if not matches:
-                    continue
-                assert len(matches) == 1
-
-                parent, arg, arg_idx, arg_var = matches[0]
-                if arg:
-                    arg_idx = cls.arg_idx_to_str(arg_idx)
-                return parent, arg, arg_idx, arg_var
-
-        return None, None, None, None
+        return CfgCommandIndex.get(command).find_arg_cls_definition(cls_name)
 
     def iter_arg_cls_definition(self, *cmd_names, cls_name_prefix=None):
         command = self.find_command(*cmd_names)
@@ -443,19 +534,8 @@ class CfgReader:
                 # `<cls>_create`, `<cls>_update` kind cls_name only
                 cls_name_prefix += '_'
 
-        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
-            _cls = getattr(_arg, 'cls', None)
-            if _cls is not None and (cls_name_prefix is None or _cls.startswith(cls_name_prefix)):
-                # find match
-                return (_parent, _arg, _arg_idx, _arg_var), False
-            return None, False
-
-        if command.arg_groups:
-            for arg_group in command.arg_groups:
-                for parent, arg, arg_idx, arg_var in cls._iter_args_in_group(arg_group, arg_filter=arg_filter):
-                    if arg:
-                        arg_idx = cls.arg_idx_to_str(arg_idx)
-                    yield parent, arg, arg_idx, arg_var
+        for match in CfgCommandIndex.get(command).iter_arg_cls_definition(cls_name_prefix=cls_name_prefix):
+            yield match
 
     def iter_arg_cls_reference(self, *cmd_names, cls_name):
         command = self.find_command(*cmd_names)
@@ -468,35 +548,13 @@ class CfgReader:
     @classmethod
     def _iter_arg_cls_reference(cls, command, cls_name):
         assert isinstance(cls_name, str) and not cls_name.startswith('@')
-
-        cls_type_name = f"@{cls_name}"
-
-        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
-            if _arg.type == cls_type_name:
-                # find match
-                return (_parent, _arg, _arg_idx, _arg_var), False
-            return None, False
-
-        if command.arg_groups:
-            for arg_group in command.arg_groups:
-                for parent, arg, arg_idx, arg_var in cls._iter_args_in_group(
-                        arg_group, arg_filter=arg_filter):
-                    if arg:
-                        arg_idx = cls.arg_idx_to_str(arg_idx)
-                    yield parent, arg, arg_idx, arg_var
+        for match in CfgCommandIndex.get(command).iter_arg_cls_reference(cls_name):
+            yield match
 
     def iter_args_in_command(self, command):
-        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
-            return (_parent, _arg, _arg_idx, _arg_var), False
-
-        if command.arg_groups:
-            for arg_group in command.arg_groups:
-                for parent, arg, arg_idx, arg_var in self._iter_args_in_group(arg_group, arg_filter=arg_filter):
-                    if arg:
-                        arg_idx = self.arg_idx_to_str(arg_idx)
-                    yield parent, arg, arg_idx, arg_var
+        for match in CfgCommandIndex.get(command).iter_args():
+            yield match
 
-    # TODO: build arg_idx in command link call
     @classmethod
     def _iter_args_in_group(cls, arg_group, arg_filter):
         assert isinstance(arg_group, CMDArgGroup)
@@ -767,54 +825,36 @@ class CfgReader:
 
     @classmethod
     def iter_schema_in_command_by_arg_var(cls, command, arg_var):
-        for operation in command.operations:
-            for match in cls.iter_schema_in_operation_by_arg_var(operation, arg_var):
-                yield match
+        for match in CfgCommandIndex.get(command).iter_schema_by_arg_var(arg_var):
+            yield match
 
     @classmethod
     def iter_schema_in_operation_by_arg_var(cls, operation, arg_var):
         def schema_filter(_parent, _schema, _schema_idx):
-            if isinstance(_schema, CMDSchema):
-                if _schema.arg == arg_var:
-                    # find match
-                    return (_parent, _schema, _schema_idx), False
-            elif isinstance(_schema, CMDSchemaBase):
-                if arg_var.endswith('[]') and _schema_idx[-1] == '[]' and \
-                        isinstance(_parent, CMDArraySchema) and _parent.arg == arg_var[:-2]:
-                    # find match
-                    return (_parent, _schema, _schema_idx), False
-                elif arg_var.endswith('{}') and _schema_idx[-1] == '{}' and \
-                        isinstance(_parent, CMDObjectSchema) and _parent.arg == arg_var[:-2]:
-                    # find match
-                    return (_parent, _schema, _schema_idx), False
+            if cls.get_schema_arg_var(_parent, _schema, _schema_idx) == arg_var:
+                # find match
+                return (_parent, _schema, _schema_idx), False
             return None, False
 
-        if isinstance(operation, CMDHttpOperation) and operation.http.request:
-            for parent, schema, schema_idx in cls._iter_schema_in_request(
-                    operation.http.request, schema_filter=schema_filter):
-                if schema:
-                    schema_idx = [_SchemaIdxEnum.Http, _SchemaIdxEnum.Request, *schema_idx]
-                yield parent, schema, schema_idx
-
-        if isinstance(operation, CMDInstanceUpdateOperation):
-            if isinstance(operation.instance_update, CMDJsonInstanceUpdateAction):
-                for parent, schema, schema_idx in cls._iter_schema_in_json(
-                        operation.instance_update.json, schema_filter=schema_filter):
-                    if schema:
-                        schema_idx = [_SchemaIdxEnum.Instance, _SchemaIdxEnum.Update, *schema_idx]
-                    yield parent, schema, schema_idx
+        for match in cls._iter_schema_in_operation(operation, schema_filter=schema_filter):
+            yield match
 
-        if isinstance(operation, CMDInstanceCreateOperation):
-            if isinstance(operation.instance_create, CMDJsonInstanceCreateAction):
-                for parent, schema, schema_idx in cls._iter_schema_in_json(
-                        operation.instance_create.json, schema_filter=schema_filter):
-                    if schema:
-                        schema_idx = [_SchemaIdxEnum.Instance, _SchemaIdxEnum.Create, *schema_idx]
-                    yield parent, schema, schema_idx
+    @staticmethod
+    def get_schema_arg_var(parent, schema, schema_idx):
+        """Return the var of the argument used by schema, or None if the schema is not used by any argument."""
+        if isinstance(schema, CMDSchema):
+            return schema.arg
+        elif isinstance(schema, CMDSchemaBase):
+            if schema_idx[-1] == '[]' and isinstance(parent, CMDArraySchema) and parent.arg is not None:
+                return parent.arg + '[]'
+            elif schema_idx[-1] == '{}' and isinstance(parent, CMDObjectSchema) and parent.arg is not None:
+                return parent.arg + '{}'
+        return None
 
     @classmethod
     def iter_schema_cls_reference(cls, command, cls_name):
-        for match in cls.iter_schema_cls_reference_in_operations(command.operations, cls_name):
+        assert isinstance(cls_name, str) and not cls_name.startswith('@')
+        for match in CfgCommandIndex.get(command).iter_schema_cls_reference(cls_name):
             yield match
 
     @classmethod
@@ -830,35 +870,8 @@ class CfgReader:
             return None, False
 
         for op in operations:
-            if isinstance(op, CMDHttpOperation):
-                if op.http.request:
-                    for parent, schema, schema_idx in cls._iter_schema_in_request(op.http.request, schema_filter=schema_filter):
-                        if schema:
-                            schema_idx = [_SchemaIdxEnum.Http, _SchemaIdxEnum.Request, *schema_idx]
-                        yield parent, schema, schema_idx
-                if op.http.responses:
-                    for response in op.http.responses:
-                        if response.is_error:
-                            continue
-                        schema_idx_prefix = [_SchemaIdxEnum.Http, '_'.join([_SchemaIdxEnum.Response, *[str(code) for code in response.status_codes]])]
-                        for parent, schema, schema_idx in cls._iter_schema_in_response(response, schema_filter=schema_filter):
-                            if schema:
-                                schema_idx = [*schema_idx_prefix, *schema_idx]
-                            yield parent, schema, schema_idx
-
-            if isinstance(op, CMDInstanceUpdateOperation):
-                if isinstance(op.instance_update, CMDJsonInstanceUpdateAction):
-                    for parent, schema, schema_idx in cls._iter_schema_in_json(op.instance_update.json, schema_filter=schema_filter):
-                        if schema:
-                            schema_idx = [_SchemaIdxEnum.Instance, _SchemaIdxEnum.Update, *schema_idx]
-                        yield parent, schema, schema_idx
-
-            if isinstance(op, CMDInstanceCreateOperation):
-                if isinstance(op.instance_create, CMDJsonInstanceCreateAction):
-                    for parent, schema, schema_idx in cls._iter_schema_in_json(op.instance_create.json, schema_filter=schema_filter):
-                        if schema:
-                            schema_idx = [_SchemaIdxEnum.Instance, _SchemaIdxEnum.Create, *schema_idx]
-                        yield parent, schema, schema_idx
+            for match in cls._iter_schema_in_operation(op, schema_filter=schema_filter, with_response=True):
+                yield match
 
     @classmethod
     def iter_schema_cls_reference_in_schema(cls, schema, cls_name):
@@ -875,7 +888,42 @@ class CfgReader:
         for match in cls._iter_sub_schema(schema, schema_filter):
             yield match
 
-    # TODO: build schema_idx in command link call
+    @classmethod
+    def _iter_schema_in_operation(cls, operation, schema_filter, with_response=False):
+        if isinstance(operation, CMDHttpOperation):
+            if operation.http.request:
+                for parent, schema, schema_idx in cls._iter_schema_in_request(
+                        operation.http.request, schema_filter=schema_filter):
+                    if schema:
+                        schema_idx = [_SchemaIdxEnum.Http, _SchemaIdxEnum.Request, *schema_idx]
+                    yield parent, schema, schema_idx
+            if with_response and operation.http.responses:
+                for response in operation.http.responses:
+                    if response.is_error:
+                        continue
+                    schema_idx_prefix = [_SchemaIdxEnum.Http, '_'.join([_SchemaIdxEnum.Response, *[str(code) for code in response.status_codes]])]
+                    for parent, schema, schema_idx in cls._iter_schema_in_response(
+                            response, schema_filter=schema_filter):
+                        if schema:
+                            schema_idx = [*schema_idx_prefix, *schema_idx]
+                        yield parent, schema, schema_idx
+
+        if isinstance(operation, CMDInstanceUpdateOperation):
+            if isinstance(operation.instance_update, CMDJsonInstanceUpdateAction):
+                for parent, schema, schema_idx in cls._iter_schema_in_json(
+                        operation.instance_update.json, schema_filter=schema_filter):
+                    if schema:
+                        schema_idx = [_SchemaIdxEnum.Instance, _SchemaIdxEnum.Update, *schema_idx]
+                    yield parent, schema, schema_idx
+
+        if isinstance(operation, CMDInstanceCreateOperation):
+            if isinstance(operation.instance_create, CMDJsonInstanceCreateAction):
+                for parent, schema, schema_idx in cls._iter_schema_in_json(
+                        operation.instance_create.json, schema_filter=schema_filter):
+                    if schema:
+                        schema_idx = [_SchemaIdxEnum.Instance, _SchemaIdxEnum.Create, *schema_idx]
+                    yield parent, schema, schema_idx
+
     @classmethod
     def _iter_schema_in_request(cls, request, schema_filter):
         if request.path and request.path.params:
@@ -1026,3 +1074,19 @@ class CfgReader:
             return subresource_idx
         assert isinstance(subresource_idx, list)
         return '.'.join(subresource_idx).replace('.{}', '{}').replace('.[]', '[]')
+
+
+class ReadOnlyCfgReader(CfgReader):
+    """CfgReader of CMDReadOnlyConfiguration, only the commands found are converted to models."""
+
+    def __init__(self, cfg):
+        assert isinstance(cfg, CMDReadOnlyConfiguration)
+        self.cfg = cfg
+
+    def find_command(self, *cmd_names):
+        if len(cmd_names) < 2:
+            return None
+        command_group, tail_names, _, _ = self.find_command_group(*cmd_names[:-1])
+        if command_group is None or tail_names:
+            return None
+        return command_group.find_command(cmd_names[-1])
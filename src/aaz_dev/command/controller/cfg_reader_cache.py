@@ -0,0 +1,80 @@
+import json
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from command.model.configuration import CMDReadOnlyConfiguration
+from utils.config import Config
+from utils.fingerprint import FingerprintCache, file_fingerprint
+from .cfg_reader import ReadOnlyCfgReader
+
+logger = logging.getLogger('backend')
+
+
+def _read_cfg_data(json_path):
+    try:
+        with open(json_path, 'r', encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as err:
+        # the error will be raised again when the file is loaded
+        logger.debug(f"PrefetchCfgFailed: {json_path}: {err}")
+        return None
+
+
+class CfgReaderCache(FingerprintCache):
+    """LRU cache of the read only cfg readers of resource cfg files shared across specs managers.
+
+    An entry is invalidated when its json file is modified, and the least recently used entries are evicted when
+    there are more than max_entries. The commands of cached readers are shared, they should not be modified.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        max_entries = Config.CFG_READER_CACHE_SIZE
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.max_entries != max_entries:
+                cls._shared = cls(max_entries)
+            return cls._shared
+
+    def load(self, json_path):
+        return super().load(json_path, self._read_cfg_reader)
+
+    @staticmethod
+    def _read_cfg_reader(json_path):
+        with open(json_path, 'r', encoding="utf-8") as f:
+            data = json.load(f)
+        return ReadOnlyCfgReader(CMDReadOnlyConfiguration(data))
+
+    def prefetch(self, json_paths, jobs):
+        """Parse the json files which are not in cache by a process pool, and put their readers in cache.
+
+        json.load holds the GIL, so the files are parsed in worker processes and only the parsed data is sent back.
+        The files failed to parse are skipped, the error is raised when they're loaded.
+        """
+        tasks = []
+        cached = 0
+        for json_path in dict.fromkeys(json_paths):
+            fingerprint = file_fingerprint(json_path)
+            if fingerprint is None:
+                continue
+            if self.is_cached(json_path, fingerprint):
+                cached += 1
+                continue
+            tasks.append((json_path, fingerprint))
+        # the readers prefetched more than the cache size would evict each other before they're used
+        tasks = tasks[:max(self.max_entries - cached, 0)]
+        if jobs <= 1 or len(tasks) <= 1:
+            return
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+            results = executor.map(_read_cfg_data, [json_path for json_path, _ in tasks], chunksize=4)
+            for (json_path, fingerprint), data in zip(tasks, results):
+                if data is None or self.is_cached(json_path, fingerprint):
+                    # failed to parse or loaded by the others in the meantime
+                    continue
+                self.add(json_path, fingerprint, ReadOnlyCfgReader(CMDReadOnlyConfiguration(data)))
+                with self._lock:
+                    self.stats['prefetches'] += 1
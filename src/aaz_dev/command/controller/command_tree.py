@@ -59,22 +59,23 @@ def build_simple_command_tree(aaz_path):
 
 
 class CMDSpecsPartialCommandGroup:
-    def __init__(self, names, short_help, uri, aaz_path):
+    def __init__(self, names, short_help, uri, aaz_path, cache=None):
         self.names = names
         self.short_help = short_help
         self.uri = uri
         self.aaz_path = aaz_path
+        self.cache = cache
 
     @classmethod
-    def parse_command_group_info(cls, info, cg_names, aaz_path):
+    def parse_command_group_info(cls, info, cg_names, aaz_path, cache=None):
         lines = info.splitlines(keepends=False)
 
         cg = CMDSpecsCommandGroup()
         _, _, remaining_lines = cls._parse_title(lines)
         cg.names = list(cg_names) or ["aaz"]
         cg.help, remaining_lines = cls._parse_help(remaining_lines)
-        cg.command_groups, remaining_lines = cls._parse_groups(remaining_lines, cg_names, aaz_path)
-        cg.commands, _ = cls._parse_commands(remaining_lines, cg_names, aaz_path)
+        cg.command_groups, remaining_lines = cls._parse_groups(remaining_lines, cg_names, aaz_path, cache)
+        cg.commands, _ = cls._parse_commands(remaining_lines, cg_names, aaz_path, cache)
 
         return cg
 
@@ -100,31 +101,31 @@ class CMDSpecsPartialCommandGroup:
         return CMDHelp(raw_data={'short': short_help, 'lines': long_help or None}), remaining_lines
 
     @classmethod
-    def _parse_groups(cls, lines: list[str], cg_names, aaz_path):
+    def _parse_groups(cls, lines: list[str], cg_names, aaz_path, cache=None):
         if lines and lines[0] in ['## Groups', '## Subgroups']:
             groups = []
             remaining_lines = lines[2:]
             while remaining_lines and not remaining_lines[0].startswith('## '):
                 group, remaining_lines = cls._parse_item(
-                    remaining_lines, CMDSpecsPartialCommandGroup, cg_names, aaz_path)
+                    remaining_lines, CMDSpecsPartialCommandGroup, cg_names, aaz_path, cache)
                 groups.append((group.names[-1], group))
             return CMDSpecsCommandGroupDict(groups), remaining_lines
         return CMDSpecsCommandGroupDict([]), lines
 
     @classmethod
-    def _parse_commands(cls, lines: list[str], cg_names, aaz_path):
+    def _parse_commands(cls, lines: list[str], cg_names, aaz_path, cache=None):
         if lines and lines[0] in ['## Commands']:
             commands = []
             remaining_lines = lines[2:]
             while remaining_lines and not remaining_lines[0].startswith('## '):
                 command, remaining_lines = cls._parse_item(
-                    remaining_lines, CMDSpecsPartialCommand, cg_names, aaz_path)
+                    remaining_lines, CMDSpecsPartialCommand, cg_names, aaz_path, cache)
                 commands.append((command.names[-1], command))
             return CMDSpecsCommandDict(commands), remaining_lines
         return CMDSpecsCommandDict([]), lines
 
     @classmethod
-    def _parse_item(cls, lines, item_cls, cg_names, aaz_path):
+    def _parse_item(cls, lines, item_cls, cg_names, aaz_path, cache=None):
         assert len(lines) > 1
         name_line = lines[0]
         assert name_line.startswith('- [')
@@ -133,7 +134,8 @@ class CMDSpecsPartialCommandGroup:
         short_help, remaining_lines = cls._read_until(lines[1:], lambda line: not line)
         remaining_lines = cls._del_empty(remaining_lines)
         short_help = '\n'.join(short_help)
-        return item_cls(names=[*cg_names, name], short_help=short_help, uri=uri, aaz_path=aaz_path), remaining_lines
+        return item_cls(
+            names=[*cg_names, name], short_help=short_help, uri=uri, aaz_path=aaz_path, cache=cache), remaining_lines
 
     @classmethod
     def _read_until(cls, lines, predicate):
@@ -151,14 +153,23 @@ class CMDSpecsPartialCommandGroup:
                 return lines[idx:]
         return lines
 
+    @property
+    def file_path(self):
+        return self.aaz_path + self.uri
+
     def load(self):
-        with open(self.aaz_path + self.uri, "r", encoding="utf-8") as f:
+        if self.cache is not None:
+            return self.cache.load(self.file_path, self._load)
+        return self._load(self.file_path)
+
+    def _load(self, file_path):
+        with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
             if self.names and self.names[0] == "aaz":
                 names = self.names[1:]
             else:
                 names = self.names
-            cg = self.parse_command_group_info(content, names, self.aaz_path)
+            cg = self.parse_command_group_info(content, names, self.aaz_path, self.cache)
             return cg
 
 
@@ -169,8 +180,10 @@ class CMDSpecsCommandDict(dict):
     def __getitem__(self, __key):
         command = super().__getitem__(__key)
         if isinstance(command, CMDSpecsPartialCommand):
+            shared = command.cache is not None
             command = command.load()
-            if command:
+            if command and not shared:
+                # the nodes loaded from the shared cache are not kept, so the modified files are always reloaded
                 super().__setitem__(__key, command)
         return command
 
@@ -199,8 +212,10 @@ class CMDSpecsCommandGroupDict(dict):
     def __getitem__(self, __key):
         cg = super().__getitem__(__key)
         if isinstance(cg, CMDSpecsPartialCommandGroup):
+            shared = cg.cache is not None
             cg = cg.load()
-            if cg:
+            if cg and not shared:
+                # the nodes loaded from the shared cache are not kept, so the modified files are always reloaded
                 super().__setitem__(__key, cg)
         return cg
 
@@ -253,20 +268,162 @@ class CMDSpecsPartialCommand:
     _EXAMPLE_LINE_RE = r"        (?P<example_cmd>.*)\n"
     EXAMPLE_LINE_RE = re.compile(_EXAMPLE_LINE_RE, re.MULTILINE)
 
-    def __init__(self, names, short_help, uri, aaz_path):
+    # the patterns of single lines used by the line parser
+    COMMAND_TITLE_LINE_RE = re.compile(r"# \[Command\] _(?P<group_name>[A-Za-z0-9- ]+)_")
+    VERSION_TITLE_LINE_RE = re.compile(r"### \[(?P<version_name>[a-zA-Z0-9-]+)\]\(.*\) \*\*(?P<stage>.*)\*\*")
+    COMMENT_LINE_RE = re.compile(r"<!-- .* -->")
+    RESOURCE_LINE_RE = re.compile(
+        r"<!-- (?P<plane>\S+) (?P<id>\S+) (?P<version>\S+) ((?P<subresource>\S+) )?-->")
+    EXAMPLE_CMD_PREFIX = "        "
+
+    def __init__(self, names, short_help, uri, aaz_path, cache=None):
         self.names = names
         self.short_help = short_help
         self.uri = uri
         self.aaz_path = aaz_path
+        self.cache = cache
+
+    @property
+    def file_path(self):
+        return self.aaz_path + self.uri
 
     def load(self):
-        with open(self.aaz_path + self.uri, "r", encoding="utf-8") as f:
+        if self.cache is not None:
+            return self.cache.load(self.file_path, self._load)
+        return self._load(self.file_path)
+
+    def _load(self, file_path):
+        with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
             command = self.parse_command_info(content, self.names)
             return command
 
     @classmethod
     def parse_command_info(cls, info, cmd_names):
+        """Parse the command info markdown in a single pass over its lines.
+
+        It's equivalent to parse_command_info_by_regex for the markdown rendered by command template, without the
+        backtracking of the nested patterns on the commands with many versions and examples. For the other markdowns
+        it's a little different: the headings are never taken as the long help, and the extra blank lines before the
+        versions title, the invalid lines and the versions without resources after the first version are skipped
+        instead of failing the whole command.
+        """
+        # the last piece is empty or a line without line break, which is not matched by the regex parser either
+        lines = info.split('\n')[:-1]
+        if len(lines) < 3 or not cls.COMMAND_TITLE_LINE_RE.fullmatch(lines[0]) or lines[1]:
+            return cls._invalid_command_info(info)
+
+        idx = 2
+        while idx < len(lines) and lines[idx]:
+            idx += 1
+        if idx == 2:
+            return cls._invalid_command_info(info)
+        short_help = '\n'.join(lines[2:idx]).strip()
+
+        try:
+            versions_idx = lines.index("## Versions", idx)
+        except ValueError:
+            return cls._invalid_command_info(info)
+        if lines[versions_idx - 1]:
+            return cls._invalid_command_info(info)
+        long_help_lines = lines[idx:versions_idx]
+        if any(line.startswith('#') for line in long_help_lines):
+            return cls._invalid_command_info(info)
+        lines_help = '\n'.join(long_help_lines).strip()
+
+        if versions_idx + 1 >= len(lines) or lines[versions_idx + 1]:
+            return cls._invalid_command_info(info)
+        versions = []
+        idx = versions_idx + 2
+        while idx < len(lines):
+            version_match = cls.VERSION_TITLE_LINE_RE.fullmatch(lines[idx])
+            if not version_match:
+                if not versions:
+                    # the first version should follow the versions title
+                    return cls._invalid_command_info(info)
+                idx += 1
+                continue
+            version, idx = cls._parse_version_lines(lines, idx + 1, version_match)
+            if version is not None:
+                versions.append(version)
+            elif not versions:
+                return cls._invalid_command_info(info)
+        if not versions:
+            return cls._invalid_command_info(info)
+
+        help = {"short": short_help}
+        if lines_help:
+            help["lines"] = lines_help.split("\\\n")
+        # the command is converted from the raw data in one pass, the nested models are not converted twice
+        return CMDSpecsCommand(raw_data={
+            "names": cmd_names,
+            "help": help,
+            "versions": sorted(versions, key=lambda v: v["name"]),
+        })
+
+    @classmethod
+    def _parse_version_lines(cls, lines, idx, version_match):
+        """Parse the resources and examples of a version from the line after version title.
+
+        Return the raw data of version and the index of the next line, the version is None when the resources are
+        missed.
+        """
+        end = len(lines)
+        if idx >= end or lines[idx]:
+            return None, idx
+        idx += 1
+        resources = []
+        start = idx
+        while idx < end and cls.COMMENT_LINE_RE.fullmatch(lines[idx]):
+            resource_match = cls.RESOURCE_LINE_RE.fullmatch(lines[idx])
+            if resource_match:
+                resource = {
+                    "plane": resource_match.group("plane"),
+                    "id": resource_match.group("id"),
+                    "version": resource_match.group("version"),
+                }
+                if resource_match.group("subresource"):
+                    resource["subresource"] = resource_match.group("subresource")
+                resources.append(resource)
+            idx += 1
+        if idx == start:
+            return None, idx
+
+        examples = []
+        if idx + 1 < end and not lines[idx] and lines[idx + 1] == "#### examples":
+            idx += 2
+            while idx + 2 < end and not lines[idx] and lines[idx + 1].startswith("- ") and \
+                    lines[idx + 2] == "    ```bash":
+                cmd_idx = idx + 3
+                example_cmd = []
+                while cmd_idx < end and lines[cmd_idx].startswith(cls.EXAMPLE_CMD_PREFIX):
+                    example_cmd.append(lines[cmd_idx][len(cls.EXAMPLE_CMD_PREFIX):])
+                    cmd_idx += 1
+                if not example_cmd or cmd_idx >= end or lines[cmd_idx] != "    ```":
+                    break
+                examples.append({
+                    "name": lines[idx + 1][2:],
+                    "commands": example_cmd
+                })
+                idx = cmd_idx + 1
+
+        version = {
+            "name": version_match.group("version_name"),
+            "resources": resources,
+            "examples": examples
+        }
+        if version_match.group("stage"):
+            version["stage"] = version_match.group("stage")
+        return version, idx
+
+    @staticmethod
+    def _invalid_command_info(info):
+        logger.warning(f"Invalid command info markdown: \n{info}")
+        return None
+
+    @classmethod
+    def parse_command_info_by_regex(cls, info, cmd_names):
+        """Parse the command info markdown by the patterns of the whole file, it's kept to verify the line parser."""
         command_match = re.match(cls.COMMAND_INFO_RE, info)
         if not command_match:
             logger.warning(f"Invalid command info markdown: \n{info}")
@@ -316,19 +473,37 @@ class CMDSpecsPartialCommand:
 
 
 class CMDSpecsPartialCommandTree:
-    def __init__(self, aaz_path, root=None):
+    """The command tree loaded from the readme files in aaz Commands folder on demand.
+
+    When the cache is provided, the nodes are loaded from the shared cache on every access and the tree is read only.
+    """
+
+    def __init__(self, aaz_path, root=None, cache=None):
         self.aaz_path = aaz_path
+        self.cache = cache
         self._root = root or CMDSpecsPartialCommandGroup(names=["aaz"], short_help='', uri="/Commands/readme.md",
-                                                         aaz_path=aaz_path).load()
+                                                         aaz_path=aaz_path, cache=cache)
+        if cache is None:
+            self._root = self.root
         self._modified_command_groups = set()
         self._modified_commands = set()
 
     @property
     def root(self):
         if isinstance(self._root, CMDSpecsPartialCommandGroup):
+            if self.cache is not None:
+                return self._root.load()
             self._root = self._root.load()
         return self._root
 
+    @property
+    def readonly(self):
+        return self.cache is not None
+
+    def _check_writable(self):
+        if self.readonly:
+            raise ValueError("The command tree loaded from shared cache is read only")
+
     @property
     def simple_tree(self):
         """
@@ -384,6 +559,7 @@ class CMDSpecsPartialCommandTree:
                 yield leaf
 
     def create_command_group(self, *cg_names):
+        self._check_writable()
         if len(cg_names) < 1:
             raise exceptions.InvalidAPIUsage(f"Invalid Command Group name: '{' '.join(cg_names)}'")
         node = self.root
@@ -418,6 +594,7 @@ class CMDSpecsPartialCommandTree:
         return command_group
 
     def delete_command_group(self, *cg_names):
+        self._check_writable()
         for _ in self.iter_commands(*cg_names):
             raise exceptions.ResourceConflict("Cannot delete command group with commands")
         parent = self.find_command_group(*cg_names[:-1])
@@ -456,6 +633,7 @@ class CMDSpecsPartialCommandTree:
         return command
 
     def delete_command(self, *cmd_names):
+        self._check_writable()
         if len(cmd_names) < 2:
             raise exceptions.InvalidAPIUsage(f"Invalid Command name: '{' '.join(cmd_names)}'")
         parent = self.find_command_group(*cmd_names[:-1])
@@ -477,6 +655,7 @@ class CMDSpecsPartialCommandTree:
         return True
 
     def delete_command_version(self, *cmd_names, version):
+        self._check_writable()
         if len(cmd_names) < 2:
             raise exceptions.InvalidAPIUsage(f"Invalid Command name: '{' '.join(cmd_names)}'")
         command = self.find_command(*cmd_names)
@@ -528,6 +707,7 @@ class CMDSpecsPartialCommandTree:
         self._modified_commands.add(cmd_names)
 
     def update_command_by_ws(self, ws_leaf):
+        self._check_writable()
         command = self.find_command(*ws_leaf.names)
         if not command:
             # make sure the command exist, if command not exist, then run update_resource_cfg first
@@ -0,0 +1,23 @@
+import threading
+
+from utils.config import Config
+from utils.fingerprint import FingerprintCache
+
+
+class CMDSpecsCommandTreeCache(FingerprintCache):
+    """LRU cache of the command group and command nodes parsed from the readme files in aaz Commands folder.
+
+    It's shared by the read only command trees across requests. Every node is keyed by the path of its readme file and
+    invalidated individually when the file is modified. The cached nodes are shared, they should not be modified.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        max_entries = Config.SPECS_COMMAND_TREE_CACHE_SIZE
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.max_entries != max_entries:
+                cls._shared = cls(max_entries)
+            return cls._shared
@@ -2,7 +2,6 @@ import json
 import logging
 import os
 import re
-import shutil
 
 from command.model.configuration import CMDConfiguration, CMDHelp, CMDCommandExample, XMLSerializer, CMDClientConfig
 from utils.base64 import b64encode_str
@@ -11,10 +10,13 @@ from utils.plane import PlaneEnum
 from command.model.specs import CMDSpecsCommandTree, CMDSpecsCommandGroup, CMDSpecsCommand, CMDSpecsCommandVersion, CMDSpecsResource
 from command.templates import get_templates
 from utils import exceptions
+from utils.file_writer import AtomicFileWriter
 from .cfg_reader import CfgReader
+from .cfg_reader_cache import CfgReaderCache
 from .client_cfg_reader import ClientCfgReader
 from .cfg_validator import CfgValidator
 from .command_tree import CMDSpecsPartialCommandTree
+from .command_tree_cache import CMDSpecsCommandTreeCache
 
 logger = logging.getLogger('backend')
 
@@ -24,7 +26,12 @@ class AAZSpecsManager:
 
     REFERENCE_LINE = re.compile(r"^Reference\s*\[(.*) (.*)]\((.*)\)\s*$")
 
-    def __init__(self):
+    def __init__(self, readonly=False):
+        """
+        :param readonly: load the command tree from the cache shared across managers. The tree methods which modify
+            nodes raise ValueError, and the nodes it returns are shared by all the read only managers, so the callers
+            should copy the values they want to change instead of modifying the nodes.
+        """
         if not Config.AAZ_PATH or not os.path.exists(Config.AAZ_PATH) or not os.path.isdir(Config.AAZ_PATH):
             raise ValueError(f"aaz repo path is invalid: '{Config.AAZ_PATH}'")
 
@@ -35,7 +42,9 @@ class AAZSpecsManager:
         self._modified_resource_cfgs = {}
         self._modified_resource_client_cfgs = {}
 
-        self._tree = CMDSpecsPartialCommandTree(self.folder)
+        # the read only tree loads nodes from the cache shared across managers
+        self._tree = CMDSpecsPartialCommandTree(
+            self.folder, cache=CMDSpecsCommandTreeCache.get_shared() if readonly else None)
 
     @property
     def tree(self):
@@ -124,13 +133,48 @@ class AAZSpecsManager:
     def iter_commands(self, *root_node_names):
         yield from self.tree.iter_commands(*root_node_names)
 
-    def load_resource_cfg_reader(self, plane, resource_id, version):
+    def load_resource_cfg_reader(self, plane, resource_id, version, readonly=False):
+        """Load the cfg reader of resource.
+
+        :param readonly: return the ReadOnlyCfgReader, which only converts the commands it finds. It's shared in
+            cache until the cfg file is modified, so the commands should not be modified.
+        """
         key = (plane, resource_id, version)
         if key in self._modified_resource_cfgs:
             # cfg already modified
             cfg = self._modified_resource_cfgs[key]
             return CfgReader(cfg) if cfg else None
 
+        json_path = self._get_resource_cfg_json_path(plane, resource_id, version)
+        if not json_path:
+            return None
+
+        if readonly:
+            return CfgReaderCache.get_shared().load(json_path)
+
+        with open(json_path, 'r', encoding="utf-8") as f:
+            #print(json_path)
+            data = json.load(f)
+        cfg = CMDConfiguration(data)
+
+        return CfgReader(cfg)
+
+    def prefetch_resource_cfg_readers(self, keys, jobs):
+        """Load the read only cfg readers of (plane, resource_id, version) keys into cache concurrently."""
+        json_paths = []
+        for plane, resource_id, version in keys:
+            if (plane, resource_id, version) in self._modified_resource_cfgs:
+                continue
+            try:
+                json_path = self._get_resource_cfg_json_path(plane, resource_id, version)
+            except ValueError:
+                # the error will be raised again when the cfg reader is loaded
+                continue
+            if json_path:
+                json_paths.append(json_path)
+        CfgReaderCache.get_shared().prefetch(json_paths, jobs)
+
+    def _get_resource_cfg_json_path(self, plane, resource_id, version):
         json_path, xml_path = self.get_resource_cfg_file_paths(plane, resource_id, version)
         if not os.path.exists(json_path) and not os.path.exists(xml_path):
             ref_path = self.get_resource_cfg_ref_file_path(plane, resource_id, version)
@@ -165,15 +209,9 @@ class AAZSpecsManager:
 
         if not os.path.isfile(json_path):
             raise ValueError(f"Invalid file path: {json_path}")
+        return json_path
 
-        with open(json_path, 'r', encoding="utf-8") as f:
-            #print(json_path)
-            data = json.load(f)
-        cfg = CMDConfiguration(data)
-
-        return CfgReader(cfg)
-
-    def load_resource_cfg_reader_by_command_with_version(self, cmd, version):
+    def load_resource_cfg_reader_by_command_with_version(self, cmd, version, readonly=False):
         if not isinstance(version, CMDSpecsCommandVersion):
             assert isinstance(version, str)
             version_name = version
@@ -185,7 +223,7 @@ class AAZSpecsManager:
         if not version:
             return None
         resource = version.resources[0]
-        return self.load_resource_cfg_reader(resource.plane, resource.id, resource.version)
+        return self.load_resource_cfg_reader(resource.plane, resource.id, resource.version, readonly=readonly)
 
     # command tree
     def create_command_group(self, *cg_names):
@@ -361,20 +399,21 @@ class AAZSpecsManager:
             update_files[json_file_path] = self.render_resource_cfg_to_json(cfg)
             update_files[xml_file_path] = self.render_resource_cfg_to_xml(cfg)
 
+        writer = AtomicFileWriter()
         for remove_file in remove_files:
-            if os.path.exists(remove_file):
-                os.remove(remove_file)
+            writer.remove(remove_file)
 
         for remove_folder in remove_folders:
-            shutil.rmtree(remove_folder, ignore_errors=True)
+            writer.remove_folder(remove_folder)
 
         for file_path, data in update_files.items():
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, 'w', encoding="utf-8") as f:
-                f.write(data)
+            # the unchanged files are skipped
+            writer.write(file_path, data)
+        writer.log_stats("AAZSpecsManager")
 
         self._modified_resource_cfgs = {}
         self._modified_resource_client_cfgs = {}
+        return writer.get_stats()
 
     @staticmethod
     def render_command_readme(command):
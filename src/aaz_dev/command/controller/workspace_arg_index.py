@@ -0,0 +1,78 @@
+import logging
+import threading
+
+from command.model.configuration import CMDArg
+from utils.config import Config
+from utils.fingerprint import FingerprintCache
+from .workspace_cfg_editor import WorkspaceCfgEditor
+
+logger = logging.getLogger('backend')
+
+
+class WorkspaceResourceArgs:
+    """The arguments of the commands in a resource cfg file of workspace, indexed for searching similar arguments.
+
+    It holds a private cfg editor loaded from the file, which is only used to read the candidate arguments.
+    """
+
+    def __init__(self, cfg_editor):
+        self.cfg_editor = cfg_editor
+        # arg var -> {cmd_names: similar args signature}
+        self.args = {}
+        # cls name prefix -> set of cmd_names which defines the cls arguments with this prefix
+        self.cls_name_prefixes = {}
+        for cmd_names, command in cfg_editor.iter_commands():
+            cmd_names = tuple(cmd_names)
+            for _, arg, _, arg_var in cfg_editor.iter_args_in_command(command):
+                if not isinstance(arg, CMDArg):
+                    # the item of array or dict argument
+                    continue
+                self.args.setdefault(arg_var, {}).setdefault(cmd_names, cfg_editor.get_similar_args_signature(arg))
+                cls_name = getattr(arg, 'cls', None)
+                if cls_name and '_' in cls_name:
+                    self.cls_name_prefixes.setdefault(cls_name.split('_')[0], set()).add(cmd_names)
+
+    def has_similar_arg_candidate(self, cmd_names, arg_var, signature):
+        return self.args.get(arg_var, {}).get(tuple(cmd_names), None) == signature
+
+    def has_cls_arg_candidate(self, cmd_names, cls_name_prefix):
+        return tuple(cmd_names) in self.cls_name_prefixes.get(cls_name_prefix, ())
+
+
+class WorkspaceArgIndex(FingerprintCache):
+    """LRU index of the arguments in workspace resource cfg files shared across workspace managers.
+
+    An entry is keyed by the cfg file path and version, and invalidated when the file or the cfg file it refers is
+    modified, so only the resources saved after the last search are loaded again.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        max_entries = Config.WORKSPACE_ARG_INDEX_SIZE
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.max_entries != max_entries:
+                cls._shared = cls(max_entries)
+            return cls._shared
+
+    def load(self, ws_folder, resource_id, version):
+        """Return the WorkspaceResourceArgs of the resource, or None if its cfg file failed to load."""
+        path = WorkspaceCfgEditor.get_cfg_path(ws_folder, resource_id)
+
+        def _load(_):
+            return WorkspaceResourceArgs(WorkspaceCfgEditor.load_resource(ws_folder, resource_id, version))
+
+        def _dependencies(resource_args):
+            main_resource_id = resource_args.cfg_editor.resources[0].id
+            if main_resource_id != resource_id:
+                # the cfg file of resource refers to the cfg file of main resource
+                return [WorkspaceCfgEditor.get_cfg_path(ws_folder, main_resource_id)]
+            return []
+
+        try:
+            return super().load(path, _load, key=(path, version), dependencies=_dependencies)
+        except Exception as e:
+            logger.error(f"load workspace resource cfg failed: {e}: {resource_id} {version}")
+            return None
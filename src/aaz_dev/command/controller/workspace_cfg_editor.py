@@ -1,8 +1,11 @@
 import copy
+import hashlib
 import json
 import logging
 import os
+import threading
 
+from command.model import configuration
 from command.model.configuration import *
 from utils import exceptions
 from utils.base64 import b64encode_str
@@ -13,7 +16,36 @@ from .workspace_helper import ArgumentUpdateMixin
 logger = logging.getLogger('backend')
 
 
+_reformat_digest = None
+_reformat_digest_lock = threading.Lock()
+
+
+def get_reformat_digest():
+    """The digest of the tool version and the configuration models which implement reformat."""
+    global _reformat_digest
+    with _reformat_digest_lock:
+        if _reformat_digest is None:
+            try:
+                from importlib.metadata import version
+                tool_version = version('aaz-dev')
+            except Exception:
+                tool_version = None
+            folder = os.path.dirname(os.path.abspath(configuration.__file__))
+            digest = hashlib.sha256()
+            digest.update(f"version:{tool_version}\n".encode('utf-8'))
+            for name in sorted(os.listdir(folder)):
+                if name.endswith('.py'):
+                    digest.update(f"file:{name}\n".encode('utf-8'))
+                    with open(os.path.join(folder, name), 'rb') as f:
+                        digest.update(f.read())
+            _reformat_digest = digest.hexdigest()
+        return _reformat_digest
+
+
 class WorkspaceCfgEditor(CfgReader, ArgumentUpdateMixin):
+    # the file saved next to cfg file to mark it's reformatted, the cfg file with a valid mark is not reformatted on
+    # load. It's kept out of cfg file, so the workspaces are still loaded by the versions without it.
+    NORMALIZED_FILE_NAME = "normalized.json"
 
     @staticmethod
     def get_cfg_folder(ws_folder, resource_id):
@@ -32,22 +64,32 @@ class WorkspaceCfgEditor(CfgReader, ArgumentUpdateMixin):
     def get_cfg_path(cls, ws_folder, resource_id):
         return os.path.join(cls.get_cfg_folder(ws_folder, resource_id), f"cfg.json")
 
+    @classmethod
+    def get_normalized_path(cls, ws_folder, resource_id):
+        return os.path.join(cls.get_cfg_folder(ws_folder, resource_id), cls.NORMALIZED_FILE_NAME)
+
     @classmethod
     def load_resource(cls, ws_folder, resource_id, version):
         path = cls.get_cfg_path(ws_folder, resource_id)
         with open(path, 'r', encoding="utf-8") as f:
-            data = json.load(f)
+            content = f.read()
+        data = json.loads(content)
         if '$ref' in data:
-            ref_resource_id = data['$ref']
-            path = cls.get_cfg_path(ws_folder, ref_resource_id)
+            resource_id = data['$ref']
+            path = cls.get_cfg_path(ws_folder, resource_id)
             with open(path, 'r', encoding="utf-8") as f:
-                data = json.load(f)
+                content = f.read()
+            data = json.loads(content)
+        normalized = cls._read_normalized_mark(ws_folder, resource_id) == cls._build_normalized_mark(content)
         cfg = CMDConfiguration(data)
         for resource in cfg.resources:
             if resource.version != version:
                 raise ValueError(f"Resource version not match: {version} != {resource.version}")
         cfg_editor = cls(cfg)
-        cfg_editor.reformat()
+        if normalized:
+            cfg_editor.normalized = True
+        else:
+            cfg_editor.reformat()
         return cfg_editor
 
     @classmethod
@@ -64,6 +106,31 @@ class WorkspaceCfgEditor(CfgReader, ArgumentUpdateMixin):
     def __init__(self, cfg, deleted=False):
         super().__init__(cfg)
         self.deleted = deleted
+        # whether the whole cfg is reformatted after it's modified
+        self.normalized = False
+
+    @staticmethod
+    def _build_normalized_mark(data):
+        return {
+            "version": get_reformat_digest(),
+            "hash": hashlib.sha256(data.encode('utf-8')).hexdigest(),
+        }
+
+    @classmethod
+    def _read_normalized_mark(cls, ws_folder, resource_id):
+        try:
+            with open(cls.get_normalized_path(ws_folder, resource_id), 'r', encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get_normalized_file_data(self, cfg_data):
+        """Return the data of normalized file for the data of main cfg file, its mark is invalid if the cfg is not
+        normalized."""
+        mark = self._build_normalized_mark(cfg_data)
+        if not self.normalized:
+            mark["hash"] = None
+        return json.dumps(mark, ensure_ascii=False)
 
     def iter_cfg_files_data(self):
         if self.deleted:
@@ -314,7 +381,7 @@ class WorkspaceCfgEditor(CfgReader, ArgumentUpdateMixin):
             raise exceptions.ResourceNotFind(f"Cannot find definition for command '{' '.join(cmd_names)}'")
         if confirmation != command.confirmation:
             command.confirmation = confirmation
-        self.reformat()
+        self.reformat(command)
     
     def update_command_outputs(self, *cmd_names, outputs):
         if len(cmd_names) < 2:
@@ -332,19 +399,19 @@ class WorkspaceCfgEditor(CfgReader, ArgumentUpdateMixin):
                     output.validate()
             except Exception as err:
                 raise exceptions.InvalidAPIUsage(f"Invalid output data: {err}")
-        self.reformat()
+        self.reformat(command)
 
     def update_arg_by_var(self, *cmd_names, arg_var, **kwargs):
         arg, _ = self.find_arg_by_var(*cmd_names, arg_var=arg_var)
         if not arg:
             return None
         self._update_arg(arg, **kwargs)
-        self.reformat()
+        self.reformat(self.find_command(*cmd_names))
 
     def unwrap_cls_arg(self, *cmd_names, arg_var):
         command = self.find_command(*cmd_names)
         self._unwrap_cls_arg_in_command(command, arg_var)
-        self.reformat()
+        self.reformat(command)
 
     @classmethod
     def _unwrap_cls_arg_in_command(cls, command, arg_var):
@@ -493,7 +560,7 @@ class WorkspaceCfgEditor(CfgReader, ArgumentUpdateMixin):
 
         # regenerate args and its relationship with schema
         command.generate_args()
-        self.reformat()
+        self.reformat(command)
 
     def unflatten_arg(self, *cmd_names, arg_var, options, help, sub_args_options=None):
         command = self.find_command(*cmd_names)
@@ -529,10 +596,18 @@ class WorkspaceCfgEditor(CfgReader, ArgumentUpdateMixin):
 
         # regenerate args and its relation ship with schema
         command.generate_args()
-        self.reformat()
-
-    def reformat(self):
-        self.cfg.reformat()
+        self.reformat(command)
+
+    def reformat(self, *commands):
+        """Reformat the whole cfg, or only the modified commands when the other parts are normalized."""
+        normalized = self.normalized
+        self.normalized = False
+        if commands and normalized:
+            for command in commands:
+                command.reformat()
+        else:
+            self.cfg.reformat()
+        self.normalized = True
 
     @classmethod
     def _parse_command_http_op_url_args(cls, command):
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import os
@@ -16,7 +17,10 @@ from utils.config import Config
 from utils.plane import PlaneEnum
 from utils.base64 import b64encode_str
 from utils.case import to_camel_case
+from utils.file_writer import JournaledFileWriter, folder_lock
+from utils.fingerprint import file_fingerprint
 from .specs_manager import AAZSpecsManager
+from .workspace_arg_index import WorkspaceArgIndex
 from .workspace_cfg_editor import WorkspaceCfgEditor, build_endpoint_selector_for_client_config
 from .workspace_client_cfg_editor import WorkspaceClientCfgEditor
 
@@ -85,9 +89,18 @@ class WorkspaceManager:
         self.path = os.path.join(self.folder, 'ws.json')
 
         self.ws = None
+        # the fingerprint of ws.json when it's loaded or saved by this manager
+        self.ws_fingerprint = None
         self._cfg_editors = {}
         self._client_cfg_editor = None
         self._reusable_leaves = {}
+        # the states saved in files, they're used to check whether the manager is modified after loaded or saved
+        self._saved_ws_digest = None
+        self._saved_cfg_editors = {}
+        self._saved_client_cfg_editor = None
+        # the digests of the cfg editors used after the states are saved, id(cfg_editor) -> (cfg_editor, digest)
+        self._used_cfg_editor_digests = {}
+        self._used_client_cfg_digest = None
 
         self._aaz_specs = aaz_manager
         self._swagger_specs = swagger_manager
@@ -109,7 +122,7 @@ class WorkspaceManager:
     @property
     def swagger_specs(self):
         if not self._swagger_specs:
-            self._swagger_specs = SwaggerSpecsManager()
+            self._swagger_specs = SwaggerSpecsManager.get_shared()
         return self._swagger_specs
 
     @property
@@ -133,10 +146,15 @@ class WorkspaceManager:
 
     def load(self):
         assert not self.is_in_memory
+        if JournaledFileWriter.has_journal(self.folder):
+            # roll forward the save interrupted by crash
+            with folder_lock(self.folder):
+                JournaledFileWriter.recover(self.folder)
         # TODO: handle exception
         if not os.path.exists(self.path) or not os.path.isfile(self.path):
             raise exceptions.ResourceNotFind(
                 f"Workspace json file not exist: {self.path}")
+        self.ws_fingerprint = file_fingerprint(self.path)
         with open(self.path, 'r', encoding="utf-8") as f:
             data = json.load(f)
             self.ws = CMDEditorWorkspace(raw_data=data)
@@ -147,14 +165,98 @@ class WorkspaceManager:
 
         self._cfg_editors = {}
         self._client_cfg_editor = None
+        self._mark_saved()
+
+    @property
+    def is_dirty(self):
+        """Whether the manager is modified after it's loaded or saved.
+
+        Only the command tree and the cfg editors used after that are compared with the saved states.
+        """
+        if self._saved_ws_digest is None or self._saved_ws_digest != self._get_digest(self.ws.to_primitive()):
+            return True
+        if self._cfg_editors.keys() != self._saved_cfg_editors.keys() or any(
+                cfg_editor is not self._saved_cfg_editors[resource_id]
+                for resource_id, cfg_editor in self._cfg_editors.items()):
+            return True
+        for cfg_editor, digest in self._used_cfg_editor_digests.values():
+            if self._get_cfg_editor_digest(cfg_editor) != digest:
+                return True
+        if self._client_cfg_editor is not self._saved_client_cfg_editor:
+            return True
+        if self._used_client_cfg_digest is not None and \
+                self._used_client_cfg_digest != self._get_digest(self._client_cfg_editor.get_cfg_file_data()):
+            return True
+        return False
+
+    def get_cfg_fingerprints(self):
+        """Return the fingerprints of the cfg files of the loaded cfg editors and the client cfg editor."""
+        cfg_fingerprints = {
+            resource_id: file_fingerprint(WorkspaceCfgEditor.get_cfg_path(self.folder, resource_id))
+            for resource_id in self._cfg_editors
+        }
+        client_fingerprint = None
+        if self._client_cfg_editor:
+            client_fingerprint = file_fingerprint(WorkspaceClientCfgEditor.get_cfg_path(self.folder))
+        return cfg_fingerprints, client_fingerprint
+
+    def drop_modified_cfg_editors(self, cfg_fingerprints, client_fingerprint):
+        """Drop the loaded cfg editors whose files are modified after the fingerprints are taken."""
+        modified_editors = []
+        for resource_id, fingerprint in cfg_fingerprints.items():
+            path = WorkspaceCfgEditor.get_cfg_path(self.folder, resource_id)
+            if fingerprint is None or file_fingerprint(path) != fingerprint:
+                modified_editors.append(self._cfg_editors[resource_id])
+        if modified_editors:
+            self._cfg_editors = {
+                resource_id: cfg_editor for resource_id, cfg_editor in self._cfg_editors.items()
+                if cfg_editor not in modified_editors
+            }
+            self._saved_cfg_editors = dict(self._cfg_editors)
+        if self._client_cfg_editor and (
+                client_fingerprint is None or
+                file_fingerprint(WorkspaceClientCfgEditor.get_cfg_path(self.folder)) != client_fingerprint):
+            self._client_cfg_editor = None
+            self._saved_client_cfg_editor = None
+
+    def reset_request_states(self):
+        """Reset the states only used in a single request, before the manager is kept for the following requests."""
+        self._reusable_leaves = {}
+        self._aaz_specs = None
+        self._used_cfg_editor_digests = {}
+        self._used_client_cfg_digest = None
+
+    def _mark_saved(self, ws_data=None):
+        self._saved_ws_digest = self._get_digest(ws_data if ws_data is not None else self.ws.to_primitive())
+        self._saved_cfg_editors = dict(self._cfg_editors)
+        self._saved_client_cfg_editor = self._client_cfg_editor
+        self._used_cfg_editor_digests = {}
+        self._used_client_cfg_digest = None
+
+    @staticmethod
+    def _get_digest(data):
+        if not isinstance(data, str):
+            data = json.dumps(data, ensure_ascii=False)
+        return hashlib.sha1(data.encode('utf-8')).digest()
+
+    @classmethod
+    def _get_cfg_editor_digest(cls, cfg_editor):
+        return cls._get_digest([cfg_editor.deleted, cfg_editor.cfg.to_primitive()])
+
+    def _use_cfg_editor(self, cfg_editor):
+        if id(cfg_editor) not in self._used_cfg_editor_digests:
+            self._used_cfg_editor_digests[id(cfg_editor)] = (cfg_editor, self._get_cfg_editor_digest(cfg_editor))
+        return cfg_editor
 
     def rename(self, new_name):
         assert not self.is_in_memory
         new_folder = os.path.join(Config.AAZ_DEV_WORKSPACE_FOLDER, new_name)
-        if os.path.exists(new_folder):
-            raise ValueError(
-                f"Invalid new workspace folder: folder path exists: {new_folder}")
-        os.rename(self.folder, new_folder)
+        # wait for the save in progress, the interrupted save is moved with the journal and recovered in load
+        with folder_lock(self.folder):
+            if os.path.exists(new_folder):
+                raise ValueError(
+                    f"Invalid new workspace folder: folder path exists: {new_folder}")
+            os.rename(self.folder, new_folder)
         self.name = new_name
         self.folder = new_folder
         self.path = os.path.join(self.folder, 'ws.json')
@@ -168,7 +270,8 @@ class WorkspaceManager:
             if not os.path.isfile(self.path):
                 raise exceptions.ResourceConflict(
                     f"Workspace conflict: Is not file path: {self.path}")
-            shutil.rmtree(self.folder)  # remove the whole folder
+            with folder_lock(self.folder):
+                shutil.rmtree(self.folder)  # remove the whole folder
             return True
         return False
 
@@ -192,6 +295,10 @@ class WorkspaceManager:
                 else:
                     update_files.append(
                         (WorkspaceCfgEditor.get_cfg_path(self.folder, r_id), data))
+                    if r_id == cfg_editor.cfg.resources[0].id:
+                        update_files.append(
+                            (WorkspaceCfgEditor.get_normalized_path(self.folder, r_id),
+                             cfg_editor.get_normalized_file_data(data)))
                 used_resources.add(r_id)
         assert set(self._cfg_editors.keys()) == used_resources
 
@@ -204,31 +311,36 @@ class WorkspaceManager:
             update_files.append(
                 (WorkspaceClientCfgEditor.get_cfg_path(self.folder), data))
 
-        # verify ws timestamps
-        # TODO: add write lock for path file
-        if os.path.exists(self.path):
-            with open(self.path, 'r', encoding="utf-8") as f:
-                data = json.load(f)
-                pre_ws = CMDEditorWorkspace(data)
-            if pre_ws.version != self.ws.version:
-                raise exceptions.InvalidAPIUsage(
-                    f"Workspace Changed after: {self.ws.version}")
-
-        self.ws.version = datetime.utcnow()
-        with open(self.path, 'w', encoding="utf-8") as f:
-            data = json.dumps(self.ws.to_primitive(), ensure_ascii=False)
-            f.write(data)
-
-        for folder in remove_folders:
-            shutil.rmtree(folder)
-
-        for file_name, data in update_files:
-            os.makedirs(os.path.dirname(file_name), exist_ok=True)
-            with open(file_name, 'w', encoding="utf-8") as f:
-                f.write(data)
-
-        self._cfg_editors = {}
-        self._client_cfg_editor = None
+        with folder_lock(self.folder):
+            # the interrupted save is rolled forward before verifying ws timestamps
+            JournaledFileWriter.recover(self.folder)
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding="utf-8") as f:
+                    data = json.load(f)
+                    pre_ws = CMDEditorWorkspace(data)
+                if pre_ws.version != self.ws.version:
+                    raise exceptions.InvalidAPIUsage(
+                        f"Workspace Changed after: {self.ws.version}")
+
+            writer = JournaledFileWriter(self.folder)
+            for folder in remove_folders:
+                writer.add_folder_removal(folder)
+            for file_name, data in update_files:
+                # the unchanged cfg files are skipped
+                writer.add_file(file_name, data)
+            self.ws.version = datetime.utcnow()
+            ws_data = json.dumps(self.ws.to_primitive(), ensure_ascii=False)
+            # ws.json is committed last
+            writer.add_file(self.path, ws_data)
+            writer.commit()
+            self.ws_fingerprint = file_fingerprint(self.path)
+        writer.log_stats(f"WorkspaceManager: {self.name}")
+
+        # the saved cfg editors are kept, they are the same as the ones loaded from the files
+        self._cfg_editors = {
+            resource_id: cfg_editor for resource_id, cfg_editor in self._cfg_editors.items() if not cfg_editor.deleted
+        }
+        self._mark_saved(ws_data)
 
     def __update_mod_names_and_resource_provider(self):
         resource_mod_set = set()
@@ -396,14 +508,15 @@ class WorkspaceManager:
         if not reload and resource_id in self._cfg_editors:
             # load from modified dict
             cfg_editor = self._cfg_editors[resource_id]
-            return None if cfg_editor.deleted else cfg_editor
+            return None if cfg_editor.deleted else self._use_cfg_editor(cfg_editor)
         assert not self.is_in_memory
         try:
             cfg_editor = WorkspaceCfgEditor.load_resource(
                 self.folder, resource_id, version)
             for resource in cfg_editor.resources:
-                self._cfg_editors[resource.id] = cfg_editor
-            return cfg_editor
+                # the editor loaded is the same as the file
+                self._cfg_editors[resource.id] = self._saved_cfg_editors[resource.id] = cfg_editor
+            return self._use_cfg_editor(cfg_editor)
         except Exception as e:
             logger.error(
                 f"load workspace resource cfg failed: {e}: {self.name} {resource_id} {version}")
@@ -1176,8 +1289,8 @@ class WorkspaceManager:
 
             # remove the subfix such as `_create` `_update`
             cls_name_prefix = cls_name.split('_')[0]
-            for leaf in self.iter_command_tree_leaves():
-                cfg_editor = self.load_cfg_editor_by_command(leaf)
+            for leaf, cfg_editor in self._iter_similar_args_cfg_editors(
+                    lambda resource_args, names: resource_args.has_cls_arg_candidate(names, cls_name_prefix)):
                 for _, similar_cls_arg, similar_cls_arg_idx, _ in cfg_editor.iter_arg_cls_definition(
                         *leaf.names, cls_name_prefix=cls_name_prefix):
                     # search cls definition in command
@@ -1200,8 +1313,9 @@ class WorkspaceManager:
                             ref_arg_idx + idx_suffix)
 
         else:
-            for leaf in self.iter_command_tree_leaves():
-                cfg_editor = self.load_cfg_editor_by_command(leaf)
+            signature = WorkspaceCfgEditor.get_similar_args_signature(arg)
+            for leaf, cfg_editor in self._iter_similar_args_cfg_editors(
+                    lambda resource_args, names: resource_args.has_similar_arg_candidate(names, arg.var, signature)):
                 similar_arg, similar_arg_idx = cfg_editor.find_arg_by_var(
                     *leaf.names, arg_var=arg.var)
                 if similar_arg is None or not cfg_editor.is_similar_args(arg, similar_arg):
@@ -1213,6 +1327,25 @@ class WorkspaceManager:
                 }
         return results
 
+    def _iter_similar_args_cfg_editors(self, has_candidate):
+        """Iterate the leaves with the cfg editors to search similar arguments.
+
+        The unsaved cfg editors of this workspace are searched directly. The others are looked up in the shared
+        WorkspaceArgIndex, and only the leaves which have candidate arguments are searched in their indexed editors.
+        """
+        arg_index = None if self.is_in_memory else WorkspaceArgIndex.get_shared()
+        for leaf in self.iter_command_tree_leaves():
+            resource = leaf.resources[0]
+            if arg_index is None or resource.id in self._cfg_editors:
+                cfg_editor = self.load_cfg_editor_by_command(leaf)
+            else:
+                resource_args = arg_index.load(self.folder, resource.id, resource.version)
+                if resource_args is None or not has_candidate(resource_args, leaf.names):
+                    continue
+                cfg_editor = resource_args.cfg_editor
+            if cfg_editor is not None:
+                yield leaf, cfg_editor
+
     # client config
     # TODO: support typespec
     def create_cfg_editor(self, auth, templates=None, cloud_medadata=None, arm_resource=None):
@@ -1259,16 +1392,22 @@ class WorkspaceManager:
 
     def load_client_cfg_editor(self, reload=False):
         if not reload and self._client_cfg_editor:
-            return self._client_cfg_editor
+            return self._use_client_cfg_editor()
         assert not self.is_in_memory
         try:
-            self._client_cfg_editor = WorkspaceClientCfgEditor.load_client_cfg(self.folder)
-            return self._client_cfg_editor
+            self._client_cfg_editor = self._saved_client_cfg_editor = \
+                WorkspaceClientCfgEditor.load_client_cfg(self.folder)
+            return self._use_client_cfg_editor()
         except Exception as e:
             logger.error(
                 f"load workspace client cfg failed: {e}: {self.name}")
             return None
 
+    def _use_client_cfg_editor(self):
+        if self._used_client_cfg_digest is None and self._client_cfg_editor is self._saved_client_cfg_editor:
+            self._used_client_cfg_digest = self._get_digest(self._client_cfg_editor.get_cfg_file_data())
+        return self._client_cfg_editor
+
     def compare_client_cfg_with_spec(self):
         """ Check whether the client configuration version in workspace is later than the aaz specs one. """
         # compare client configuration from aaz specs
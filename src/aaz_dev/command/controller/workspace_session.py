@@ -0,0 +1,92 @@
+import logging
+import threading
+import time
+
+from utils.config import Config
+from utils.fingerprint import FingerprintCache, file_fingerprint
+from .workspace_manager import WorkspaceManager
+
+logger = logging.getLogger('backend')
+
+
+class WorkspaceSessionCache(FingerprintCache):
+    """LRU cache of the loaded workspace managers, which keeps the command tree and cfg editors between requests.
+
+    A manager is checked out exclusively by a request and checked in after it's synced with the workspace files, so
+    the cached managers are never shared by concurrent requests. The concurrent modifications are still rejected by the
+    ws.version check in WorkspaceManager.save. A session is dropped when ws.json is modified by others or it's idle
+    for WORKSPACE_SESSION_IDLE_TIMEOUT seconds, and the cfg editors of the modified cfg files are dropped individually.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries, idle_timeout):
+        super().__init__(max_entries)
+        self.idle_timeout = idle_timeout
+
+    @classmethod
+    def get_shared(cls):
+        max_entries = Config.WORKSPACE_SESSION_CACHE_SIZE
+        idle_timeout = Config.WORKSPACE_SESSION_IDLE_TIMEOUT
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.max_entries != max_entries or \
+                    cls._shared.idle_timeout != idle_timeout:
+                cls._shared = cls(max_entries, idle_timeout)
+            return cls._shared
+
+    def checkout(self, name):
+        """Return the loaded manager of workspace, it's removed from the cache until it's checked in again."""
+        manager = WorkspaceManager(name)
+        with self._lock:
+            self._evict_idle_entries()
+            entry = self._entries.pop(manager.folder, None)
+        if entry is not None:
+            cached, cfg_fingerprints, client_fingerprint, _ = entry
+            if file_fingerprint(cached.path) == cached.ws_fingerprint:
+                cached.drop_modified_cfg_editors(cfg_fingerprints, client_fingerprint)
+                with self._lock:
+                    self.stats['hits'] += 1
+                return cached
+            with self._lock:
+                self.stats['invalidations'] += 1
+
+        manager.load()
+        with self._lock:
+            self.stats['misses'] += 1
+        return manager
+
+    def checkin(self, manager):
+        """Keep the manager for the following requests.
+
+        The manager modified after loaded or saved is dropped, so is the one whose ws.json is modified by others in the
+        meantime.
+        """
+        if self.max_entries <= 0 or manager.is_in_memory:
+            return
+        if manager.is_dirty:
+            with self._lock:
+                self.stats['dirtyDrops'] += 1
+            return
+        if manager.ws_fingerprint is None or file_fingerprint(manager.path) != manager.ws_fingerprint:
+            with self._lock:
+                self.stats['invalidations'] += 1
+            return
+
+        cfg_fingerprints, client_fingerprint = manager.get_cfg_fingerprints()
+        manager.reset_request_states()
+
+        with self._lock:
+            self._evict_idle_entries()
+            self._put(manager.folder, (manager, cfg_fingerprints, client_fingerprint, time.monotonic()))
+
+    def discard(self, manager):
+        with self._lock:
+            self._entries.pop(manager.folder, None)
+
+    def _evict_idle_entries(self):
+        now = time.monotonic()
+        for folder in [folder for folder, entry in self._entries.items() if now - entry[-1] > self.idle_timeout]:
+            del self._entries[folder]
+            self.stats['idleEvictions'] += 1
+            logger.debug(f"WorkspaceSessionCache: evict idle {folder}")
@@ -35,6 +35,7 @@ from ._condition import CMDConditionOperator, \
     CMDConditionAndOperator, CMDConditionOrOperator, CMDConditionNotOperator, CMDConditionHasValueOperator, \
     CMDCondition
 from ._configuration import CMDConfiguration
+from ._readonly import CMDReadOnlyConfiguration, CMDReadOnlyCommandGroup, CMDReadOnlyCommands
 from ._content import CMDRequestJson, CMDResponseJson
 from ._example import CMDCommandExample
 from ._fields import CMDBooleanField, CMDStageField, CMDVariantField, CMDClassField, \
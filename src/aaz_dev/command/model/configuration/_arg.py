@@ -1,8 +1,9 @@
 from schematics.models import Model
-from schematics.types import StringType, ListType, ModelType, PolyModelType
+from schematics.types import StringType, ListType, ModelType
 from schematics.types.serializable import serializable
 
-from ._fields import CMDStageField, CMDVariantField, CMDPrimitiveField, CMDBooleanField, CMDClassField
+from ._fields import CMDStageField, CMDVariantField, CMDPrimitiveField, CMDBooleanField, CMDClassField, \
+    CMDTypePolyModelType
 from ._format import CMDStringFormat, CMDIntegerFormat, CMDFloatFormat, CMDObjectFormat, CMDArrayFormat, \
     CMDResourceIdFormat
 from ._help import CMDArgumentHelp
@@ -161,7 +162,7 @@ class CMDArgBase(Model):
         self._reformat_base(**kwargs)
 
 
-class CMDArgBaseField(PolyModelType):
+class CMDArgBaseField(CMDTypePolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDArgBaseField, self).__init__(
@@ -171,34 +172,13 @@ class CMDArgBaseField(PolyModelType):
             **kwargs
         )
 
-    def find_model(self, data):
-        if self.claim_function:
-            kls = self.claim_function(self, data)
-            if not kls:
-                raise Exception("Input for polymorphic field did not match any model")
-            return kls
+    def is_candidate(self, model_class):
+        return not issubclass(model_class, CMDArg)
 
-        fallback = None
-        matching_classes = set()
-        for kls in self._get_candidates():
-            if issubclass(kls, CMDArg):
-                continue
-
-            try:
-                kls_claim = kls._claim_polymorphic
-            except AttributeError:
-                if not fallback:
-                    fallback = kls
-            else:
-                if kls_claim(data):
-                    matching_classes.add(kls)
-
-        if not matching_classes and fallback:
-            return fallback
-        elif len(matching_classes) != 1:
-            raise Exception("Got ambiguous input for polymorphic field")
-
-        return matching_classes.pop()
+    def get_model_dispatch_key(self, model_class):
+        if issubclass(model_class, CMDClsArgBase):
+            return self.CLS_KEY
+        return super().get_model_dispatch_key(model_class)
 
 
 class CMDArg(CMDArgBase):
@@ -263,6 +243,21 @@ class CMDArg(CMDArgBase):
 
 
 #cls
+class CMDArgField(CMDTypePolyModelType):
+
+    def __init__(self, **kwargs):
+        super(CMDArgField, self).__init__(
+            model_spec=CMDArg,
+            allow_subclasses=True,
+            **kwargs
+        )
+
+    def get_model_dispatch_key(self, model_class):
+        if issubclass(model_class, CMDClsArgBase):
+            return self.CLS_KEY
+        return super().get_model_dispatch_key(model_class)
+
+
 class CMDClsArgBase(CMDArgBase):
     _type = StringType(
         deserialize_from='type',
@@ -720,7 +715,7 @@ class CMDObjectArgBase(CMDArgBase):
         serialized_name='format',
         deserialize_from='format',
     )
-    args = ListType(PolyModelType(CMDArg, allow_subclasses=True))
+    args = ListType(CMDArgField())
     additional_props = ModelType(
         CMDObjectArgAdditionalProperties,
         serialized_name="additionalProps",
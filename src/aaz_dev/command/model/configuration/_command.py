@@ -6,7 +6,8 @@ from schematics.types import ModelType, ListType, PolyModelType, StringType
 from ._arg_group import CMDArgGroup
 from ._arg import CMDClsArgBase
 from ._condition import CMDCondition
-from ._fields import CMDDescriptionField, CMDVersionField, CMDCommandNameField, CMDBooleanField, CMDConfirmation
+from ._fields import CMDDescriptionField, CMDVersionField, CMDCommandNameField, CMDBooleanField, CMDConfirmation, \
+    CMDKeyPolyModelType
 from ._operation import CMDOperation, CMDHttpOperation, CMDInstanceDeleteOperation
 from ._http_response_body import CMDHttpResponseJsonBody
 from ._schema import CMDClsSchemaBase, CMDArraySchemaBase, CMDStringSchemaBase, CMDObjectSchemaBase
@@ -41,7 +42,7 @@ class CMDCommand(Model):
         serialized_name="subresourceSelector",
         deserialize_from="subresourceSelector"
     )
-    operations = ListType(PolyModelType(CMDOperation, allow_subclasses=True), min_size=1)
+    operations = ListType(CMDKeyPolyModelType(CMDOperation, allow_subclasses=True), min_size=1)
     outputs = ListType(PolyModelType(CMDOutput, allow_subclasses=True), min_size=1)  # support to add outputs in different formats, such table
 
     confirmation = CMDConfirmation()  # support to prompt for confirmation - optional
@@ -53,8 +54,11 @@ class CMDCommand(Model):
         super().__init__(*args, **kwargs)
         self.arg_cls_register_map = None
         self.schema_cls_register_map = None
+        # index of arguments and schemas built by CfgReader, it's reset when the command is changed
+        self.cfg_index = None
 
     def generate_args(self, ref_args=None, ref_options=None):
+        self.cfg_index = None
         if not ref_args:
             ref_args = []
             if self.arg_groups:
@@ -151,6 +155,7 @@ class CMDCommand(Model):
         return output
 
     def reformat(self, **kwargs):
+        self.cfg_index = None
         self.resources = sorted(self.resources, key=lambda r: r.id)
         try:
             self._reformat_arg_groups(**kwargs)
@@ -211,6 +216,7 @@ class CMDCommand(Model):
                 )
 
     def link(self):
+        self.cfg_index = None
         self.arg_cls_register_map = {}
         self.schema_cls_register_map = {}
 
@@ -1,4 +1,5 @@
-from schematics.types import StringType, BaseType, BooleanType
+from schematics.types import StringType, BaseType, BooleanType, PolyModelType
+from utils.config import Config
 from utils.stage import AAZStageEnum, AAZStageField
 import json
 import logging
@@ -152,3 +153,116 @@ class CMDDescriptionField(StringType):
     def to_primitive(self, value, context=None):
         """the description will not exist when call to primitive"""
         return None  # return None when value is false to hide field with `serialize_when_none=False`
+
+
+
+_AMBIGUOUS_MODEL = object()
+
+
+class CMDPolyModelType(PolyModelType):
+    """PolyModelType which finds the model of data by a dispatch table instead of claiming all candidates.
+
+    The table maps the dispatch key of candidate models to the model, it's built at the first lookup when all the
+    subclasses are defined. The data falls back to claim all candidates when its key is unknown or shared by
+    multiple models, so the errors are the same as PolyModelType. Set `AAZ_STRICT_POLYMORPHIC_CLAIM` to always
+    claim all candidates, which verifies there's no ambiguous models.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dispatch_table = None
+
+    def is_candidate(self, model_class):
+        return True
+
+    def get_model_dispatch_key(self, model_class):
+        """The dispatch key of model class, None if data should not be dispatched to it."""
+        raise NotImplementedError()
+
+    def get_data_dispatch_key(self, data, table):
+        """The dispatch key of data, None if it's unknown."""
+        raise NotImplementedError()
+
+    def find_model(self, data):
+        if self.claim_function or Config.STRICT_POLYMORPHIC_CLAIM or not isinstance(data, dict):
+            return self._claim_model(data)
+        table = self._dispatch_table
+        if table is None:
+            table = self._dispatch_table = self._build_dispatch_table()
+        kls = table.get(self.get_data_dispatch_key(data, table), None)
+        if kls is None or kls is _AMBIGUOUS_MODEL or not kls._claim_polymorphic(data):
+            return self._claim_model(data)
+        return kls
+
+    def _build_dispatch_table(self):
+        table = {}
+        for kls in self._get_candidates():
+            if not self.is_candidate(kls) or not hasattr(kls, '_claim_polymorphic'):
+                continue
+            key = self.get_model_dispatch_key(kls)
+            if key is None:
+                continue
+            if key in table and table[key] is not kls:
+                table[key] = _AMBIGUOUS_MODEL
+            else:
+                table[key] = kls
+        return table
+
+    def _claim_model(self, data):
+        if self.claim_function:
+            kls = self.claim_function(self, data)
+            if not kls:
+                raise Exception("Input for polymorphic field did not match any model")
+            return kls
+
+        fallback = None
+        matching_classes = set()
+        for kls in self._get_candidates():
+            if not self.is_candidate(kls):
+                continue
+
+            try:
+                kls_claim = kls._claim_polymorphic
+            except AttributeError:
+                if not fallback:
+                    fallback = kls
+            else:
+                if kls_claim(data):
+                    matching_classes.add(kls)
+
+        if not matching_classes and fallback:
+            return fallback
+        elif len(matching_classes) != 1:
+            raise Exception("Got ambiguous input for polymorphic field")
+
+        return matching_classes.pop()
+
+
+class CMDTypePolyModelType(CMDPolyModelType):
+    """Dispatch by the `type` of data, such as "string" or "array<string>", the models are keyed by TYPE_VALUE."""
+
+    # the key of cls models, which claim the types start with '@'
+    CLS_KEY = '@'
+
+    def get_model_dispatch_key(self, model_class):
+        return getattr(model_class, 'TYPE_VALUE', None)
+
+    def get_data_dispatch_key(self, data, table):
+        type_value = data.get('type', None)
+        if not isinstance(type_value, str):
+            return None
+        if type_value.startswith(self.CLS_KEY):
+            return self.CLS_KEY
+        typ = type_value.replace("<", " ").replace(">", " ").split()
+        return typ[0] if typ else None
+
+
+class CMDKeyPolyModelType(CMDPolyModelType):
+    """Dispatch by the key in data, the models are keyed by POLYMORPHIC_KEY."""
+
+    def get_model_dispatch_key(self, model_class):
+        return getattr(model_class, 'POLYMORPHIC_KEY', None)
+
+    def get_data_dispatch_key(self, data, table):
+        keys = [key for key in table if key in data]
+        return keys[0] if len(keys) == 1 else None
@@ -0,0 +1,129 @@
+from collections.abc import Sequence
+
+from ._command import CMDCommand
+from ._configuration import CMDConfiguration
+from ._resource import CMDResource
+
+
+class _ReadOnlyNode:
+    """Immutable node over the raw json data of configuration, the children are materialized on first access."""
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        object.__setattr__(self, '_data', data)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"'{type(self).__name__}' is read only")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"'{type(self).__name__}' is read only")
+
+    def _cache(self, key, value):
+        object.__setattr__(self, key, value)
+        return value
+
+
+class CMDReadOnlyCommands(Sequence):
+    """The commands of a command group, each command is converted to a linked CMDCommand when it's accessed."""
+
+    __slots__ = ('_data', '_commands')
+
+    def __init__(self, data):
+        self._data = data
+        self._commands = [None] * len(data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        command = self._commands[idx]
+        if command is None:
+            command = CMDCommand(self._data[idx])
+            command.link()
+            self._commands[idx] = command
+        return command
+
+    @property
+    def names(self):
+        return [data['name'] for data in self._data]
+
+    def find(self, name):
+        for idx, data in enumerate(self._data):
+            if data['name'] == name:
+                return self[idx]
+        return None
+
+
+class CMDReadOnlyCommandGroup(_ReadOnlyNode):
+
+    __slots__ = ('_commands', '_command_groups')
+
+    @property
+    def name(self):
+        return self._data['name']
+
+    @property
+    def commands(self):
+        try:
+            return self._commands
+        except AttributeError:
+            data = self._data.get('commands', None)
+            return self._cache('_commands', CMDReadOnlyCommands(data) if data else None)
+
+    @property
+    def command_groups(self):
+        try:
+            return self._command_groups
+        except AttributeError:
+            data = self._data.get('commandGroups', None)
+            return self._cache(
+                '_command_groups', tuple(CMDReadOnlyCommandGroup(d) for d in data) if data else None)
+
+    def find_command(self, name):
+        commands = self.commands
+        return commands.find(name) if commands else None
+
+
+class CMDReadOnlyConfiguration(_ReadOnlyNode):
+    """Read only CMDConfiguration loaded from json data.
+
+    Only the command groups and the commands accessed are converted, so it's much cheaper than CMDConfiguration
+    for consumers which read a few commands of the configuration. The commands are linked CMDCommand models,
+    which should not be modified.
+    """
+
+    __slots__ = ('_resources', '_command_groups')
+
+    @property
+    def plane(self):
+        return self._data['plane']
+
+    @property
+    def resources(self):
+        try:
+            return self._resources
+        except AttributeError:
+            return self._cache('_resources', tuple(CMDResource(d) for d in self._data['resources']))
+
+    @property
+    def command_groups(self):
+        try:
+            return self._command_groups
+        except AttributeError:
+            data = self._data.get('commandGroups', None)
+            return self._cache(
+                '_command_groups', tuple(CMDReadOnlyCommandGroup(d) for d in data) if data else None)
+
+    def link(self):
+        # commands are linked when they are converted
+        pass
+
+    def to_model(self):
+        """Convert to a new CMDConfiguration, which can be modified."""
+        return CMDConfiguration(self._data)
+
+    def to_primitive(self):
+        return self.to_model().to_primitive()
@@ -3,7 +3,7 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 from schematics.models import Model
-from schematics.types import ModelType, ListType, PolyModelType
+from schematics.types import ModelType, ListType
 from schematics.types.serializable import serializable
 
 from ._arg import CMDStringArg, CMDStringArgBase, \
@@ -27,7 +27,8 @@ from ._arg import CMDStringArg, CMDStringArgBase, \
     CMDArrayArg, CMDArrayArgBase, \
     CMDObjectArg, CMDObjectArgBase, CMDObjectArgAdditionalProperties, \
     CMDClsArg, CMDClsArgBase, CMDAnyTypeArg, CMDAnyTypeArgBase
-from ._fields import CMDVariantField, StringType, CMDClassField, CMDBooleanField, CMDPrimitiveField, CMDDescriptionField
+from ._fields import CMDVariantField, StringType, CMDClassField, CMDBooleanField, CMDPrimitiveField, CMDDescriptionField, \
+    CMDTypePolyModelType
 from ._format import CMDStringFormat, CMDIntegerFormat, CMDFloatFormat, CMDObjectFormat, CMDArrayFormat, \
     CMDResourceIdFormat
 from ._utils import CMDDiffLevelEnum
@@ -213,7 +214,7 @@ class CMDSchemaBase(Model):
         self._reformat_base(**kwargs)
 
 
-class CMDSchemaBaseField(PolyModelType):
+class CMDSchemaBaseField(CMDTypePolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDSchemaBaseField, self).__init__(
@@ -229,34 +230,13 @@ class CMDSchemaBaseField(PolyModelType):
             return None
         return super(CMDSchemaBaseField, self).export(value, format, context)
 
-    def find_model(self, data):
-        if self.claim_function:
-            kls = self.claim_function(self, data)
-            if not kls:
-                raise Exception("Input for polymorphic field did not match any model")
-            return kls
-
-        fallback = None
-        matching_classes = set()
-        for kls in self._get_candidates():
-            if issubclass(kls, CMDSchema):
-                continue
-
-            try:
-                kls_claim = kls._claim_polymorphic
-            except AttributeError:
-                if not fallback:
-                    fallback = kls
-            else:
-                if kls_claim(data):
-                    matching_classes.add(kls)
+    def is_candidate(self, model_class):
+        return not issubclass(model_class, CMDSchema)
 
-        if not matching_classes and fallback:
-            return fallback
-        elif len(matching_classes) != 1:
-            raise Exception("Got ambiguous input for polymorphic field")
-
-        return matching_classes.pop()
+    def get_model_dispatch_key(self, model_class):
+        if issubclass(model_class, CMDClsSchemaBase):
+            return self.CLS_KEY
+        return super().get_model_dispatch_key(model_class)
 
 
 class CMDSchema(CMDSchemaBase):
@@ -330,7 +310,7 @@ class CMDSchema(CMDSchemaBase):
         self._reformat(**kwargs)
 
 
-class CMDSchemaField(PolyModelType):
+class CMDSchemaField(CMDTypePolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDSchemaField, self).__init__(
@@ -340,6 +320,11 @@ class CMDSchemaField(PolyModelType):
             **kwargs
         )
 
+    def get_model_dispatch_key(self, model_class):
+        if issubclass(model_class, CMDClsSchemaBase):
+            return self.CLS_KEY
+        return super().get_model_dispatch_key(model_class)
+
     def export(self, value, format, context=None):
         if value.frozen:
             # frozen schema base will be ignored
@@ -4,9 +4,10 @@
 # --------------------------------------------------------------------------------------------
 
 from schematics.models import Model
-from schematics.types import StringType, ListType, ModelType, PolyModelType
+from schematics.types import StringType, ListType, ModelType
 from schematics.types.serializable import serializable
 
+from ._fields import CMDTypePolyModelType
 from ._schema import CMDSchemaField, CMDStringSchemaBase, CMDStringSchema
 from ._arg_builder import CMDArgBuilder
 from ._utils import CMDDiffLevelEnum
@@ -57,7 +58,7 @@ class CMDSelectorIndexBase(Model):
         return diff
 
 
-class CMDSelectorIndexBaseField(PolyModelType):
+class CMDSelectorIndexBaseField(CMDTypePolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDSelectorIndexBaseField, self).__init__(
@@ -67,34 +68,8 @@ class CMDSelectorIndexBaseField(PolyModelType):
             **kwargs
         )
 
-    def find_model(self, data):
-        if self.claim_function:
-            kls = self.claim_function(self, data)
-            if not kls:
-                raise Exception("Input for polymorphic field did not match any model")
-            return kls
-
-        fallback = None
-        matching_classes = set()
-        for kls in self._get_candidates():
-            if issubclass(kls, CMDSelectorIndex):
-                continue
-
-            try:
-                kls_claim = kls._claim_polymorphic
-            except AttributeError:
-                if not fallback:
-                    fallback = kls
-            else:
-                if kls_claim(data):
-                    matching_classes.add(kls)
-
-        if not matching_classes and fallback:
-            return fallback
-        elif len(matching_classes) != 1:
-            raise Exception("Got ambiguous input for polymorphic field")
-
-        return matching_classes.pop()
+    def is_candidate(self, model_class):
+        return not issubclass(model_class, CMDSelectorIndex)
 
 
 class CMDSelectorIndex(CMDSelectorIndexBase):
@@ -126,7 +101,7 @@ class CMDSelectorIndex(CMDSelectorIndexBase):
         return diff
 
 
-class CMDSelectorIndexField(PolyModelType):
+class CMDSelectorIndexField(CMDTypePolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDSelectorIndexField, self).__init__(
@@ -1,4 +1,8 @@
+import json
+from unittest import mock
+
 from utils.stage import AAZStageEnum
+from command.controller.cfg_reader import ReadOnlyCfgReader
 from command.tests.common import CommandTestCase, workspace_name
 from swagger.utils.tools import swagger_resource_path_to_resource_id
 from swagger.utils.source import SourceTypeEnum
@@ -192,6 +196,34 @@ class APIAAZSpecsTest(CommandTestCase):
             self.assertTrue(command_version['names'] == ['edge-order', 'list-configuration'])
             self.assertTrue(command_version['version'] == '2021-12-01')
 
+            rv = c.post(f"/AAZ/Specs/CommandTree/Nodes/Leaves/Versions", json=[
+                {"names": ['aaz', 'edge-order', 'list-configuration'], "version": '2021-12-01'},
+                {"names": ['aaz', 'edge-order', 'address', 'list'], "version": '2021-12-01'},
+            ])
+            self.assertTrue(rv.status_code == 200)
+            self.assertEqual(rv.mimetype, "application/x-ndjson")
+            command_versions = [json.loads(line) for line in rv.get_data(as_text=True).splitlines()]
+            self.assertEqual([v['names'] for v in command_versions], [
+                ['edge-order', 'list-configuration'], ['edge-order', 'address', 'list']])
+            self.assertEqual(command_versions[0], command_version)
+
+            rv = c.post(f"/AAZ/Specs/CommandTree/Nodes/Leaves/Versions", json=[
+                {"names": ['aaz', 'edge-order', 'list-configuration'], "version": '2020-01-01'},
+            ])
+            self.assertTrue(rv.status_code == 404)
+
+            rv = c.post(f"/AAZ/Specs/CommandTree/Nodes/Leaves/Versions", json=[
+                {"names": 'aaz edge-order list-configuration', "version": '2021-12-01'},
+            ])
+            self.assertTrue(rv.status_code == 400)
+
+            # the command missed in cfg file is responded with status code instead of a truncated stream
+            with mock.patch.object(ReadOnlyCfgReader, 'find_command', return_value=None):
+                rv = c.post(f"/AAZ/Specs/CommandTree/Nodes/Leaves/Versions", json=[
+                    {"names": ['aaz', 'edge-order', 'list-configuration'], "version": '2021-12-01'},
+                ])
+            self.assertTrue(rv.status_code == 404)
+
         # test aaz resources
         with self.app.test_client() as c:
             resource_id = swagger_resource_path_to_resource_id("/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.EdgeOrder/orderItems/{orderItemName}")
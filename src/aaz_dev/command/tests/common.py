@@ -1,12 +1,79 @@
 from app.tests.common import ApiTestCase
 import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest import TestCase, mock
+from command.controller.workspace_cfg_editor import WorkspaceCfgEditor
+from command.controller.workspace_manager import WorkspaceManager
+from command.model.configuration import CMDConfiguration
 from command.model.configuration._xml import XMLSerializer
+from command.model.editor import CMDEditorWorkspace
+from utils.config import Config
+from utils.plane import PlaneEnum
+
+DATABRICKS_CFG_FOLDER = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'cli', 'tests', 'aaz_generator_tests', 'databricks')
+
+AAZ_TREE_INFO = """# Atomic Azure CLI Commands
+
+## Groups
+
+- [edge-order](/Commands/edge-order/readme.md)
+: Manage edge order.
+"""
 
 
 class CommandTestCase(ApiTestCase):
     pass
 
 
+class WorkspaceTestCase(TestCase):
+    """Save a databricks workspace in temp folders, which are patched as the aaz repo and workspace root in Config."""
+
+    WS_NAME = "ws"
+    WS_COMMAND_NAMES = ('databricks', 'workspace')
+    CFG_FILE_NAMES = ("workspace-crud.xml",)
+
+    def setUp(self):
+        self.aaz_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.aaz_path)
+        os.makedirs(os.path.join(self.aaz_path, "Commands"))
+        with open(os.path.join(self.aaz_path, "Commands", "readme.md"), 'w', encoding='utf-8') as f:
+            f.write(AAZ_TREE_INFO)
+        self.ws_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.ws_root)
+        for patch in (
+                mock.patch.object(Config, 'AAZ_PATH', self.aaz_path),
+                mock.patch.object(Config, 'AAZ_DEV_WORKSPACE_FOLDER', self.ws_root)):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        manager = WorkspaceManager(self.WS_NAME)
+        manager.ws = CMDEditorWorkspace({
+            "name": self.WS_NAME,
+            "plane": PlaneEnum.Mgmt,
+            "modNames": "databricks",
+            "resourceProvider": "Microsoft.Databricks",
+            "source": "OpenAPI",
+            "version": datetime.utcnow(),
+            "commandTree": {
+                "names": [WorkspaceManager.COMMAND_TREE_ROOT_NAME],
+            }
+        })
+        for file_name in self.CFG_FILE_NAMES:
+            with open(os.path.join(DATABRICKS_CFG_FOLDER, file_name), 'r', encoding='utf-8') as f:
+                manager.add_cfg(WorkspaceCfgEditor(XMLSerializer.from_xml(CMDConfiguration, f.read())))
+        manager.save()
+        self.ws_folder = manager.folder
+
+    def load_manager(self):
+        manager = WorkspaceManager(self.WS_NAME)
+        manager.load()
+        return manager
+
+
 def workspace_name(suffix, arg_name='ws_name'):
     def decorator(func):
         def wrapper(self, **kwargs):
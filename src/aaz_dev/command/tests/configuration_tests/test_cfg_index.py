@@ -0,0 +1,87 @@
+import os
+from unittest import TestCase
+
+from command.controller.cfg_reader import CfgReader
+from command.controller.workspace_cfg_editor import WorkspaceCfgEditor
+from command.model.configuration import CMDConfiguration, CMDArgGroup, XMLSerializer
+
+CFG_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'cli', 'tests', 'aaz_generator_tests', 'databricks',
+    'workspace-crud.xml')
+
+CMD_NAMES = ['databricks', 'workspace', 'create']
+
+
+class CfgCommandIndexTest(TestCase):
+
+    def setUp(self):
+        with open(CFG_PATH, 'r', encoding='utf-8') as f:
+            self.cfg_editor = WorkspaceCfgEditor(XMLSerializer.from_xml(CMDConfiguration, f.read()))
+
+    @staticmethod
+    def _walk_args(command):
+        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
+            return (_parent, _arg, _arg_idx, _arg_var), False
+
+        for arg_group in command.arg_groups:
+            for parent, arg, arg_idx, arg_var in CfgReader._iter_args_in_group(arg_group, arg_filter=arg_filter):
+                yield parent, arg, CfgReader.arg_idx_to_str(arg_idx), arg_var
+
+    def test_index_matches_walk(self):
+        for _, command in self.cfg_editor.iter_commands():
+            args = list(self._walk_args(command))
+            self.assertEqual(list(self.cfg_editor.iter_args_in_command(command)), args)
+            for parent, arg, arg_idx, arg_var in args:
+                self.assertEqual(
+                    CfgReader.find_arg_in_command_with_parent_by_var(command, arg_var), (parent, arg, arg_idx))
+                schemas = [
+                    match for operation in command.operations
+                    for match in CfgReader.iter_schema_in_operation_by_arg_var(operation, arg_var)]
+                self.assertEqual(list(CfgReader.iter_schema_in_command_by_arg_var(command, arg_var)), schemas)
+            for cls_name in command.arg_cls_register_map:
+                self.assertEqual(
+                    CfgReader._find_arg_cls_definition(command, cls_name),
+                    next(match for match in args if getattr(match[1], 'cls', None) == cls_name))
+                self.assertEqual(
+                    list(CfgReader._iter_arg_cls_reference(command, cls_name)),
+                    [match for match in args if match[1].type == f"@{cls_name}"])
+            for cls_name in command.schema_cls_register_map:
+                self.assertEqual(
+                    list(CfgReader.iter_schema_cls_reference(command, cls_name)),
+                    list(CfgReader.iter_schema_cls_reference_in_operations(command.operations, cls_name)))
+
+        command = self.cfg_editor.find_command(*CMD_NAMES)
+        self.assertIs(command.cfg_index, self.cfg_editor.find_command(*CMD_NAMES).cfg_index)
+        self.assertEqual(self.cfg_editor.find_arg_by_var(*CMD_NAMES, arg_var='$parameters.not-exist'), (None, None))
+
+    def test_index_after_modification(self):
+        cls_arg_var = '$parameters.properties.parameters.amlWorkspaceId'
+        command = self.cfg_editor.find_command(*CMD_NAMES)
+        self.assertEqual(len(list(CfgReader._iter_arg_cls_reference(command, 'WorkspaceCustomStringParameter_create'))), 10)
+        self.cfg_editor.unwrap_cls_arg(*CMD_NAMES, arg_var=cls_arg_var)
+        arg, _ = self.cfg_editor.find_arg_by_var(*CMD_NAMES, arg_var=cls_arg_var)
+        self.assertIsNone(arg.cls)
+        command = self.cfg_editor.find_command(*CMD_NAMES)
+        self.assertEqual(list(self.cfg_editor.iter_args_in_command(command)), list(self._walk_args(command)))
+
+        arg, arg_idx = self.cfg_editor.find_arg_by_var(*CMD_NAMES, arg_var='$parameters.sku.name')
+        self.assertEqual(arg_idx, 'sku.name')
+
+        self.cfg_editor.update_arg_by_var(*CMD_NAMES, arg_var='$parameters.sku', options=['sku-info'])
+        _, arg_idx = self.cfg_editor.find_arg_by_var(*CMD_NAMES, arg_var='$parameters.sku.name')
+        self.assertEqual(arg_idx, 'sku-info.name')
+
+        self.cfg_editor.flatten_arg(*CMD_NAMES, arg_var='$parameters.sku', sub_args_options={
+            '$parameters.sku.name': ['sku-name'],
+        })
+        parent, arg, arg_idx = self.cfg_editor.find_arg_with_parent_by_var(*CMD_NAMES, arg_var='$parameters.sku')
+        self.assertIsInstance(parent, CMDArgGroup)
+        self.assertIsNone(arg)
+        self.assertIsNone(arg_idx)
+        _, arg_idx = self.cfg_editor.find_arg_by_var(*CMD_NAMES, arg_var='$parameters.sku.name')
+        self.assertEqual(arg_idx, 'sku-name')
+
+        self.cfg_editor.unflatten_arg(
+            *CMD_NAMES, arg_var='$parameters.sku', options=['sku'], help={"short": "The SKU of the resource."})
+        _, arg_idx = self.cfg_editor.find_arg_by_var(*CMD_NAMES, arg_var='$parameters.sku.name')
+        self.assertEqual(arg_idx, 'sku.sku-name')
@@ -0,0 +1,69 @@
+from unittest import TestCase, mock
+
+from command.model.configuration import CMDCommand
+from command.model.configuration._arg import CMDArgBaseField, CMDArgField, CMDClsArgBase, CMDClsArg, \
+    CMDStringArg, CMDStringArgBase
+from command.model.configuration._schema import CMDSchemaBaseField, CMDSchemaField, CMDClsSchemaBase, \
+    CMDObjectSchema, CMDArraySchemaBase
+from command.model.configuration._selector_index import CMDSelectorIndexBaseField, CMDSelectorIndexField
+from utils.config import Config
+
+
+class PolyModelDispatchTest(TestCase):
+
+    @staticmethod
+    def _iter_samples(field):
+        types = {getattr(kls, 'TYPE_VALUE', None) for kls in field._get_candidates()} - {None}
+        for typ in sorted(types):
+            for type_value in (typ, f"array<{typ}>"):
+                yield {"type": type_value}
+                yield {"type": type_value, "name": "a", "var": "$a"}
+        yield {"type": "@Cls"}
+        yield {"type": "@Cls", "name": "a", "var": "$a"}
+        yield {"type": "unknown"}
+        yield {"name": "a"}
+
+    def _assert_dispatch(self, field):
+        for data in self._iter_samples(field):
+            try:
+                expected = field._claim_model(data)
+            except Exception as err:
+                expected = str(err)
+            try:
+                model = field.find_model(data)
+            except Exception as err:
+                model = str(err)
+            self.assertEqual(model, expected, data)
+
+    def test_dispatch_same_as_claim(self):
+        for field in (
+                CMDSchemaBaseField(), CMDSchemaField(),
+                CMDArgBaseField(), CMDArgField(),
+                CMDSelectorIndexBaseField(), CMDSelectorIndexField(),
+        ):
+            self._assert_dispatch(field)
+
+    def test_dispatch_models(self):
+        self.assertIs(CMDSchemaBaseField().find_model({"type": "@Cls"}), CMDClsSchemaBase)
+        self.assertIs(CMDSchemaBaseField().find_model({"type": "array<string>"}), CMDArraySchemaBase)
+        self.assertIs(CMDSchemaField().find_model({"type": "object", "name": "a"}), CMDObjectSchema)
+        self.assertIs(CMDArgBaseField().find_model({"type": "@Cls", "var": "$a"}), CMDClsArgBase)
+        self.assertIs(CMDArgBaseField().find_model({"type": "string"}), CMDStringArgBase)
+        self.assertIs(CMDArgField().find_model({"type": "@Cls", "var": "$a"}), CMDClsArg)
+        self.assertIs(CMDArgField().find_model({"type": "string", "var": "$a"}), CMDStringArg)
+        with self.assertRaises(Exception):
+            # the arg requires var
+            CMDArgField().find_model({"type": "string"})
+
+    def test_dispatch_operations(self):
+        field = CMDCommand.operations.field
+        for key in ("http", "instanceCreate", "instanceUpdate", "instanceDelete"):
+            self.assertEqual(field.find_model({key: {}}), field._claim_model({key: {}}))
+        with self.assertRaises(Exception):
+            field.find_model({"http": {}, "instanceUpdate": {}})
+
+    def test_strict_claim(self):
+        field = CMDSchemaBaseField()
+        with mock.patch.object(Config, 'STRICT_POLYMORPHIC_CLAIM', True):
+            self.assertIs(field.find_model({"type": "@Cls"}), CMDClsSchemaBase)
+        self.assertIsNone(field._dispatch_table)
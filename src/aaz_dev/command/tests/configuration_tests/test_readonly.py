@@ -0,0 +1,48 @@
+import json
+import os
+from unittest import TestCase
+
+from command.controller.cfg_reader import CfgReader, ReadOnlyCfgReader
+from command.model.configuration import CMDConfiguration, CMDReadOnlyConfiguration, CMDCommand, XMLSerializer
+
+CFG_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'cli', 'tests', 'aaz_generator_tests', 'databricks',
+    'workspace-crud.xml')
+
+
+class ReadOnlyConfigurationTest(TestCase):
+
+    def setUp(self):
+        with open(CFG_PATH, 'r', encoding='utf-8') as f:
+            cfg = XMLSerializer.from_xml(CMDConfiguration, f.read())
+        self.data = json.loads(json.dumps(cfg.to_primitive()))
+
+    def test_read_only_cfg_reader(self):
+        reader = CfgReader(CMDConfiguration(self.data))
+        ro_reader = ReadOnlyCfgReader(CMDReadOnlyConfiguration(self.data))
+
+        self.assertEqual([r.to_primitive() for r in ro_reader.resources], [r.to_primitive() for r in reader.resources])
+        self.assertEqual(list(ro_reader.iter_command_group_names()), list(reader.iter_command_group_names()))
+        cmd_names = [names for names, _ in reader.iter_commands()]
+        self.assertEqual([names for names, _ in ro_reader.iter_commands()], cmd_names)
+        for names in cmd_names:
+            command = ro_reader.find_command(*names)
+            self.assertIsInstance(command, CMDCommand)
+            self.assertIsNotNone(command.arg_cls_register_map)
+            self.assertEqual(command.to_primitive(), reader.find_command(*names).to_primitive())
+            self.assertIs(ro_reader.find_command(*names), command)
+        self.assertIsNone(ro_reader.find_command(*cmd_names[0][:-1], 'not-exist'))
+        self.assertEqual(ro_reader.cfg.to_primitive(), reader.cfg.to_primitive())
+
+    def test_lazy_and_immutable(self):
+        cfg = CMDReadOnlyConfiguration(self.data)
+        group = cfg.command_groups[0]
+        while not group.commands:
+            group = group.command_groups[0]
+        self.assertEqual(group.commands._commands, [None] * len(group.commands))
+        group.find_command(group.commands.names[-1])
+        self.assertEqual(sum(c is not None for c in group.commands._commands), 1)
+        with self.assertRaises(AttributeError):
+            cfg.plane = "other"
+        with self.assertRaises(AttributeError):
+            group.name = "other"
@@ -0,0 +1,69 @@
+from unittest import mock
+
+from command.controller.workspace_arg_index import WorkspaceArgIndex
+from command.tests.common import WorkspaceTestCase
+from utils.config import Config
+
+WORKSPACE_NAMES = WorkspaceTestCase.WS_COMMAND_NAMES
+
+
+class WorkspaceArgIndexTest(WorkspaceTestCase):
+
+    CFG_FILE_NAMES = ("workspace-crud.xml", "workspace-list.xml", "vnet-peering-crud.xml", "vnet-peering-list.xml")
+
+    def setUp(self):
+        self.arg_index = WorkspaceArgIndex(Config.WORKSPACE_ARG_INDEX_SIZE)
+        patch = mock.patch.object(WorkspaceArgIndex, '_shared', self.arg_index)
+        patch.start()
+        self.addCleanup(patch.stop)
+        super().setUp()
+
+    def _find_similar_args(self, manager, arg_var):
+        leaf = manager.find_command_tree_leaf(*WORKSPACE_NAMES, 'create')
+        arg, _ = manager.load_cfg_editor_by_command(leaf).find_arg_by_var(*leaf.names, arg_var=arg_var)
+        return manager.find_similar_args(*leaf.names, arg=arg)
+
+    def test_find_similar_args(self):
+        manager = self.load_manager()
+        results = self._find_similar_args(manager, '$Path.workspaceName')
+        self.assertEqual(results, {
+            (*WORKSPACE_NAMES, name): {'$Path.workspaceName': ['workspace-name']}
+            for name in ('show', 'delete', 'create', 'update')
+        })
+        # the other resources are not loaded into the workspace manager
+        self.assertEqual(len(set(manager._cfg_editors.values())), 1)
+
+        results = self._find_similar_args(manager, '@WorkspaceCustomStringParameter_create.value')
+        self.assertEqual(sorted(results), [(*WORKSPACE_NAMES, 'create'), (*WORKSPACE_NAMES, 'update')])
+        self.assertEqual(
+            results[(*WORKSPACE_NAMES, 'update')]['@WorkspaceCustomStringParameter_update.value'][0],
+            'parameters.aml-workspace-id.value')
+
+        stats = self.arg_index.get_stats()
+        misses = stats['misses']
+        self._find_similar_args(self.load_manager(), '$Path.workspaceName')
+        stats = self.arg_index.get_stats()
+        self.assertEqual(stats['misses'], misses)
+        self.assertNotIn('invalidations', stats)
+
+    def test_search_modified_resources(self):
+        self._find_similar_args(self.load_manager(), '$Path.workspaceName')
+        misses = self.arg_index.get_stats()['misses']
+
+        manager = self.load_manager()
+        leaf = manager.find_command_tree_leaf(*WORKSPACE_NAMES, 'vnet-peering', 'list')
+        self.assertNotIn(leaf.names, [list(key) for key in self._find_similar_args(manager, '$Path.workspaceName')])
+        cfg_editor = manager.load_cfg_editor_by_command(leaf)
+        cfg_editor.update_arg_by_var(*leaf.names, arg_var='$Path.workspaceName', options=['workspace-name', 'name', 'n'])
+        # the unsaved cfg editor is searched directly
+        results = self._find_similar_args(manager, '$Path.workspaceName')
+        self.assertIn((*WORKSPACE_NAMES, 'vnet-peering', 'list'), results)
+        self.assertEqual(self.arg_index.get_stats()['misses'], misses)
+
+        manager.save()
+        results = self._find_similar_args(self.load_manager(), '$Path.workspaceName')
+        self.assertIn((*WORKSPACE_NAMES, 'vnet-peering', 'list'), results)
+        stats = self.arg_index.get_stats()
+        # only the saved resource is indexed again
+        self.assertEqual(stats['misses'], misses + 1)
+        self.assertEqual(stats['invalidations'], 1)
@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from command.controller import workspace_cfg_editor
+from command.controller.workspace_cfg_editor import WorkspaceCfgEditor
+from command.model.configuration import CMDConfiguration, XMLSerializer
+
+CFG_FOLDER = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'cli', 'tests', 'aaz_generator_tests', 'databricks')
+
+CMD_NAMES = ['databricks', 'workspace', 'create']
+
+
+class WorkspaceCfgNormalizedTest(TestCase):
+
+    def setUp(self):
+        self.ws_folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.ws_folder)
+
+    @staticmethod
+    def _new_cfg_editor(file_name="workspace-crud.xml"):
+        with open(os.path.join(CFG_FOLDER, file_name), 'r', encoding='utf-8') as f:
+            return WorkspaceCfgEditor(XMLSerializer.from_xml(CMDConfiguration, f.read()))
+
+    def _save(self, cfg_editor):
+        main_resource_id = cfg_editor.resources[0].id
+        for resource_id, data in cfg_editor.iter_cfg_files_data():
+            path = WorkspaceCfgEditor.get_cfg_path(self.ws_folder, resource_id)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            if resource_id == main_resource_id:
+                with open(WorkspaceCfgEditor.get_normalized_path(self.ws_folder, resource_id), 'w',
+                          encoding='utf-8') as f:
+                    f.write(cfg_editor.get_normalized_file_data(data))
+        return WorkspaceCfgEditor.get_cfg_path(self.ws_folder, main_resource_id)
+
+    def _load(self, cfg_editor):
+        resource = cfg_editor.resources[0]
+        with mock.patch.object(WorkspaceCfgEditor, 'reformat', autospec=True,
+                               side_effect=WorkspaceCfgEditor.reformat) as reformat:
+            loaded = WorkspaceCfgEditor.load_resource(self.ws_folder, resource.id, resource.version)
+        return loaded, reformat.call_count
+
+    def test_skip_reformat_on_load(self):
+        cfg_editor = self._new_cfg_editor()
+        self._save(cfg_editor)
+        loaded, reformat_count = self._load(cfg_editor)
+        self.assertEqual(reformat_count, 1)
+
+        path = self._save(loaded)
+        with open(path, 'r', encoding='utf-8') as f:
+            # the cfg file is still loaded by the versions which don't support the normalized file
+            CMDConfiguration(json.load(f))
+        normalized, reformat_count = self._load(loaded)
+        self.assertEqual(reformat_count, 0)
+        self.assertTrue(normalized.normalized)
+        # the normalized file is the same as the reformatted one
+        normalized.cfg.reformat()
+        self.assertEqual(normalized.cfg.to_primitive(), loaded.cfg.to_primitive())
+
+    def test_reformat_modified_file(self):
+        cfg_editor = self._new_cfg_editor()
+        cfg_editor.reformat()
+        path = self._save(cfg_editor)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['commandGroups'][0]['commands'][0]['version'] = '2000-01-01'
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        _, reformat_count = self._load(cfg_editor)
+        self.assertEqual(reformat_count, 1)
+
+        self._save(cfg_editor)
+        _, reformat_count = self._load(cfg_editor)
+        self.assertEqual(reformat_count, 0)
+        # the files normalized by the other versions of reformat are reformatted again
+        with mock.patch.object(workspace_cfg_editor, '_reformat_digest', 'other'):
+            _, reformat_count = self._load(cfg_editor)
+        self.assertEqual(reformat_count, 1)
+
+    def test_reformat_modified_commands(self):
+        cfg_editor = self._new_cfg_editor()
+        cfg_editor.reformat()
+        full_cfg_editor = self._new_cfg_editor()
+        for editor in (cfg_editor, full_cfg_editor):
+            editor.update_arg_by_var(*CMD_NAMES, arg_var='$parameters.sku', options=['sku-info'], group='Sku')
+            editor.flatten_arg(*CMD_NAMES, arg_var='$parameters.sku', sub_args_options={
+                '$parameters.sku.name': ['sku-name'],
+            })
+        self.assertTrue(cfg_editor.normalized)
+        self.assertEqual(cfg_editor.cfg.to_primitive(), full_cfg_editor.cfg.to_primitive())
+
+        show_command = cfg_editor.find_command('databricks', 'workspace', 'show')
+        with mock.patch.object(type(show_command), 'reformat') as reformat:
+            cfg_editor.update_arg_by_var(*CMD_NAMES, arg_var='$Path.workspaceName', options=['workspace-name', 'n'])
+        # the other commands are not reformatted
+        reformat.assert_called_once_with()
@@ -0,0 +1,103 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from command.tests.common import WorkspaceTestCase
+from utils import exceptions
+from utils.file_writer import JournaledFileWriter, folder_lock
+
+WORKSPACE_NAMES = WorkspaceTestCase.WS_COMMAND_NAMES
+
+
+class WorkspaceSaveTest(WorkspaceTestCase):
+
+    CFG_FILE_NAMES = ("workspace-crud.xml", "vnet-peering-crud.xml")
+
+    def _update_options(self, manager, options):
+        leaf = manager.find_command_tree_leaf(*WORKSPACE_NAMES, 'create')
+        cfg_editor = manager.load_cfg_editor_by_command(leaf)
+        cfg_editor.update_arg_by_var(*leaf.names, arg_var='$Path.workspaceName', options=options)
+        return cfg_editor.resources[0]
+
+    def _find_options(self, manager):
+        leaf = manager.find_command_tree_leaf(*WORKSPACE_NAMES, 'create')
+        arg, _ = manager.load_cfg_editor_by_command(leaf).find_arg_by_var(*leaf.names, arg_var='$Path.workspaceName')
+        return arg.options
+
+    def _vnet_peering_resource(self, manager):
+        leaf = manager.find_command_tree_leaf(*WORKSPACE_NAMES, 'vnet-peering', 'create')
+        return leaf.resources[0].id, leaf.resources[0].version
+
+    def _list_folder(self):
+        return sorted(name for name in os.listdir(self.ws_folder) if name.startswith('.'))
+
+    def test_save(self):
+        self.assertEqual(self._list_folder(), [])
+        manager = self.load_manager()
+        resource = self._update_options(manager, ['ws-name'])
+        manager.remove_resource(*self._vnet_peering_resource(manager))
+        manager.save()
+        self.assertEqual(self._list_folder(), [])
+
+        manager = self.load_manager()
+        self.assertEqual(self._find_options(manager), ['ws-name'])
+        self.assertEqual([r.id for r in manager.get_resources()], [resource.id])
+
+    def test_recover_interrupted_save(self):
+        manager = self.load_manager()
+        version = manager.ws.version
+        self._update_options(manager, ['ws-name'])
+        with mock.patch.object(JournaledFileWriter, '_apply_journal', side_effect=OSError("interrupted")):
+            with self.assertRaises(OSError):
+                manager.save()
+        with open(os.path.join(self.ws_folder, JournaledFileWriter.JOURNAL_NAME), 'r', encoding='utf-8') as f:
+            journal = json.load(f)
+        # ws.json is committed last
+        self.assertEqual(journal['replaces'][-1][1], 'ws.json')
+
+        # the interrupted save is rolled forward when the workspace is loaded
+        manager = self.load_manager()
+        self.assertNotEqual(manager.ws.version, version)
+        self.assertEqual(self._find_options(manager), ['ws-name'])
+        self.assertEqual(self._list_folder(), [])
+
+    def test_concurrent_save(self):
+        barrier = threading.Barrier(4)
+
+        def _save(idx):
+            manager = self.load_manager()
+            self._update_options(manager, [f'ws-name-{idx}'])
+            barrier.wait()
+            try:
+                manager.save()
+            except exceptions.InvalidAPIUsage:
+                return None
+            return idx
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            saved = [idx for idx in executor.map(_save, range(4)) if idx is not None]
+        # only one of the saves from the same workspace version is committed
+        self.assertEqual(len(saved), 1)
+        self.assertEqual(self._find_options(self.load_manager()), [f'ws-name-{saved[0]}'])
+        self.assertEqual(self._list_folder(), [])
+
+    def test_rename_and_delete_wait_for_save(self):
+        manager = self.load_manager()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with folder_lock(self.ws_folder):
+                future = executor.submit(manager.rename, "new-ws")
+                # the folder is not renamed while a save holds the lock
+                self.assertRaises(TimeoutError, future.result, timeout=0.1)
+                self.assertTrue(os.path.exists(self.ws_folder))
+            future.result()
+            self.assertFalse(os.path.exists(self.ws_folder))
+            self.assertEqual(manager.ws.name, "new-ws")
+
+            with folder_lock(manager.folder):
+                future = executor.submit(manager.delete)
+                self.assertRaises(TimeoutError, future.result, timeout=0.1)
+                self.assertTrue(os.path.exists(manager.path))
+            self.assertTrue(future.result())
+            self.assertFalse(os.path.exists(manager.folder))
@@ -0,0 +1,115 @@
+import os
+import time
+
+from command.controller.workspace_cfg_editor import WorkspaceCfgEditor
+from command.controller.workspace_manager import WorkspaceManager
+from command.controller.workspace_session import WorkspaceSessionCache
+from command.tests.common import WorkspaceTestCase
+from utils import exceptions
+
+WORKSPACE_NAMES = WorkspaceTestCase.WS_COMMAND_NAMES
+
+
+class WorkspaceSessionCacheTest(WorkspaceTestCase):
+
+    CFG_FILE_NAMES = ("workspace-crud.xml", "workspace-list.xml", "vnet-peering-crud.xml")
+
+    def setUp(self):
+        super().setUp()
+        self.sessions = WorkspaceSessionCache(max_entries=4, idle_timeout=600)
+
+    @staticmethod
+    def _load_cfg_editor(manager, *cmd_names):
+        return manager.load_cfg_editor_by_command(manager.find_command_tree_leaf(*WORKSPACE_NAMES, *cmd_names))
+
+    def test_reuse_session(self):
+        manager = self.sessions.checkout("ws")
+        cfg_editor = self._load_cfg_editor(manager, 'create')
+        self.sessions.checkin(manager)
+
+        self.assertIs(self.sessions.checkout("ws"), manager)
+        self.assertIs(self._load_cfg_editor(manager, 'show'), cfg_editor)
+        cfg_editor.update_arg_by_var(*WORKSPACE_NAMES, 'create', arg_var='$Path.workspaceName', options=['ws-name'])
+        manager.save()
+        self.sessions.checkin(manager)
+
+        # the saved cfg editor is kept in session
+        manager = self.sessions.checkout("ws")
+        self.assertIs(self._load_cfg_editor(manager, 'create'), cfg_editor)
+        arg, _ = WorkspaceManager("ws").load_cfg_editor_by_resource(
+            cfg_editor.resources[0].id, cfg_editor.resources[0].version
+        ).find_arg_by_var(*WORKSPACE_NAMES, 'create', arg_var='$Path.workspaceName')
+        self.assertEqual(arg.options, ['ws-name'])
+        self.assertEqual(self.sessions.get_stats()['misses'], 1)
+        self.assertEqual(self.sessions.get_stats()['hits'], 2)
+
+    def test_concurrent_modification(self):
+        manager = self.sessions.checkout("ws")
+        other_manager = self.sessions.checkout("ws")
+        self.assertIsNot(manager, other_manager)
+
+        other_manager.update_command_tree_leaf_help(*WORKSPACE_NAMES, 'show', help={"short": "Show a workspace."})
+        other_manager.save()
+        self.sessions.checkin(other_manager)
+
+        # the outdated manager is rejected by save and dropped by checkin as it's not saved
+        manager.update_command_tree_leaf_help(*WORKSPACE_NAMES, 'show', help={"short": "Get a workspace."})
+        with self.assertRaises(exceptions.InvalidAPIUsage):
+            manager.save()
+        self.sessions.checkin(manager)
+        self.assertIs(self.sessions.checkout("ws"), other_manager)
+        self.assertEqual(self.sessions.get_stats()['dirtyDrops'], 1)
+
+    def test_drop_dirty_session(self):
+        manager = self.sessions.checkout("ws")
+        self.assertFalse(manager.is_dirty)
+        manager.update_command_tree_leaf_help(*WORKSPACE_NAMES, 'show', help={"short": "Get a workspace."})
+        self.assertTrue(manager.is_dirty)
+        self.sessions.checkin(manager)
+        self.assertIsNot(self.sessions.checkout("ws"), manager)
+
+        # the modification in cfg editor is detected as well
+        manager = self.sessions.checkout("ws")
+        cfg_editor = self._load_cfg_editor(manager, 'create')
+        self.assertFalse(manager.is_dirty)
+        cfg_editor.update_arg_by_var(*WORKSPACE_NAMES, 'create', arg_var='$Path.workspaceName', options=['ws-name'])
+        self.assertTrue(manager.is_dirty)
+        self.sessions.checkin(manager)
+        self.assertIsNot(self.sessions.checkout("ws"), manager)
+        self.assertEqual(self.sessions.get_stats()['dirtyDrops'], 2)
+
+        # the saved manager is kept
+        manager = self.sessions.checkout("ws")
+        cfg_editor = self._load_cfg_editor(manager, 'create')
+        cfg_editor.update_arg_by_var(*WORKSPACE_NAMES, 'create', arg_var='$Path.workspaceName', options=['ws-name'])
+        manager.save()
+        self.assertFalse(manager.is_dirty)
+        self.sessions.checkin(manager)
+        self.assertIs(self.sessions.checkout("ws"), manager)
+
+    def test_modified_files(self):
+        manager = self.sessions.checkout("ws")
+        cfg_editor = self._load_cfg_editor(manager, 'create')
+        peering_cfg_editor = self._load_cfg_editor(manager, 'vnet-peering', 'create')
+        self.sessions.checkin(manager)
+
+        path = WorkspaceCfgEditor.get_cfg_path(manager.folder, peering_cfg_editor.resources[0].id)
+        mtime = time.time() + 10
+        os.utime(path, (mtime, mtime))
+        manager = self.sessions.checkout("ws")
+        # only the cfg editor of the modified file is loaded again
+        self.assertIs(self._load_cfg_editor(manager, 'create'), cfg_editor)
+        self.assertIsNot(self._load_cfg_editor(manager, 'vnet-peering', 'create'), peering_cfg_editor)
+        self.sessions.checkin(manager)
+
+        os.utime(manager.path, (mtime, mtime))
+        self.assertIsNot(self.sessions.checkout("ws"), manager)
+        self.assertEqual(self.sessions.get_stats()['invalidations'], 1)
+
+    def test_evict_idle_session(self):
+        sessions = WorkspaceSessionCache(max_entries=4, idle_timeout=0)
+        manager = sessions.checkout("ws")
+        sessions.checkin(manager)
+        time.sleep(0.01)
+        self.assertIsNot(sessions.checkout("ws"), manager)
+        self.assertEqual(sessions.get_stats()['idleEvictions'], 1)
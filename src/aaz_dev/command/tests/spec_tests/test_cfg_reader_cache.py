@@ -0,0 +1,77 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+
+from command.controller.cfg_reader import ReadOnlyCfgReader
+from command.controller.cfg_reader_cache import CfgReaderCache
+from command.model.configuration import CMDConfiguration, XMLSerializer
+
+CFG_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'cli', 'tests', 'aaz_generator_tests', 'databricks',
+    'workspace-crud.xml')
+
+
+class CfgReaderCacheTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        with open(CFG_PATH, 'r', encoding='utf-8') as f:
+            cfg = XMLSerializer.from_xml(CMDConfiguration, f.read())
+        self.data = cfg.to_primitive()
+        self.json_paths = []
+        for idx in range(3):
+            json_path = os.path.join(self.folder, f"{idx}.json")
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f)
+            self.json_paths.append(json_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_load(self):
+        cache = CfgReaderCache(max_entries=2)
+        reader = cache.load(self.json_paths[0])
+        self.assertIsInstance(reader, ReadOnlyCfgReader)
+        self.assertIs(cache.load(self.json_paths[0]), reader)
+        self.assertEqual(cache.get_stats()['hits'], 1)
+
+        # modified file is reloaded
+        mtime = time.time() + 10
+        os.utime(self.json_paths[0], (mtime, mtime))
+        self.assertIsNot(cache.load(self.json_paths[0]), reader)
+        self.assertEqual(cache.get_stats()['invalidations'], 1)
+
+        # the least recently used entry is evicted
+        cache.load(self.json_paths[1])
+        cache.load(self.json_paths[0])
+        cache.load(self.json_paths[2])
+        stats = cache.get_stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(set(cache._entries.keys()), {self.json_paths[0], self.json_paths[2]})
+
+    def test_disabled(self):
+        cache = CfgReaderCache(max_entries=0)
+        reader = cache.load(self.json_paths[0])
+        self.assertIsNot(cache.load(self.json_paths[0]), reader)
+        self.assertEqual(cache.get_stats()['entries'], 0)
+
+    def test_prefetch(self):
+        cache = CfgReaderCache(max_entries=3)
+        reader = cache.load(self.json_paths[0])
+        cache.prefetch([*self.json_paths, self.json_paths[1]], jobs=2)
+        # the cached file is not parsed again
+        self.assertEqual(cache.get_stats()['prefetches'], 2)
+        self.assertIs(cache.load(self.json_paths[0]), reader)
+        prefetched = cache.load(self.json_paths[1])
+        self.assertEqual(cache.get_stats()['hits'], 2)
+        self.assertEqual(prefetched.cfg.to_primitive(), self.data)
+
+        # no more than max_entries files are prefetched
+        cache = CfgReaderCache(max_entries=2)
+        cache.prefetch(self.json_paths, jobs=2)
+        self.assertEqual(cache.get_stats()['prefetches'], 2)
+        self.assertEqual(set(cache._entries.keys()), set(self.json_paths[:2]))
@@ -1,8 +1,13 @@
+import glob
 import os
+import random
+import timeit
 import unittest
 
 from command.controller.command_tree import CMDSpecsPartialCommand, CMDSpecsPartialCommandGroup, \
     CMDSpecsPartialCommandTree, build_simple_command_tree
+from command.model.configuration import CMDHelp, CMDCommandExample
+from command.model.specs import CMDSpecsCommand, CMDSpecsCommandVersion, CMDSpecsResource
 from command.templates import get_templates
 
 COMMAND_INFO = """# [Command] _vm deallocate_
@@ -285,3 +290,121 @@ class CommandTreeTest(unittest.TestCase):
         aaz_folder = os.getenv("AAZ_FOLDER")
         simple_tree = build_simple_command_tree(aaz_folder)
         self.assertGreater(len(simple_tree.root.command_groups), 0)
+
+    @staticmethod
+    def _render_command(version_count, example_count, long_help=True, subresource=False):
+        command = CMDSpecsCommand()
+        command.names = ["vm", "deallocate"]
+        command.help = CMDHelp()
+        command.help.short = "Deallocate a VM."
+        if long_help:
+            command.help.lines = ["For an end-to-end tutorial, see https://docs.microsoft.com ", "Test Second Line"]
+        command.versions = []
+        for idx in range(version_count):
+            version = CMDSpecsCommandVersion()
+            version.name = f"20{10 + idx}-01-01" + ("-preview" if idx % 3 == 1 else "")
+            version.stage = ["Stable", "Preview", "Experimental"][idx % 3]
+            version.resources = [CMDSpecsResource({
+                "plane": "mgmt-plane",
+                "id": f"/subscriptions/{{}}/resourcegroups/{{}}/providers/microsoft.compute/virtualmachines/{{}}/r{r}",
+                "version": version.name,
+                "subresource": "properties.items[]" if subresource else None,
+            }) for r in range(1 + idx % 2)]
+            version.examples = [CMDCommandExample({
+                "name": f"Example {e} of version {version.name}.",
+                "commands": [f"vm deallocate -g MyResourceGroup -n MyVm{c}" for c in range(1 + e % 3)],
+            }) for e in range(example_count)]
+            command.versions.append(version)
+        return get_templates()["command"].render(command=command)
+
+    def _assert_parsers_equivalent(self, info):
+        names = ["vm", "deallocate"]
+        expected = CMDSpecsPartialCommand.parse_command_info_by_regex(info, names)
+        command = CMDSpecsPartialCommand.parse_command_info(info, names)
+        if expected is None:
+            self.assertIsNone(command)
+        else:
+            self.assertEqual(command.to_primitive(), expected.to_primitive())
+
+    def test_parse_command_equivalent_to_regex(self):
+        corpus = [COMMAND_INFO]
+        with open(os.path.join(os.path.dirname(__file__), "_command.md"), 'r', encoding='utf-8') as f:
+            corpus.append(f.read())
+        for version_count, example_count in ((1, 0), (1, 1), (3, 2), (6, 5)):
+            corpus.append(self._render_command(version_count, example_count))
+            corpus.append(self._render_command(version_count, example_count, long_help=False, subresource=True))
+        for info in corpus:
+            self._assert_parsers_equivalent(info)
+            self.assertIsNotNone(CMDSpecsPartialCommand.parse_command_info(info, ["vm", "deallocate"]))
+
+        # invalid markdowns
+        for info in (
+                "",
+                COMMAND_INFO.replace("# [Command]", "# [Group]"),
+                COMMAND_INFO.split("## Versions")[0],
+                COMMAND_INFO.split("### [")[0],
+                COMMAND_INFO.replace("\n\n<!-- mgmt-plane", "\n<!-- mgmt-plane", 1),
+                COMMAND_INFO.replace("\n\n## Versions", "\n## Versions"),
+        ):
+            self._assert_parsers_equivalent(info)
+
+    def test_parse_mutated_commands(self):
+        """The line parser is the same as the regex parser except for the leniency pinned below."""
+        names = ["vm", "deallocate"]
+        corpus = [COMMAND_INFO]
+        for version_count, example_count in ((1, 0), (1, 1), (3, 2)):
+            corpus.append(self._render_command(version_count, example_count))
+            corpus.append(self._render_command(version_count, example_count, long_help=False, subresource=True))
+        fragments = ["", "#", "## Versions", "### [2020-01-01](/x) **Stable**", "<!-- a b c -->", "<!-- x -->",
+                     "#### examples", "- example", "    ```bash", "        vm deallocate", "    ```", "text"]
+        rnd = random.Random(0)
+        for _ in range(1000):
+            lines = rnd.choice(corpus).split('\n')
+            for _ in range(rnd.randint(1, 3)):
+                op, idx = rnd.randrange(5), rnd.randrange(len(lines))
+                if op == 0 and len(lines) > 1:
+                    del lines[idx]
+                elif op == 1:
+                    lines.insert(idx, rnd.choice(fragments))
+                elif op == 2:
+                    lines.insert(idx, rnd.choice(lines))
+                elif op == 3:
+                    lines[idx] = lines[idx][:rnd.randrange(len(lines[idx]) + 1)]
+                else:
+                    other = rnd.randrange(len(lines))
+                    lines[idx], lines[other] = lines[other], lines[idx]
+            info = '\n'.join(lines)
+
+            expected = CMDSpecsPartialCommand.parse_command_info_by_regex(info, names)
+            command = CMDSpecsPartialCommand.parse_command_info(info, names)
+            if expected is not None and command is not None:
+                self.assertEqual(command.to_primitive(), expected.to_primitive())
+            elif expected is not None:
+                # the regex parser takes the headings after blank lines as the long help, the line parser rejects them
+                self.assertTrue(any(('\n' + line).find('\n#') >= 0 for line in expected.help.lines or []), info)
+            elif command is not None:
+                # the line parser skips the invalid lines and versions after the first version, and the extra blank
+                # lines before the versions title, the command parsed is still rendered and parsed back as it is
+                rendered = get_templates()["command"].render(command=command)
+                self.assertEqual(
+                    CMDSpecsPartialCommand.parse_command_info_by_regex(rendered, names).to_primitive(),
+                    command.to_primitive(), info)
+
+    @unittest.skipIf(os.getenv("AAZ_FOLDER") is None, "No AAZ_FOLDER environment variable set")
+    def test_parse_aaz_commands_equivalent_to_regex(self):
+        aaz_folder = os.getenv("AAZ_FOLDER")
+        for file_path in glob.iglob(os.path.join(aaz_folder, "Commands", "**", "_*.md"), recursive=True):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                self._assert_parsers_equivalent(f.read())
+
+    @unittest.skipIf(os.getenv("AAZ_BENCHMARK") is None, "No AAZ_BENCHMARK environment variable set")
+    def test_parse_command_benchmark(self):
+        info = self._render_command(version_count=30, example_count=8)
+        names = ["vm", "deallocate"]
+        regex_time = min(timeit.repeat(
+            lambda: CMDSpecsPartialCommand.parse_command_info_by_regex(info, names), number=20, repeat=5))
+        line_time = min(timeit.repeat(
+            lambda: CMDSpecsPartialCommand.parse_command_info(info, names), number=20, repeat=5))
+        print(f"parse command info: regex {regex_time * 50:.2f}ms, lines {line_time * 50:.2f}ms, "
+              f"speedup {regex_time / line_time:.1f}x")
+        self.assertLess(line_time, regex_time)
@@ -0,0 +1,138 @@
+import copy
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from command.controller.command_tree import CMDSpecsPartialCommandTree
+from command.controller.command_tree_cache import CMDSpecsCommandTreeCache
+from command.model.configuration import CMDHelp
+
+TREE_INFO = """# Atomic Azure CLI Commands
+
+## Groups
+
+- [edge-order](/Commands/edge-order/readme.md)
+: Manage edge order.
+"""
+
+GROUP_INFO = """# [Group] _edge-order_
+
+Manage edge order.
+
+## Commands
+
+- [list](/Commands/edge-order/_list.md)
+: List orders.
+
+- [show](/Commands/edge-order/_show.md)
+: Show an order.
+"""
+
+COMMAND_INFO = """# [Command] _edge-order {name}_
+
+{short_help}
+
+## Versions
+
+### [2021-12-01](/Resources/mgmt-plane/L3N1YnNjcmlwdGlvbnMve30vcHJvdmlkZXJzL21pY3Jvc29mdC5lZGdlb3JkZXIvb3JkZXJz/2021-12-01.xml) **Stable**
+
+<!-- mgmt-plane /subscriptions/{{}}/providers/microsoft.edgeorder/orders 2021-12-01 -->
+
+"""
+
+
+class CMDSpecsCommandTreeCacheTest(TestCase):
+
+    def setUp(self):
+        self.aaz_path = tempfile.mkdtemp()
+        self.group_folder = os.path.join(self.aaz_path, "Commands", "edge-order")
+        os.makedirs(self.group_folder)
+        self._write(os.path.join(self.aaz_path, "Commands", "readme.md"), TREE_INFO)
+        self._write(os.path.join(self.group_folder, "readme.md"), GROUP_INFO)
+        for name in ("list", "show"):
+            self._write(
+                os.path.join(self.group_folder, f"_{name}.md"),
+                COMMAND_INFO.format(name=name, short_help=f"{name.capitalize()} orders."))
+        self.cache = CMDSpecsCommandTreeCache(max_entries=10)
+
+    def tearDown(self):
+        shutil.rmtree(self.aaz_path)
+
+    @staticmethod
+    def _write(path, data, mtime=None):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_share_nodes_across_trees(self):
+        tree = CMDSpecsPartialCommandTree(self.aaz_path, cache=self.cache)
+        command = tree.find_command('edge-order', 'list')
+        self.assertEqual(command.help.short, "List orders.")
+        self.assertEqual(self.cache.get_stats()['misses'], 3)
+
+        other_tree = CMDSpecsPartialCommandTree(self.aaz_path, cache=self.cache)
+        self.assertIs(other_tree.find_command('edge-order', 'list'), command)
+        self.assertEqual(self.cache.get_stats()['misses'], 3)
+
+        with self.assertRaises(ValueError):
+            other_tree.create_command('edge-order', 'create')
+
+    def test_invalidate_modified_node(self):
+        tree = CMDSpecsPartialCommandTree(self.aaz_path, cache=self.cache)
+        group = tree.find_command_group('edge-order')
+        show = tree.find_command('edge-order', 'show')
+        self.assertEqual(tree.find_command('edge-order', 'list').help.short, "List orders.")
+
+        self._write(
+            os.path.join(self.group_folder, "_list.md"),
+            COMMAND_INFO.format(name="list", short_help="List all orders."), mtime=time.time() + 10)
+        self.assertEqual(tree.find_command('edge-order', 'list').help.short, "List all orders.")
+        # the nodes of unmodified files are not reloaded
+        self.assertIs(tree.find_command_group('edge-order'), group)
+        self.assertIs(tree.find_command('edge-order', 'show'), show)
+        self.assertEqual(self.cache.get_stats()['invalidations'], 1)
+
+    def test_load_in_threads(self):
+        def find_command(name):
+            return CMDSpecsPartialCommandTree(self.aaz_path, cache=self.cache).find_command('edge-order', name)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            commands = list(executor.map(find_command, ["list", "show"] * 8))
+        self.assertEqual([c.names for c in commands], [['edge-order', 'list'], ['edge-order', 'show']] * 8)
+        self.assertEqual(self.cache.get_stats()['entries'], 4)
+
+    def test_readonly_tree_not_modify_nodes(self):
+        tree = CMDSpecsPartialCommandTree(self.aaz_path, cache=self.cache)
+        for _ in tree.iter_commands():
+            pass
+        nodes = {path: copy.deepcopy(entry[1].to_primitive()) for path, entry in list(self.cache._entries.items())}
+
+        # the read only consumers only read the nodes
+        tree.find_command_group('edge-order').to_primitive()
+        tree.find_command('edge-order', 'list').to_primitive()
+        for group in tree.iter_command_groups():
+            group.to_primitive()
+        ws_node = CMDSpecsPartialCommandTree(self.aaz_path).find_command_group('edge-order')
+        ws_node.help = CMDHelp({"short": "Modified."})
+        ws_leaf = CMDSpecsPartialCommandTree(self.aaz_path).find_command('edge-order', 'list')
+        ws_leaf.version = ws_leaf.versions[0].name
+
+        # and the methods which modify nodes are rejected
+        for modify in (
+                lambda: tree.create_command_group('edge-order', 'order'),
+                lambda: tree.update_command_group_by_ws(ws_node),
+                lambda: tree.delete_command_group('edge-order'),
+                lambda: tree.create_command('edge-order', 'create'),
+                lambda: tree.delete_command('edge-order', 'list'),
+                lambda: tree.delete_command_version('edge-order', 'list', version='2021-12-01'),
+                lambda: tree.update_command_version('edge-order', 'list', plane='mgmt-plane', cfg_cmd=None),
+                lambda: tree.update_command_by_ws(ws_leaf),
+        ):
+            with self.assertRaises(ValueError):
+                modify()
+        self.assertEqual(
+            {path: entry[1].to_primitive() for path, entry in list(self.cache._entries.items())}, nodes)
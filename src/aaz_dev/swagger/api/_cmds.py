@@ -3,6 +3,8 @@ import logging
 from flask import Blueprint
 import os
 import json
+import sys
+import time
 
 from utils.config import Config
 
@@ -11,6 +13,12 @@ logger = logging.getLogger('backend')
 bp = Blueprint('swagger-cmds', __name__, url_prefix='/Swagger/CMDs', cli_group="swagger")
 bp.cli.short_help = "Manage azure-rest-api-specs/azure-rest-api-specs-pr repos."
 
+
+def _init_scan_worker(log_level):
+    # keep the log level of parent process in the worker processes
+    logger.setLevel(level=log_level)
+
+
 @bp.cli.command("export-resources", short_help="Export all control plane resources in swagger repo")
 @click.option(
     "--swagger-path", '-s',
@@ -26,9 +34,16 @@ bp.cli.short_help = "Manage azure-rest-api-specs/azure-rest-api-specs-pr repos."
     type=click.Path(file_okay=True, dir_okay=False, resolve_path=True),
     help="The file name for result output",
 )
-def export_swagger_control_plane_resources(output_file):
+@click.option(
+    "--jobs", '-j',
+    type=click.IntRange(min=1),
+    default=1,
+    help="The number of processes to parse swagger files in parallel.",
+)
+def export_swagger_control_plane_resources(output_file, jobs):
     logger.setLevel(level=logging.CRITICAL)
     from swagger.controller.specs_manager import SwaggerSpecsManager
+    from swagger.model.specs import OpenAPIResourceProvider
     from utils.plane import PlaneEnum
 
     if output_file and os.path.exists(output_file):
@@ -37,17 +52,32 @@ def export_swagger_control_plane_resources(output_file):
             print("Exit without overriding.")
             return
 
+    executor = None
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_scan_worker, initargs=(logger.level,))
+
     result = {}
     swagger_specs = SwaggerSpecsManager()
-    for module in swagger_specs.get_modules(PlaneEnum.Mgmt):
-        for rp in module.get_resource_providers():
-            if rp.name.lower() not in result:
-                result[rp.name.lower()] = {}
-            resource_map = result[rp.name.lower()]
-            for resource_id, version_map in rp.get_resource_map().items():
-                if resource_id not in resource_map:
-                    resource_map[resource_id] = set()
-                resource_map[resource_id].update([version for version in version_map])
+    try:
+        for module in swagger_specs.get_modules(PlaneEnum.Mgmt):
+            start = time.perf_counter()
+            resource_count = 0
+            for rp in module.get_resource_providers():
+                if not isinstance(rp, OpenAPIResourceProvider):
+                    continue
+                if rp.name.lower() not in result:
+                    result[rp.name.lower()] = {}
+                resource_map = result[rp.name.lower()]
+                for resource_id, version_map in rp.get_resource_map(executor=executor).items():
+                    if resource_id not in resource_map:
+                        resource_map[resource_id] = set()
+                    resource_map[resource_id].update([version for version in version_map])
+                    resource_count += 1
+            print(f"{module}: {resource_count} resources in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    finally:
+        if executor is not None:
+            executor.shutdown()
     for rp, resource_map in result.items():
         for resource in resource_map:
             assert None not in resource_map[resource]
@@ -59,3 +89,66 @@ def export_swagger_control_plane_resources(output_file):
         with open(output_file, 'w') as f:
             json.dump(result, f, ensure_ascii=True, sort_keys=True, indent=2)
         print(f'Export output in {output_file} success.')
+
+
+@bp.cli.command("build-resource-index", short_help="Build and verify the persistent resource index of swagger repo")
+@click.option(
+    "--swagger-path", '-s',
+    type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
+    default=Config.SWAGGER_PATH,
+    required=not Config.SWAGGER_PATH,
+    callback=Config.validate_and_setup_swagger_path,
+    expose_value=False,
+    help="The local path of azure-rest-api-specs repo. Official repo is https://github.com/Azure/azure-rest-api-specs"
+)
+@click.option(
+    "--verify", is_flag=True, default=False,
+    help="Verify the indexed resources by parsing all swagger files again."
+)
+def build_swagger_resource_index(verify):
+    logger.setLevel(level=logging.CRITICAL)
+    from swagger.controller.specs_manager import SwaggerSpecsManager
+    from swagger.model.specs import OpenAPIResourceProvider
+    from swagger.model.specs._resource_index import get_swagger_resource_index
+    from swagger.model.specs._resource_provider import extract_resource_entries
+    from utils.plane import PlaneEnum
+
+    index = get_swagger_resource_index()
+    if index is None:
+        print("Swagger resource index is disabled.")
+        sys.exit(1)
+
+    swagger_specs = SwaggerSpecsManager()
+    file_paths = set()
+    mismatched_files = []
+    for plane in (PlaneEnum.Mgmt, PlaneEnum._Data):
+        for module in swagger_specs.get_modules(plane):
+            for rp in module.get_resource_providers():
+                if not isinstance(rp, OpenAPIResourceProvider):
+                    continue
+                rp_file_paths = [*rp.iter_swagger_file_paths()]
+                file_paths.update(rp_file_paths)
+                # the files which are not indexed will be parsed and saved in index
+                rp.get_resource_map()
+                if not verify:
+                    continue
+                for file_path in rp_file_paths:
+                    entries = index.get(file_path, index.get_file_key(file_path))
+                    if entries != extract_resource_entries(file_path, label=str(rp)):
+                        mismatched_files.append(file_path)
+
+    # remove the files which are not exist in swagger repo
+    root = Config.SWAGGER_PATH + os.sep
+    removed_file_paths = [
+        file_path for file_path in index.iter_file_paths()
+        if file_path.startswith(root) and file_path not in file_paths
+    ]
+    index.remove(removed_file_paths)
+
+    print(f"Indexed {len(file_paths)} swagger files in {index.db_path}, removed {len(removed_file_paths)} outdated files.")
+    if verify:
+        for file_path in mismatched_files:
+            print(f"Mismatched: {file_path}")
+        if mismatched_files:
+            sys.exit(1)
+        print("Verified.")
@@ -37,7 +37,7 @@ def get_path_stat(path):
 # modules
 @bp.route("/<plane>", methods=("GET",))
 def get_modules_by(plane):
-    specs_manager = SwaggerSpecsManager()
+    specs_manager = SwaggerSpecsManager.get_shared()
     result = []
     for module in specs_manager.get_modules(plane):
         m = {
@@ -51,7 +51,7 @@ def get_modules_by(plane):
 
 @bp.route("/<plane>/<list_path:mod_names>", methods=("GET",))
 def get_module(plane, mod_names):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     module = specs_module_manager.module
     result = {
         "url": url_for('swagger.get_module', plane=plane, mod_names=mod_names),
@@ -75,7 +75,7 @@ def get_module(plane, mod_names):
 def get_resource_providers_by(plane, mod_names):
     # get query param type in request
     rp_type = request.args.get('type', None)
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     result = []
     for rp in specs_module_manager.get_resource_providers():
         if isinstance(rp, OpenAPIResourceProvider):
@@ -102,7 +102,7 @@ def get_resource_providers_by(plane, mod_names):
 # TODO: may need to add OpenAPI segment in the url
 @bp.route("/<plane>/<list_path:mod_names>/ResourceProviders/<rp_name>", methods=("GET",))
 def get_openapi_resource_provider(plane, mod_names, rp_name):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     rp = specs_module_manager.get_openapi_resource_provider(rp_name)
     result = {
         "url": url_for('swagger.get_openapi_resource_provider', plane=plane, mod_names=mod_names, rp_name=rp.name),
@@ -137,7 +137,7 @@ def get_openapi_resource_provider(plane, mod_names, rp_name):
 
 @bp.route("/<plane>/<list_path:mod_names>/ResourceProviders/<rp_name>/TypeSpec", methods=("GET",))
 def get_typespec_resource_provider(plane, mod_names, rp_name):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     rp = specs_module_manager.get_typespec_resource_provider(rp_name)
     result = {
         "url": url_for('swagger.get_typespec_resource_provider', plane=plane, mod_names=mod_names, rp_name=rp.name),
@@ -151,7 +151,7 @@ def get_typespec_resource_provider(plane, mod_names, rp_name):
 # resources
 @bp.route("/<plane>/<list_path:mod_names>/ResourceProviders/<rp_name>/Resources", methods=("GET",))
 def get_resources_by(plane, mod_names, rp_name):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     result = []
     rp = specs_module_manager.get_openapi_resource_provider(rp_name)
     resource_op_group_map = specs_module_manager.get_grouped_resource_map(rp_name)
@@ -183,7 +183,7 @@ def get_resources_by(plane, mod_names, rp_name):
 @bp.route("/<plane>/<list_path:mod_names>/ResourceProviders/<rp_name>/Resources/<base64:resource_id>",
           methods=("GET",))
 def get_resource_in_rp(plane, mod_names, rp_name, resource_id):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     version_map = specs_module_manager.get_resource_version_map(resource_id, rp_name)
     rp = list(version_map.values())[0].resource_provider
     op_group_name = specs_module_manager.get_resource_op_group_name(version_map)
@@ -210,7 +210,7 @@ def get_resource_in_rp(plane, mod_names, rp_name, resource_id):
 
 @bp.route("/<plane>/<list_path:mod_names>/Resources/<base64:resource_id>", methods=("GET",))
 def get_resource_in_module(plane, mod_names, resource_id):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     version_map = specs_module_manager.get_resource_version_map(resource_id)
     rp = list(version_map.values())[0].resource_provider
     op_group_name = specs_module_manager.get_resource_op_group_name(version_map)
@@ -241,7 +241,7 @@ def get_resource_in_module(plane, mod_names, resource_id):
     methods=("GET",)
 )
 def get_resource_version_in_rp(plane, mod_names, rp_name, resource_id, version):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     resource = specs_module_manager.get_resource_in_version(rp_name, resource_id, version)
     result = {
         "url": url_for('swagger.get_resource_version_in_rp',
@@ -258,7 +258,7 @@ def get_resource_version_in_rp(plane, mod_names, rp_name, resource_id, version):
 
 @bp.route("/<plane>/<list_path:mod_names>/Resources/<base64:resource_id>/V/<base64:version>", methods=("GET",))
 def get_resource_version_in_module(plane, mod_names, resource_id, version):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     resource = specs_module_manager.get_resource_in_version(resource_id, version)
     result = {
         "url": url_for('swagger.get_resource_version_in_rp',
@@ -0,0 +1,231 @@
+import json
+import multiprocessing
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import click
+
+if __package__ in (None, ''):
+    # make the sources root importable when this file is executed directly
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from command.model.configuration import CMDBuildInVariants
+from swagger.benchmarks.spec_generator import SyntheticSpecsGenerator
+from swagger.controller.command_generator import SwaggerCommandGenerator
+from swagger.model.specs import SwaggerSpecs, OpenAPIResourceProvider, SwaggerLoader
+from utils.config import Config
+from utils.plane import PlaneEnum
+
+try:
+    import resource
+except ImportError:  # windows
+    resource = None
+
+
+# ---------------------------------------------------------------------------
+# stages: setup(specs_path) returns the state passed to run(state), only run is measured
+# ---------------------------------------------------------------------------
+
+def _get_resource_providers(specs_path):
+    specs = SwaggerSpecs(folder_path=specs_path)
+    return [
+        rp for module in specs.get_mgmt_plane_modules(plane=PlaneEnum.Mgmt)
+        for rp in module.get_resource_providers() if isinstance(rp, OpenAPIResourceProvider)
+    ]
+
+
+def _get_swagger_file_paths(specs_path):
+    return [file_path for rp in _get_resource_providers(specs_path) for file_path in rp.iter_swagger_file_paths()]
+
+
+def _run_specs_discovery(specs_path):
+    _get_resource_providers(specs_path)
+
+
+def _run_resource_map(rps):
+    for rp in rps:
+        rp.get_resource_map()
+
+
+def _run_load_and_link(file_paths, lazy=False):
+    for file_path in file_paths:
+        loader = SwaggerLoader(lazy=lazy)
+        swagger = loader.load_file(file_path)
+        loader.link_swaggers()
+        if lazy:
+            for key in ('paths', 'x_ms_paths'):
+                for path in (getattr(swagger, key) or {}):
+                    loader.link_path_item(file_path, path)
+
+
+def _setup_command_generation(specs_path):
+    generator = SwaggerCommandGenerator()
+    resources = []
+    for rp in _get_resource_providers(specs_path):
+        for version_map in rp.get_resource_map().values():
+            resources.extend(version_map.values())
+    generator.load_resources(resources)
+    # link the path items before measurement, so that only the command building is measured
+    for swagger_resource in resources:
+        generator.get_path_item(swagger_resource)
+    return generator, resources
+
+
+def _run_command_generation(state):
+    generator, resources = state
+    for swagger_resource in resources:
+        generator.create_draft_command_group(swagger_resource, instance_var=CMDBuildInVariants.Instance)
+
+
+STAGES = {
+    "specsDiscovery": (lambda specs_path: specs_path, _run_specs_discovery),
+    "resourceMap": (_get_resource_providers, _run_resource_map),
+    "loadAndLink": (_get_swagger_file_paths, _run_load_and_link),
+    "loadAndLinkLazy": (_get_swagger_file_paths, lambda file_paths: _run_load_and_link(file_paths, lazy=True)),
+    "commandGeneration": (_setup_command_generation, _run_command_generation),
+}
+
+
+# ---------------------------------------------------------------------------
+# measurement
+# ---------------------------------------------------------------------------
+
+def _disable_caches():
+    # measure the cold path of every stage
+    Config.SWAGGER_RESOURCE_INDEX = False
+    Config.SWAGGER_CACHE_MAX_SIZE = 0
+
+
+def _measure_stage(name, specs_path, trace_memory):
+    """Run the stage once in the current process, which is a fresh child process of the runner."""
+    _disable_caches()
+    setup, run = STAGES[name]
+    state = setup(specs_path)
+    result = {}
+    if trace_memory:
+        tracemalloc.start()
+        run(state)
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        result["tracedPeak"] = peak
+        result["allocatedBlocks"] = sum(stat.count for stat in snapshot.statistics('filename'))
+    else:
+        start = time.perf_counter()
+        run(state)
+        result["wallTime"] = time.perf_counter() - start
+        if resource is not None:
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ru_maxrss is in bytes on macOS and in kilobytes on linux
+            result["peakRss"] = max_rss if sys.platform == 'darwin' else max_rss * 1024
+    return result
+
+
+def _get_mp_context():
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context('spawn')
+
+
+def run_benchmarks(specs_path, stages=None, repeat=3):
+    """Run the stages in fresh processes, return {stage: metrics}.
+
+    The wall time and peak RSS are the medians of `repeat` runs, the traced memory peak and allocated blocks
+    are measured in one extra run with tracemalloc, because tracing slows down the execution.
+    """
+    results = {}
+    ctx = _get_mp_context()
+    for name in stages or STAGES:
+        runs = []
+        with ctx.Pool(processes=1, maxtasksperchild=1) as pool:
+            for _ in range(repeat):
+                runs.append(pool.apply(_measure_stage, (name, specs_path, False)))
+            traced = pool.apply(_measure_stage, (name, specs_path, True))
+        metrics = {
+            "wallTime": statistics.median(r["wallTime"] for r in runs),
+        }
+        if all("peakRss" in r for r in runs):
+            metrics["peakRss"] = int(statistics.median(r["peakRss"] for r in runs))
+        metrics.update(traced)
+        results[name] = metrics
+    return results
+
+
+def compare_results(results, baseline, max_regression, metrics=("wallTime", "tracedPeak")):
+    """Return the list of regressions which exceed max_regression (0.2 means 20% slower or larger)."""
+    regressions = []
+    for name, stage_metrics in results.items():
+        base_metrics = baseline.get(name, None)
+        if not base_metrics:
+            continue
+        for metric in metrics:
+            value = stage_metrics.get(metric, None)
+            base_value = base_metrics.get(metric, None)
+            if not value or not base_value:
+                continue
+            ratio = value / base_value - 1
+            if ratio > max_regression:
+                regressions.append((name, metric, base_value, value, ratio))
+    return regressions
+
+
+def _format_size(value):
+    return f"{value / 1024 / 1024:.1f}MB" if value is not None else "-"
+
+
+@click.command("benchmark", short_help="Benchmark the swagger to command model pipeline with a synthetic spec repo.")
+@click.option("--rp-count", type=click.IntRange(min=1), default=4, help="The number of resource providers.")
+@click.option("--version-count", type=click.IntRange(min=1), default=3, help="The api-versions of each resource provider.")
+@click.option("--resource-count", type=click.IntRange(min=1), default=5, help="The resources of each api-version.")
+@click.option("--ref-depth", type=click.IntRange(min=1), default=5, help="The depth of $ref chain in resource definitions.")
+@click.option("--stage", "stages", multiple=True, type=click.Choice(list(STAGES)), help="The stages to run, all by default.")
+@click.option("--repeat", type=click.IntRange(min=1), default=3, help="The runs of each stage, the median is reported.")
+@click.option("--output", "-o", type=click.Path(dir_okay=False, writable=True), help="Save the results in json file.")
+@click.option("--baseline", "-b", type=click.Path(exists=True, dir_okay=False), help="The results to compare with.")
+@click.option(
+    "--max-regression", type=click.FloatRange(min=0), default=0.25,
+    help="Fail when wall time or traced memory peak of a stage regresses more than this ratio against baseline."
+)
+def benchmark(rp_count, version_count, resource_count, ref_depth, stages, repeat, output, baseline, max_regression):
+    specs_path = tempfile.mkdtemp(prefix="aaz-benchmark-")
+    try:
+        SyntheticSpecsGenerator(
+            rp_count=rp_count, version_count=version_count, resource_count=resource_count, ref_depth=ref_depth
+        ).generate(specs_path)
+        results = run_benchmarks(specs_path, stages=stages or None, repeat=repeat)
+    finally:
+        shutil.rmtree(specs_path, ignore_errors=True)
+
+    for name, metrics in results.items():
+        click.echo(
+            f"{name:<20} wall: {metrics['wallTime']:.3f}s  peak rss: {_format_size(metrics.get('peakRss'))}  "
+            f"traced peak: {_format_size(metrics.get('tracedPeak'))}  allocated blocks: {metrics['allocatedBlocks']}"
+        )
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({
+                "parameters": {
+                    "rpCount": rp_count, "versionCount": version_count,
+                    "resourceCount": resource_count, "refDepth": ref_depth,
+                },
+                "results": results,
+            }, f, indent=2)
+
+    if baseline:
+        with open(baseline, 'r', encoding='utf-8') as f:
+            baseline_results = json.load(f)["results"]
+        regressions = compare_results(results, baseline_results, max_regression)
+        for name, metric, base_value, value, ratio in regressions:
+            click.echo(f"Regression: {name} {metric}: {base_value:.4g} -> {value:.4g} (+{ratio:.0%})", err=True)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,226 @@
+import json
+import os
+
+COMMON_TYPES_PATH = os.path.join('specification', 'common-types', 'resource-management', 'v1', 'types.json')
+
+
+class SyntheticSpecsGenerator:
+    """Generate a synthetic azure-rest-api-specs repository for benchmarks.
+
+    The repository contains `rp_count` resource providers under `mgmt-plane` modules, each with `version_count`
+    stable api-versions. Every api-version defines `resource_count` tracked resources whose definitions reference
+    the shared common types, nest `ref_depth` levels of `$ref` chain, and contain a discriminator with children
+    and a recursive definition.
+    """
+
+    def __init__(self, rp_count=4, version_count=3, resource_count=5, ref_depth=5):
+        self.rp_count = rp_count
+        self.version_count = version_count
+        self.resource_count = resource_count
+        self.ref_depth = ref_depth
+
+    def generate(self, folder_path):
+        """Write the repository into folder_path and return the paths of the generated swagger files."""
+        self._dump(os.path.join(folder_path, COMMON_TYPES_PATH), self._build_common_types())
+        file_paths = []
+        for rp_idx in range(self.rp_count):
+            module_name = f"bench{rp_idx}"
+            rp_name = f"Microsoft.Bench{rp_idx}"
+            rp_folder = os.path.join(folder_path, 'specification', module_name, 'resource-manager', rp_name)
+            versions = [f"{2020 + idx}-01-01" for idx in range(self.version_count)]
+            for version in versions:
+                file_path = os.path.join(rp_folder, 'stable', version, f"{module_name}.json")
+                self._dump(file_path, self._build_swagger(rp_name, version))
+                file_paths.append(file_path)
+            self._write_readme(os.path.join(rp_folder, '..', 'readme.md'), module_name, versions)
+        return file_paths
+
+    @staticmethod
+    def _dump(file_path, body):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(body, f, indent=2)
+
+    @staticmethod
+    def _write_readme(file_path, module_name, versions):
+        lines = [f"# {module_name}", "", "``` yaml", f"tag: package-{versions[-1]}", "```", ""]
+        for version in versions:
+            lines.extend([
+                f"### Tag: package-{version}", "",
+                f"``` yaml $(tag) == 'package-{version}'",
+                "input-file:",
+                f"  - Microsoft.{module_name.capitalize()}/stable/{version}/{module_name}.json",
+                "```", "",
+            ])
+        with open(os.path.normpath(file_path), 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+
+    @staticmethod
+    def _build_common_types():
+        return {
+            "swagger": "2.0",
+            "info": {"title": "Common types", "version": "1.0"},
+            "paths": {},
+            "definitions": {
+                "Resource": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string", "readOnly": True},
+                        "name": {"type": "string", "readOnly": True},
+                        "type": {"type": "string", "readOnly": True},
+                    },
+                    "x-ms-azure-resource": True,
+                },
+                "TrackedResource": {
+                    "type": "object",
+                    "allOf": [{"$ref": "#/definitions/Resource"}],
+                    "properties": {
+                        "tags": {"type": "object", "additionalProperties": {"type": "string"}},
+                        "location": {"type": "string", "x-ms-mutability": ["read", "create"]},
+                    },
+                    "required": ["location"],
+                },
+                "ErrorDetail": {
+                    "type": "object",
+                    "properties": {
+                        "code": {"type": "string", "readOnly": True},
+                        "message": {"type": "string", "readOnly": True},
+                        "details": {"type": "array", "items": {"$ref": "#/definitions/ErrorDetail"}, "readOnly": True},
+                    },
+                },
+                "ErrorResponse": {
+                    "type": "object",
+                    "properties": {"error": {"$ref": "#/definitions/ErrorDetail"}},
+                },
+            },
+            "parameters": {
+                "SubscriptionIdParameter": {
+                    "name": "subscriptionId", "in": "path", "required": True, "type": "string",
+                },
+                "ResourceGroupNameParameter": {
+                    "name": "resourceGroupName", "in": "path", "required": True, "type": "string",
+                    "x-ms-parameter-location": "method",
+                },
+                "ApiVersionParameter": {
+                    "name": "api-version", "in": "query", "required": True, "type": "string", "minLength": 1,
+                },
+            },
+        }
+
+    def _build_swagger(self, rp_name, version):
+        common = "../../../../../common-types/resource-management/v1/types.json"
+        paths = {}
+        definitions = {}
+        for idx in range(self.resource_count):
+            name = f"Widget{idx}"
+            collection = (f"/subscriptions/{{subscriptionId}}/resourceGroups/{{resourceGroupName}}"
+                          f"/providers/{rp_name}/widget{idx}s")
+            base_parameters = [
+                {"$ref": f"{common}#/parameters/SubscriptionIdParameter"},
+                {"$ref": f"{common}#/parameters/ResourceGroupNameParameter"},
+                {"$ref": f"{common}#/parameters/ApiVersionParameter"},
+            ]
+            instance_parameters = [
+                *base_parameters,
+                {"name": "widgetName", "in": "path", "required": True, "type": "string"},
+            ]
+            responses = {"default": {"description": "Error", "schema": {"$ref": f"{common}#/definitions/ErrorResponse"}}}
+            paths[collection] = {
+                "get": {
+                    "operationId": f"{name}s_List",
+                    "parameters": base_parameters,
+                    "responses": {
+                        "200": {"description": "OK", "schema": {"$ref": f"#/definitions/{name}List"}}, **responses
+                    },
+                    "x-ms-pageable": {"nextLinkName": "nextLink"},
+                },
+            }
+            paths[collection + "/{widgetName}"] = {
+                "get": {
+                    "operationId": f"{name}s_Get",
+                    "parameters": instance_parameters,
+                    "responses": {"200": {"description": "OK", "schema": {"$ref": f"#/definitions/{name}"}}, **responses},
+                },
+                "put": {
+                    "operationId": f"{name}s_CreateOrUpdate",
+                    "parameters": [
+                        *instance_parameters,
+                        {"name": "body", "in": "body", "required": True, "schema": {"$ref": f"#/definitions/{name}"}},
+                    ],
+                    "responses": {
+                        "200": {"description": "OK", "schema": {"$ref": f"#/definitions/{name}"}},
+                        "201": {"description": "Created", "schema": {"$ref": f"#/definitions/{name}"}},
+                        **responses
+                    },
+                    "x-ms-long-running-operation": True,
+                },
+                "delete": {
+                    "operationId": f"{name}s_Delete",
+                    "parameters": instance_parameters,
+                    "responses": {"200": {"description": "OK"}, "204": {"description": "No Content"}, **responses},
+                },
+            }
+            definitions.update(self._build_definitions(name, common))
+        return {
+            "swagger": "2.0",
+            "info": {"title": rp_name, "version": version},
+            "host": "management.azure.com",
+            "schemes": ["https"],
+            "consumes": ["application/json"],
+            "produces": ["application/json"],
+            "paths": paths,
+            "definitions": definitions,
+        }
+
+    def _build_definitions(self, name, common):
+        definitions = {
+            name: {
+                "type": "object",
+                "allOf": [{"$ref": f"{common}#/definitions/TrackedResource"}],
+                "properties": {
+                    "properties": {"$ref": f"#/definitions/{name}Level0", "x-ms-client-flatten": True},
+                },
+            },
+            f"{name}List": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "array", "items": {"$ref": f"#/definitions/{name}"}},
+                    "nextLink": {"type": "string", "readOnly": True},
+                },
+            },
+            # discriminator with children
+            f"{name}Rule": {
+                "type": "object",
+                "discriminator": "kind",
+                "required": ["kind"],
+                "properties": {"kind": {"type": "string"}, "priority": {"type": "integer", "format": "int32"}},
+            },
+            f"{name}Node": {
+                # recursive definition
+                "type": "object",
+                "properties": {
+                    "value": {"type": "string"},
+                    "children": {"type": "array", "items": {"$ref": f"#/definitions/{name}Node"}},
+                },
+            },
+        }
+        for kind in ("Allow", "Deny"):
+            definitions[f"{name}{kind}Rule"] = {
+                "type": "object",
+                "x-ms-discriminator-value": kind,
+                "allOf": [{"$ref": f"#/definitions/{name}Rule"}],
+                "properties": {f"{kind.lower()}List": {"type": "array", "items": {"type": "string"}}},
+            }
+        for depth in range(self.ref_depth):
+            properties = {
+                f"setting{depth}": {"type": "string", "enum": ["On", "Off"]},
+                f"count{depth}": {"type": "integer", "format": "int64", "minimum": 0},
+                "provisioningState": {"type": "string", "readOnly": True},
+            }
+            if depth + 1 < self.ref_depth:
+                properties["next"] = {"$ref": f"#/definitions/{name}Level{depth + 1}"}
+            else:
+                properties["rules"] = {"type": "array", "items": {"$ref": f"#/definitions/{name}Rule"}}
+                properties["tree"] = {"$ref": f"#/definitions/{name}Node"}
+            definitions[f"{name}Level{depth}"] = {"type": "object", "properties": properties}
+        return definitions
@@ -11,7 +11,7 @@ from swagger.model.schema.cmd_builder import CMDBuilder
 from swagger.model.schema.fields import MutabilityEnum
 from swagger.model.schema.path_item import PathItem
 from swagger.model.schema.x_ms_parameterized_host import XmsParameterizedHost
-from swagger.model.specs import SwaggerLoader
+from swagger.model.specs import LinkedSwaggerCache
 from swagger.model.specs._utils import operation_id_separate, camel_case_to_snake_case, get_url_path_valid_parts
 from swagger.model.schema.typespec.path_item import TypeSpecPathItem
 from utils import exceptions
@@ -532,23 +532,27 @@ class SwaggerCommandGenerator(_CommandGenerator):
 
     def __init__(self):
         super().__init__()
-        self.loader = SwaggerLoader()
+        self._swagger_cache = LinkedSwaggerCache.get_shared()
+        self._loaders = {}
 
     def load_resources(self, resources):
         for resource in resources:
-            self.loader.load_file(resource.file_path)
-        self.loader.link_swaggers()
-    
+            if resource.file_path not in self._loaders:
+                self._loaders[resource.file_path] = self._swagger_cache.load(resource.file_path)
+
+    def get_swagger(self, file_path):
+        loader = self._loaders.get(file_path, None)
+        if loader is None:
+            return None
+        return loader.get_loaded(file_path)
+
     def get_path_item(self, resource):
-        swagger = self.loader.get_loaded(resource.file_path)
-        assert swagger is not None
-        path_item = swagger.paths.get(resource.path, None)
-        if path_item is None:
-            path_item = swagger.x_ms_paths.get(resource.path, None)
-        return path_item
+        loader = self._loaders.get(resource.file_path, None)
+        assert loader is not None
+        return loader.link_path_item(resource.file_path, resource.path)
     
     def get_parameterized_host(self, resource):
-        swagger = self.loader.get_loaded(resource.file_path)
+        swagger = self.get_swagger(resource.file_path)
         if swagger.x_ms_parameterized_host:
             return swagger.x_ms_parameterized_host
         elif swagger.base_path:
@@ -1,29 +1,28 @@
 from swagger.controller._example_builder import SwaggerExampleBuilder
 from swagger.model.schema.example_item import XmsExamplesField
 from swagger.model.schema.path_item import PathItem
-from swagger.model.specs import SwaggerLoader
+from swagger.model.specs import LinkedSwaggerCache
 
 
 class ExampleGenerator:
     def __init__(self):
-        self.loader = SwaggerLoader()
+        self._swagger_cache = LinkedSwaggerCache.get_shared()
+        self._loaders = {}
 
     def load_examples(self, resources):
         for resource in resources:
-            self.loader.load_file(resource.file_path)
-            self.loader.link_swaggers()
+            if resource.file_path not in self._loaders:
+                self._loaders[resource.file_path] = self._swagger_cache.load(resource.file_path)
 
     def create_draft_examples_by_swagger(self, resources, command, cmd_operation_ids, cmd_name):
         cmd_examples = []
 
         for resource in resources:
-            swagger = self.loader.get_loaded(resource.file_path)
-            if not swagger:
+            loader = self._loaders.get(resource.file_path, None)
+            if not loader:
                 continue
 
-            path_item = swagger.paths.get(resource.path, None)
-            if path_item is None:
-                path_item = swagger.x_ms_paths.get(resource.path, None)
+            path_item = loader.link_path_item(resource.file_path, resource.path)
             if not isinstance(path_item, PathItem):
                 continue
 
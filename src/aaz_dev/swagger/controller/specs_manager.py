@@ -1,10 +1,21 @@
-from collections import OrderedDict
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
 
 from swagger.model.specs import SwaggerSpecs, SingleModuleSwaggerSpecs, OpenAPIResourceProvider, SwaggerModule, TypeSpecResourceProvider
 from utils import exceptions
 from utils.config import Config
+from utils.fingerprint import file_fingerprint, folder_fingerprint
 from utils.plane import PlaneEnum
 
+logger = logging.getLogger('backend')
+
+# the files which affect the resource providers discovered in a module
+_MODULE_STRUCTURE_FILES = ('readme.md', 'main.tsp', 'tspconfig.yaml')
+# the folders which never affect the resource providers, they're skipped when checking the module structure
+_MODULE_IGNORED_FOLDERS = ('examples',)
+
 
 class SwaggerSpecsModuleManager:
 
@@ -14,13 +25,30 @@ class SwaggerSpecsModuleManager:
         self._rps_catch = None
         self._resource_op_group_map_cache = {}
         self._resource_map_cache = {}
+        self._lock = threading.RLock()
+        self.stats = Counter()
         assert plane == PlaneEnum.Mgmt or PlaneEnum.is_data_plane(plane), f"Invalid plane: '{self.plane}'"
         assert isinstance(module, SwaggerModule), f"Invalid module type: '{type(module)}'"
+        self._fingerprint = self._get_module_fingerprint()
+
+    def _get_module_fingerprint(self):
+        # only the folder structure and the readme or typespec entry files are used to discover resource providers,
+        # the changes of swagger files are handled by the resource map fingerprints. The example folders, which
+        # hold most of the files in a module, are not scanned.
+        return folder_fingerprint(
+            self.module.folder_path,
+            file_filter=lambda name: name.lower() in _MODULE_STRUCTURE_FILES,
+            dir_filter=lambda name: name.lower() not in _MODULE_IGNORED_FOLDERS
+        )
+
+    def is_outdated(self):
+        return self._get_module_fingerprint() != self._fingerprint
 
     def get_resource_providers(self):
-        if self._rps_catch is None:
-            self._rps_catch = self.module.get_resource_providers()
-        return self._rps_catch
+        with self._lock:
+            if self._rps_catch is None:
+                self._rps_catch = self.module.get_resource_providers()
+            return self._rps_catch
 
     def get_openapi_resource_provider(self, rp_name):
         rps = self.get_resource_providers()
@@ -50,20 +78,22 @@ class SwaggerSpecsModuleManager:
 
     def get_grouped_resource_map(self, rp_name):
         key = rp_name
-        if key in self._resource_op_group_map_cache:
+        with self._lock:
+            rp = self.get_openapi_resource_provider(rp_name)
+            # the grouped resource map is dropped when the resource map is outdated
+            resource_map = self.get_resource_map(rp)
+            if key in self._resource_op_group_map_cache:
+                return self._resource_op_group_map_cache[key]
+
+            resource_op_group_map = OrderedDict()
+            for resource_id, version_map in resource_map.items():
+                op_group_name = self.get_resource_op_group_name(version_map)
+                if op_group_name not in resource_op_group_map:
+                    resource_op_group_map[op_group_name] = OrderedDict()
+                resource_op_group_map[op_group_name][resource_id] = version_map
+            self._resource_op_group_map_cache[key] = resource_op_group_map
             return self._resource_op_group_map_cache[key]
 
-        rp = self.get_openapi_resource_provider(rp_name)
-        resource_map = self.get_resource_map(rp)
-        resource_op_group_map = OrderedDict()
-        for resource_id, version_map in resource_map.items():
-            op_group_name = self.get_resource_op_group_name(version_map)
-            if op_group_name not in resource_op_group_map:
-                resource_op_group_map[op_group_name] = OrderedDict()
-            resource_op_group_map[op_group_name][resource_id] = version_map
-        self._resource_op_group_map_cache[key] = resource_op_group_map
-        return self._resource_op_group_map_cache[key]
-
     @staticmethod
     def get_resource_op_group_name(version_map):
         _, latest_resource = sorted(
@@ -123,31 +153,91 @@ class SwaggerSpecsModuleManager:
     def get_resource_map(self, rp):
         assert isinstance(rp, OpenAPIResourceProvider)
         key = str(rp)
-        if key not in self._resource_map_cache:
-            self._resource_map_cache[key] = rp.get_resource_map()
-        return self._resource_map_cache[key]
+        with self._lock:
+            # calculate fingerprint before parsing, so the files changed during parsing will be reloaded next time.
+            fingerprint = self._get_resource_provider_fingerprint(rp)
+            refresh = False
+            if key in self._resource_map_cache:
+                cached_fingerprint, resource_map = self._resource_map_cache[key]
+                if cached_fingerprint == fingerprint:
+                    self.stats['resourceMapHits'] += 1
+                    return resource_map
+                logger.debug(f"ResourceMapOutdated: {rp}")
+                self.stats['resourceMapInvalidations'] += 1
+                self._resource_op_group_map_cache.pop(rp.name, None)
+                refresh = True
+            self.stats['resourceMapMisses'] += 1
+            resource_map = rp.get_resource_map(refresh=refresh)
+            self._resource_map_cache[key] = (fingerprint, resource_map)
+            return resource_map
+
+    @staticmethod
+    def _get_resource_provider_fingerprint(rp):
+        parent_readme_path = os.path.join(os.path.dirname(rp.folder_path), 'readme.md')
+        return (
+            folder_fingerprint(rp.folder_path, dir_filter=lambda name: 'example' not in name),
+            file_fingerprint(parent_readme_path),
+        )
 
 
 class SwaggerSpecsManager:
 
+    _shared_managers = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        """Get the process-wide manager for the current swagger path configuration.
+
+        The shared manager keeps its caches across requests and invalidates them when the files changed.
+        """
+        key = (Config.SWAGGER_PATH, Config.SWAGGER_MODULE_PATH, Config.DEFAULT_SWAGGER_MODULE)
+        with cls._shared_lock:
+            if key not in cls._shared_managers:
+                cls._shared_managers[key] = cls()
+            return cls._shared_managers[key]
+
     def __init__(self):
         if Config.SWAGGER_PATH:
             self.specs = SwaggerSpecs(folder_path=Config.SWAGGER_PATH)
+            self._specs_folder_path = self.specs.spec_folder_path
         elif Config.SWAGGER_MODULE_PATH:
             if not Config.DEFAULT_SWAGGER_MODULE:
                 raise ValueError("SWAGGER_MODULE is required when using SWAGGER_MODULE_PATH")
             self.specs = SingleModuleSwaggerSpecs(
                 folder_path=Config.SWAGGER_MODULE_PATH, module_name=Config.DEFAULT_SWAGGER_MODULE)
+            self._specs_folder_path = Config.SWAGGER_MODULE_PATH
         else:
             raise ValueError("Require SWAGGER_PATH or SWAGGER_MODULE_PATH")
 
         self._modules_cache = {}
         self._module_managers_cache = {}
+        self._lock = threading.RLock()
+        self.stats = Counter()
 
-    def get_modules(self, plane):
-        if plane in self._modules_cache:
-            return self._modules_cache[plane]
+    def get_cache_stats(self):
+        with self._lock:
+            stats = Counter(self.stats)
+            for module_manager in self._module_managers_cache.values():
+                stats.update(module_manager.stats)
+        return dict(stats)
 
+    def get_modules(self, plane):
+        # modules are added or removed in the top level of specification folder
+        fingerprint = file_fingerprint(self._specs_folder_path)
+        with self._lock:
+            if plane in self._modules_cache:
+                cached_fingerprint, modules = self._modules_cache[plane]
+                if cached_fingerprint == fingerprint:
+                    self.stats['modulesHits'] += 1
+                    return modules
+                self.stats['modulesInvalidations'] += 1
+            self.stats['modulesMisses'] += 1
+            modules = self._get_modules(plane)
+            self._modules_cache[plane] = (fingerprint, modules)
+            return modules
+
+    def _get_modules(self, plane):
         if plane == PlaneEnum.Mgmt:
             modules = self.specs.get_mgmt_plane_modules(plane=plane)
         elif PlaneEnum.is_data_plane(plane):
@@ -163,8 +253,7 @@ class SwaggerSpecsManager:
                 if module_str not in result:
                     result[module_str] = module
 
-        self._modules_cache[plane] = [*result.values()]
-        return self._modules_cache[plane]
+        return [*result.values()]
 
     def get_module(self, plane, mod_names):
         if isinstance(mod_names, str):
@@ -183,11 +272,21 @@ class SwaggerSpecsManager:
 
     def get_module_manager(self, plane, mod_names, without_catch=False) -> SwaggerSpecsModuleManager:
         key = (plane, tuple(mod_names))
-        if without_catch or key not in self._module_managers_cache:
+        with self._lock:
+            manager = None if without_catch else self._module_managers_cache.get(key, None)
+            if manager is not None:
+                if not manager.is_outdated():
+                    self.stats['moduleManagerHits'] += 1
+                    return manager
+                logger.debug(f"ModuleOutdated: {manager.module}")
+                self.stats['moduleManagerInvalidations'] += 1
+                # keep the counters of the outdated manager
+                self.stats.update(manager.stats)
+            self.stats['moduleManagerMisses'] += 1
             module = self.get_module(plane, mod_names)
-            self._module_managers_cache[key] = SwaggerSpecsModuleManager(plane, module)
-
-        return self._module_managers_cache[key]
+            manager = SwaggerSpecsModuleManager(plane, module)
+            self._module_managers_cache[key] = manager
+            return manager
 
     def get_swagger_resource(self, plane, mod_names, resource_id, version):
         return self.get_module_manager(
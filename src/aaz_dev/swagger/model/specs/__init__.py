@@ -3,3 +3,4 @@ from ._resource_provider import OpenAPIResourceProvider, TypeSpecResourceProvide
 from ._swagger_module import SwaggerModule, DataPlaneModule, MgmtPlaneModule
 from ._swagger_specs import SwaggerSpecs, SingleModuleSwaggerSpecs
 from ._swagger_loader import SwaggerLoader
+from ._swagger_cache import LinkedSwaggerCache
@@ -18,7 +18,7 @@ logger = logging.getLogger('backend')
 class Resource:
     _CAMEL_CASE_PATTERN = re.compile(r"^([a-zA-Z][a-z0-9]+)(([A-Z][a-z0-9]*)+)$")
 
-    def __init__(self, resource_id, path, version, file_path, resource_provider, body):
+    def __init__(self, resource_id, path, version, file_path, resource_provider, body=None, operations=None):
         self.path = path
         self.id = resource_id
         self._version = ResourceVersion(version)
@@ -26,10 +26,11 @@ class Resource:
         self.resource_provider = resource_provider
         self.file_path_version = self._get_file_path_version(file_path)
 
-        operations = {}
-        for method, v in body.items():
-            if isinstance(v, dict) and 'operationId' in v:
-                operations[v['operationId']] = method
+        if operations is None:
+            operations = {}
+            for method, v in (body or {}).items():
+                if isinstance(v, dict) and 'operationId' in v:
+                    operations[v['operationId']] = method
         self.operations = operations
 
     @property
@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from utils.config import Config
+
+logger = logging.getLogger('backend')
+
+
+class SwaggerResourceIndex:
+    """Persistent index of the resources defined in swagger files.
+
+    The entries of a file are keyed by its path, mtime and size, so unchanged files are never parsed again.
+    Each entry is a tuple of (resource_id, path, version, operations).
+    """
+
+    SCHEMA_VERSION = "1"
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None or row[0] != self.SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS swagger_files")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)", (self.SCHEMA_VERSION,))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS swagger_files ("
+                "file_path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, entries TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def get_file_key(file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, file_path, file_key):
+        """Return the entries of the file if it's indexed with the same file key, else return None."""
+        if file_key is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, entries FROM swagger_files WHERE file_path = ?", (file_path,)
+            ).fetchone()
+        if row is None or (row[0], row[1]) != tuple(file_key):
+            return None
+        return [tuple(entry) for entry in json.loads(row[2])]
+
+    def update(self, records):
+        """Save a list of (file_path, file_key, entries) records in one transaction."""
+        records = [
+            (file_path, file_key[0], file_key[1], json.dumps(entries))
+            for file_path, file_key, entries in records if file_key is not None
+        ]
+        if not records:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO swagger_files (file_path, mtime_ns, size, entries) VALUES (?, ?, ?, ?)",
+                records
+            )
+
+    def iter_file_paths(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT file_path FROM swagger_files").fetchall()
+        for row in rows:
+            yield row[0]
+
+    def remove(self, file_paths):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM swagger_files WHERE file_path = ?", [(file_path,) for file_path in file_paths])
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_swagger_resource_index():
+    """Get the shared resource index, return None if the index is disabled or failed to open."""
+    global _index
+    db_path = Config.get_swagger_resource_index_path()
+    if not db_path:
+        return None
+    with _index_lock:
+        if _index is None or _index.db_path != db_path:
+            try:
+                _index = SwaggerResourceIndex(db_path)
+            except (OSError, sqlite3.Error) as err:
+                logger.warning(f"SwaggerResourceIndexDisabled: failed to open {db_path}: {err}")
+                return None
+        return _index
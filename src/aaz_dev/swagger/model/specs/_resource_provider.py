@@ -5,14 +5,17 @@ import os
 import re
 from collections import OrderedDict
 
-import yaml
-
 from swagger.utils.tools import swagger_resource_path_to_resource_id, resolve_path_to_uri
 from ._resource import Resource, ResourceVersion
+from ._resource_index import get_swagger_resource_index
+from ._swagger_extractor import extract_swagger_paths, parse_path_item_operations
 from ._utils import map_path_2_repo
-from utils.readme_helper import parse_readme_file
+from utils.readme_helper import load_readme_file, parse_readme_file
 logger = logging.getLogger('backend')
 
+# the swagger files larger than this size are scanned without decoding the whole document to save memory
+STREAMING_EXTRACT_MIN_SIZE = 1024 * 1024
+
 
 class OpenAPIResourceProvider:
 
@@ -31,47 +34,47 @@ class OpenAPIResourceProvider:
     def __str__(self):
         return f'{self.swagger_module}/ResourceProviders/{self.name}'
 
-    def get_resource_map(self, refresh=False):
+    def get_resource_map(self, refresh=False, executor=None):
+        """Get resources grouped by resource id and version.
+
+        :param executor: an optional `concurrent.futures.Executor` to parse swagger files in parallel.
+        """
         if refresh or not self._resource_map:
-            resource_map = {}
-            for root, dirs, files in os.walk(self.folder_path):
-                if 'example' in root:
-                    continue
-                for file in files:
-                    if not file.endswith('.json'):
-                        continue
-                    file_path = os.path.join(root, file)
-                    for resource in self._parse_resources_in_file(file_path):
-                        if resource.id in self._ignore_resources:
-                            continue
-                        if resource.id not in resource_map:
-                            resource_map[resource.id] = {}
-                        if self._replace_current_resource(
-                                curr_resource=resource_map[resource.id].get(resource.version, None),
-                                resource=resource
-                        ):
-                            resource_map[resource.id][resource.version] = resource
-            self._resource_map = resource_map
+            if refresh:
+                # readme files may be changed as well
+                self._tags = None
+            self._resource_map = self._build_resource_map(self.iter_swagger_file_paths(), executor=executor)
         resource_map = self._resource_map
         return resource_map
 
     def get_resource_map_by_tag(self, tag):
-        resource_map = {}
         if tag not in self.tags:
             logger.error(f"Tag: `{tag}` is not exist")
-            return resource_map
-
-        for file_path in self.tags[tag]:
-            for resource in self._parse_resources_in_file(file_path):
-                if resource.id in self._ignore_resources:
+            return {}
+        return self._build_resource_map(self.tags[tag])
+
+    def iter_swagger_file_paths(self):
+        for root, dirs, files in os.walk(self.folder_path):
+            if 'example' in root:
+                continue
+            for file in files:
+                if not file.endswith('.json'):
                     continue
-                if resource.id not in resource_map:
-                    resource_map[resource.id] = {}
-                if self._replace_current_resource(
-                        curr_resource=resource_map[resource.id].get(resource.version, None),
-                        resource=resource
-                ):
-                    resource_map[resource.id][resource.version] = resource
+                yield os.path.join(root, file)
+
+    def _build_resource_map(self, file_paths, executor=None):
+        resource_map = {}
+        # the resources are merged in the order of files, so the result is the same no matter how files are parsed.
+        for resource in self._parse_resources_in_files(file_paths, executor=executor):
+            if resource.id in self._ignore_resources:
+                continue
+            if resource.id not in resource_map:
+                resource_map[resource.id] = {}
+            if self._replace_current_resource(
+                    curr_resource=resource_map[resource.id].get(resource.version, None),
+                    resource=resource
+            ):
+                resource_map[resource.id][resource.version] = resource
         return resource_map
 
     def load_readme_config(self, readme_file):
@@ -91,39 +94,21 @@ class OpenAPIResourceProvider:
         if not self._readme_paths:
             return tags
 
+        folder_entries = {}
         for readme_path in self._readme_paths:
-            with open(readme_path, 'r', encoding='utf-8') as f:
-                readme = f.read()
-
-            re_yaml = re.compile(
-                r'```\s*yaml\s*(.*\$\(\s*tag\s*\)\s*==\s*[\'"]\s*(.*)\s*[\'"].*)?\n((((?!```).)*\n)*)\s*```\s*',
-                flags=re.MULTILINE)
-            for piece in re_yaml.finditer(readme):
-                flags = piece[1]
-                yaml_body = piece[3]
-                if 'input-file' not in yaml_body:
-                    continue
-
-                try:
-                    body = yaml.safe_load(yaml_body)
-                except yaml.YAMLError as err:
-                    logger.error(f'ParseYamlFailed: {self} : {readme_path} {flags}: {err}')
-                    continue
-
+            readme_file = load_readme_file(readme_path)
+            for tag, input_files in readme_file.tag_input_files:
                 files = []
-                for file_path in body['input-file']:
+                for file_path in input_files:
                     file_path = file_path.replace('$(this-folder)/', '')
                     file_path = os.path.join(os.path.dirname(readme_path), *file_path.split('/'))
-                    if not os.path.isfile(file_path):
+                    if not self._is_file(file_path, folder_entries):
                         logger.warning(f'FileNotExist: {self} : {file_path}')
                         continue
                     files.append(file_path)
 
                 if len(files):
-                    tag = piece[2]
-                    if tag is None:
-                        tag = ''
-                    tag = OpenAPIResourceProviderTag(tag.strip(), self)
+                    tag = OpenAPIResourceProviderTag(tag, self)
                     if tag not in tags:
                         tags[tag] = set()
                     tags[tag] = tags[tag].union(files)
@@ -133,6 +118,20 @@ class OpenAPIResourceProvider:
         tags = OrderedDict(tags)
         return tags
 
+    @staticmethod
+    def _is_file(file_path, folder_entries):
+        """Check the file by the cached entries of its folder, the input files of tags are mostly in a few folders."""
+        folder_path, name = os.path.split(file_path)
+        if folder_path not in folder_entries:
+            try:
+                folder_entries[folder_path] = set(os.listdir(folder_path))
+            except OSError:
+                folder_entries[folder_path] = set()
+        if name in folder_entries[folder_path]:
+            return True
+        # fall back for the case insensitive file systems
+        return os.path.isfile(file_path)
+
     def _fetch_latest_tag(self, file_path):
         for tag, file_set in self.tags.items():
             if file_path in file_set:
@@ -188,42 +187,84 @@ class OpenAPIResourceProvider:
         return False
 
     def _parse_resources_in_file(self, file_path):
+        return self._parse_resources_in_files([file_path])
+
+    def _parse_resources_in_files(self, file_paths, executor=None):
+        index = get_swagger_resource_index()
+        file_paths = [*file_paths]
+        file_keys = [None] * len(file_paths)
+        file_entries = [None] * len(file_paths)
+        if index is not None:
+            for idx, file_path in enumerate(file_paths):
+                # fetch the file key before parsing, so the file changed during parsing will be parsed again next time
+                file_keys[idx] = index.get_file_key(file_path)
+                file_entries[idx] = index.get(file_path, file_keys[idx])
+
+        unparsed = [idx for idx, entries in enumerate(file_entries) if entries is None]
+        label = str(self)
+        if executor is not None and len(unparsed) > 1:
+            parsed_entries = executor.map(
+                extract_resource_entries,
+                [file_paths[idx] for idx in unparsed],
+                [label] * len(unparsed),
+                chunksize=max(1, len(unparsed) // 32)
+            )
+        else:
+            parsed_entries = (extract_resource_entries(file_paths[idx], label=label) for idx in unparsed)
+        records = []
+        for idx, entries in zip(unparsed, parsed_entries):
+            file_entries[idx] = entries
+            records.append((file_paths[idx], file_keys[idx], entries))
+        if index is not None:
+            index.update(records)
+
         resources = []
+        for file_path, entries in zip(file_paths, file_entries):
+            for resource_id, path, version, operations in entries:
+                resources.append(Resource(
+                    resource_id=resource_id, path=path, version=version, file_path=file_path,
+                    resource_provider=self, operations=operations))
+        return resources
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                body = json.load(f)
-        except Exception as err:
-            logger.error(f'InvalidSwaggerFile: {self} : ParseJsonFailed: {file_path} : {err}')
-            return resources
-
-        # check swagger version
-        swagger_version = body.get('swagger', None)
-        if swagger_version != '2.0':
-            logger.error(f'InvalidSwaggerFile: {self} : invalid swagger version {swagger_version} in file {file_path}')
-            return resources
-
-        # fetch api-version
-        info = body.get('info', {})
-        version = info.get('version', None)
-        if not version:
-            logger.error(f'InvalidSwaggerFile: {self} : invalid info version {version} in file {file_path}')
-
-        for path, value in body.get('paths', {}).items():
-            resource = Resource(
-                resource_id=swagger_resource_path_to_resource_id(path),
-                path=path, version=version, file_path=file_path, resource_provider=self, body=value)
-            resources.append(resource)
-
-        # x-ms-paths:
-        #   alternative to Paths Object that allows Path Item Object to have query parameters for non pure REST APIs
-        for path, value in body.get('x-ms-paths', {}).items():
-            resource = Resource(
-                resource_id=swagger_resource_path_to_resource_id(path),
-                path=path, version=version, file_path=file_path, resource_provider=self, body=value)
-            resources.append(resource)
 
-        return resources
+def extract_resource_entries(file_path, label=None):
+    """Extract the (resource_id, path, version, operations) tuples of the paths defined in a swagger file."""
+    entries = []
+
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if len(text) >= STREAMING_EXTRACT_MIN_SIZE:
+            # only the required properties are decoded, others such as definitions are skipped.
+            body = extract_swagger_paths(text)
+        else:
+            body = json.loads(text)
+            for key in ('paths', 'x-ms-paths'):
+                if key in body:
+                    body[key] = {path: parse_path_item_operations(value) for path, value in body[key].items()}
+    except Exception as err:
+        logger.error(f'InvalidSwaggerFile: {label} : ParseJsonFailed: {file_path} : {err}')
+        return entries
+
+    # check swagger version
+    swagger_version = body.get('swagger', None)
+    if swagger_version != '2.0':
+        logger.error(f'InvalidSwaggerFile: {label} : invalid swagger version {swagger_version} in file {file_path}')
+        return entries
+
+    # fetch api-version
+    info = body.get('info', {})
+    version = info.get('version', None)
+    if not version:
+        logger.error(f'InvalidSwaggerFile: {label} : invalid info version {version} in file {file_path}')
+
+    # x-ms-paths:
+    #   alternative to Paths Object that allows Path Item Object to have query parameters for non pure REST APIs
+    for key in ('paths', 'x-ms-paths'):
+        for path, operations in body.get(key, {}).items():
+            entries.append((swagger_resource_path_to_resource_id(path), path, version, operations))
+
+    return entries
 
 
 class OpenAPIResourceProviderTag:
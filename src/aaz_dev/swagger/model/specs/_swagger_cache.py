@@ -0,0 +1,114 @@
+import logging
+import threading
+from collections import Counter, OrderedDict
+
+from utils.config import Config
+from utils.fingerprint import file_fingerprint
+from ._swagger_loader import SwaggerLoader
+
+logger = logging.getLogger('backend')
+
+
+class _LinkedSwaggerEntry:
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    @property
+    def size(self):
+        # the size of source files is used to account the memory of linked documents,
+        # it grows when more files are loaded by lazy linking.
+        return sum(fingerprint[1] for fingerprint in [*self.loader.file_fingerprints.values()] if fingerprint)
+
+    def is_valid(self):
+        for file_path, fingerprint in [*self.loader.file_fingerprints.items()]:
+            if fingerprint is None or file_fingerprint(file_path) != fingerprint:
+                return False
+        return True
+
+
+class LinkedSwaggerCache:
+    """LRU cache of linked swagger documents shared across loaders and requests.
+
+    Each entry is the loader which loaded and linked a swagger file with all the files it references,
+    so the cached object graph is self-contained and never linked with the documents of other loaders.
+    An entry is invalidated when any of its files is modified, and the least recently used entries are evicted
+    when the total size of their files exceeds max_size.
+    An entry is cached after its swaggers are linked by `link_swaggers`, which links every item with references in
+    both eager and lazy mode, so the linked documents and their side tables such as discriminator children and
+    resource id templates are never modified after that, and they're shared by command generators without locks.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.stats = Counter()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        max_size = Config.SWAGGER_CACHE_MAX_SIZE * 1024 * 1024
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared.max_size != max_size:
+                cls._shared = cls(max_size)
+            return cls._shared
+
+    def load(self, file_path):
+        """Return a loader in which the swagger file is loaded and linked."""
+        with self._lock:
+            entry = self._entries.get(file_path, None)
+        if entry is not None:
+            if entry.is_valid():
+                with self._lock:
+                    if self._entries.get(file_path, None) is entry:
+                        self._entries.move_to_end(file_path)
+                        self._evict(keep=file_path)
+                    self.stats['hits'] += 1
+                return entry.loader
+            with self._lock:
+                if self._entries.get(file_path, None) is entry:
+                    del self._entries[file_path]
+                self.stats['invalidations'] += 1
+
+        loader = SwaggerLoader(lazy=Config.SWAGGER_LAZY_LINK)
+        loader.load_file(file_path)
+        loader.link_swaggers()
+        loader.log_stats()
+        entry = _LinkedSwaggerEntry(loader)
+        with self._lock:
+            self.stats['misses'] += 1
+            if 0 < self.max_size and entry.size <= self.max_size:
+                self._entries[file_path] = entry
+                self._evict(keep=file_path)
+        return loader
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                **self.stats,
+                "entries": len(self._entries),
+                "size": self._get_size(),
+                "maxSize": self.max_size,
+            }
+
+    def _get_size(self):
+        return sum(entry.size for entry in self._entries.values())
+
+    def _evict(self, keep):
+        size = self._get_size()
+        for file_path in [*self._entries.keys()]:
+            if size <= self.max_size:
+                break
+            if file_path == keep:
+                continue
+            entry = self._entries.pop(file_path)
+            size -= entry.size
+            self.stats['evictions'] += 1
+            logger.debug(f"LinkedSwaggerCache: evict {file_path} ({entry.size} bytes)")
@@ -0,0 +1,96 @@
+import json
+import re
+
+_decoder = json.JSONDecoder()
+
+_WS_RE = re.compile(r'[ \t\n\r]*')
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# match everything until the next bracket out of strings
+_SKIP_RE = re.compile(r'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*', re.DOTALL)
+
+_EXTRACTED_KEYS = ('swagger', 'info')
+_PATHS_KEYS = ('paths', 'x-ms-paths')
+
+
+def extract_swagger_paths(text):
+    """Extract `swagger`, `info` and the operations of `paths` and `x-ms-paths` from swagger json text.
+
+    The other properties such as `definitions` and `parameters` are skipped by matching brackets without being decoded,
+    and path items are decoded one by one, so the whole document is never materialized.
+    The operations of path items are returned in the format of {path: {operationId: method}}.
+    """
+    result = {}
+
+    def on_top_level_item(key, pos):
+        if key in _EXTRACTED_KEYS:
+            result[key], pos = _decoder.raw_decode(text, pos)
+            return pos
+        if key in _PATHS_KEYS and text.startswith('{', pos):
+            result[key] = paths = {}
+            return _scan_object(text, pos, lambda path, p: _scan_path_item(text, p, paths, path))
+        return _skip_value(text, pos)
+
+    pos = _WS_RE.match(text).end()
+    if not text.startswith('{', pos):
+        raise ValueError("Expecting object at the top level of swagger")
+    pos = _scan_object(text, pos, on_top_level_item)
+    if _WS_RE.match(text, pos).end() != len(text):
+        raise ValueError(f"Extra data: char {pos}")
+    return result
+
+
+def parse_path_item_operations(path_item):
+    operations = {}
+    for method, v in path_item.items():
+        if isinstance(v, dict) and 'operationId' in v:
+            operations[v['operationId']] = method
+    return operations
+
+
+def _scan_path_item(text, pos, paths, path):
+    path_item, pos = _decoder.raw_decode(text, pos)
+    paths[path] = parse_path_item_operations(path_item)
+    return pos
+
+
+def _scan_object(text, pos, on_item):
+    """Scan the object starting at pos, on_item(key, value_pos) should return the end position of the value."""
+    pos = _WS_RE.match(text, pos + 1).end()
+    if text.startswith('}', pos):
+        return pos + 1
+    while True:
+        match = _STRING_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"Expecting property name enclosed in double quotes: char {pos}")
+        key = match.group()
+        key = key[1:-1] if '\\' not in key else json.loads(key)
+        pos = _WS_RE.match(text, match.end()).end()
+        if not text.startswith(':', pos):
+            raise ValueError(f"Expecting ':' delimiter: char {pos}")
+        pos = on_item(key, _WS_RE.match(text, pos + 1).end())
+        pos = _WS_RE.match(text, pos).end()
+        if text.startswith(',', pos):
+            pos = _WS_RE.match(text, pos + 1).end()
+        elif text.startswith('}', pos):
+            return pos + 1
+        else:
+            raise ValueError(f"Expecting ',' delimiter: char {pos}")
+
+
+def _skip_value(text, pos):
+    if not text.startswith(('{', '['), pos):
+        return _decoder.raw_decode(text, pos)[1]
+    depth = 0
+    skip = _SKIP_RE.match
+    while pos < len(text):
+        c = text[pos]
+        if c == '{' or c == '[':
+            depth += 1
+        elif c == '}' or c == ']':
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        else:
+            raise ValueError(f"Unterminated string: char {pos}")
+        pos = skip(text, pos + 1).end()
+    raise ValueError("Unterminated object or array")
@@ -1,19 +1,42 @@
 import json
 import logging
 import os
-from collections import OrderedDict
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict, deque
 
 from swagger.utils import exceptions
+from utils.fingerprint import file_fingerprint
 
 logger = logging.getLogger('backend')
 
 
 class SwaggerLoader:
+    """Load swagger files and link the references between them.
 
-    def __init__(self):
+    In lazy mode, the items of `definitions` and `parameters` which have no reference are kept as raw dicts until
+    they are referenced. They are the leaves of the linked documents, linking them changes nothing but themselves,
+    so the linked documents are the same as the ones in eager mode, including the side tables such as the
+    discriminator children and the resource id templates of schemas. All the other items are linked in the same
+    order as eager mode when the swaggers are linked, so the documents are never changed after `link_swaggers`.
+    """
+
+    LAZY_SECTIONS = ('definitions', 'parameters')
+
+    def __init__(self, lazy=False):
+        self.lazy = lazy
         self._loaded = {}
         self.loaded_swaggers = OrderedDict()
-        self._linked_idx = 0
+        self._pending_links = deque()  # the loaded swaggers waiting to be linked
+        self.file_fingerprints = {}
+        self._ref_links = {}  # (base path, ref link) -> canonical traces
+        self.stats = Counter()
+        # the seconds spent on linking of each file, including the referenced files linked in it
+        self.link_times = Counter()
+        self._lazy_sections = {}
+        self._linked_path_items = set()  # the path items linked with all their references
+        self._link_lock = threading.RLock()
 
     def load_file(self, file_path):
         from swagger.model.schema.swagger import Swagger
@@ -21,6 +44,8 @@ class SwaggerLoader:
         if loaded is not None:
             return loaded
 
+        # take the fingerprint before reading, so the changes during loading will invalidate the cache
+        self.file_fingerprints[file_path] = file_fingerprint(file_path)
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 body = json.load(f)
@@ -32,8 +57,14 @@ class SwaggerLoader:
             loaded = body
         else:
             self.patch_swagger(body)
+            if self.lazy:
+                self._lazy_sections[file_path] = {
+                    section: body.pop(section) for section in self.LAZY_SECTIONS if isinstance(body.get(section), dict)
+                }
             loaded = Swagger(body)
             self.loaded_swaggers[file_path] = loaded
+            self._pending_links.append((file_path, loaded))
+        self.stats['filesLoaded'] += 1
         self._cache_loaded(loaded, file_path)
         return loaded
 
@@ -66,10 +97,92 @@ class SwaggerLoader:
         _patch(body)
 
     def link_swaggers(self):
-        while self._linked_idx < len(self.loaded_swaggers):
-            file_path, swagger = [*self.loaded_swaggers.items()][self._linked_idx]
+        if self.lazy:
+            with self._link_lock:
+                self._link_lazy_swaggers()
+            return
+        while self._pending_links:
+            file_path, swagger = self._pending_links.popleft()
+            start = time.perf_counter()
             swagger.link(self, file_path)
-            self._linked_idx += 1
+            self.link_times[file_path] += time.perf_counter() - start
+
+    def link_path_item(self, file_path, path):
+        """Link the path item with all its references, return None if the path is not in the swagger file."""
+        swagger = self.get_loaded(file_path)
+        if swagger is None:
+            return None
+        if swagger.paths is not None and path in swagger.paths:
+            key = 'paths'
+            path_item = swagger.paths[path]
+        elif swagger.x_ms_paths is not None and path in swagger.x_ms_paths:
+            key = 'x_ms_paths'
+            path_item = swagger.x_ms_paths[path]
+        else:
+            return None
+        # `is_linked` is set before the references of path item are linked, so it's not used to check whether
+        # the path item is ready to be shared with other threads.
+        traces = (file_path, key, path)
+        if traces in self._linked_path_items:
+            return path_item
+        with self._link_lock:
+            if traces not in self._linked_path_items:
+                start = time.perf_counter()
+                path_item.link(self, *traces)
+                self.link_swaggers()
+                self.link_times[file_path] += time.perf_counter() - start
+                self._linked_path_items.add(traces)
+        return path_item
+
+    def _link_lazy_swaggers(self):
+        """Link the pending swaggers in the same way as `Swagger.link`, except the lazy items without reference."""
+        from swagger.model.schema.reference import Linkable
+        while self._pending_links:
+            file_path, swagger = self._pending_links.popleft()
+            start = time.perf_counter()
+            Linkable.link(swagger, self, file_path)
+            if swagger.paths is not None:
+                for key, path in swagger.paths.items():
+                    path.link(self, file_path, 'paths', key)
+            for section in self.LAZY_SECTIONS:
+                for name, raw in [*self._lazy_sections[file_path].get(section, {}).items()]:
+                    if not self._has_ref(raw):
+                        continue
+                    item = self._load_lazy_item(file_path, section, name)
+                    if isinstance(item, Linkable):
+                        item.link(self, file_path, section, name)
+            if swagger.responses is not None:
+                for key, response in swagger.responses.items():
+                    response.link(self, file_path, 'responses', key)
+            if swagger.x_ms_paths is not None:
+                for key, path in swagger.x_ms_paths.items():
+                    path.link(self, file_path, 'x_ms_paths', key)
+            if swagger.x_ms_parameterized_host is not None:
+                swagger.x_ms_parameterized_host.link(self, file_path, 'x_ms_parameterized_host')
+            self.link_times[file_path] += time.perf_counter() - start
+
+    @staticmethod
+    def _has_ref(raw):
+        stack = [raw]
+        while stack:
+            data = stack.pop()
+            if isinstance(data, dict):
+                if '$ref' in data:
+                    return True
+                stack.extend(data.values())
+            elif isinstance(data, list):
+                stack.extend(data)
+        return False
+
+    def _load_lazy_item(self, file_path, section, name):
+        from swagger.model.schema.swagger import Swagger
+        item = self.get_loaded(file_path, section, name)
+        if item is None:
+            raw = self._lazy_sections[file_path][section][name]
+            # convert the item in the same way as it's converted in a swagger document
+            item = getattr(Swagger({section: {name: raw}}), section)[name]
+            self._cache_loaded(item, file_path, section, name)
+        return item
 
     def get_loaded(self, *traces):
         return self._loaded.get(traces, None)
@@ -77,11 +190,34 @@ class SwaggerLoader:
     def _cache_loaded(self, loaded, *traces):
         self._loaded[traces] = loaded
 
+    def get_stats(self):
+        return {
+            "filesLoaded": self.stats['filesLoaded'],
+            "refsResolved": self.stats['refsResolved'],
+            "refCacheHits": self.stats['refCacheHits'],
+            "refLinkHits": self.stats['refLinkHits'],
+            "refLinkMisses": self.stats['refLinkMisses'],
+            "linkTime": sum(self.link_times.values()),
+        }
+
+    def log_stats(self, level=logging.DEBUG):
+        stats = self.get_stats()
+        logger.log(
+            level,
+            f"SwaggerLoaderStats: files loaded: {stats['filesLoaded']}, refs resolved: {stats['refsResolved']}, "
+            f"ref cache hits: {stats['refCacheHits']}, ref link hits: {stats['refLinkHits']}, "
+            f"ref link misses: {stats['refLinkMisses']}, link time: {stats['linkTime']:.3f}s"
+        )
+        for file_path, link_time in self.link_times.most_common():
+            logger.log(level, f"SwaggerLoaderStats: link time: {link_time:.3f}s : {file_path}")
+
     def load_ref(self, ref_link, *ref_traces):
-        traces = self._parse_ref_link(ref_traces, ref_link)
+        traces = self._resolve_ref_link(ref_traces, ref_link)
 
+        self.stats['refsResolved'] += 1
         ref = self.get_loaded(*traces)
         if ref is not None:
+            self.stats['refCacheHits'] += 1
             return ref, traces
 
         file_path = traces[0]
@@ -94,7 +230,17 @@ class SwaggerLoader:
                     msg='Cannot find reference swagger file',
                     key=ref_traces, value=ref_link)
 
-        for prop in traces[1:]:
+        props = traces[1:]
+        if file_path in self._lazy_sections and len(props) >= 2 and props[0] in self._lazy_sections[file_path]:
+            try:
+                ref = self._load_lazy_item(file_path, props[0], props[1])
+            except KeyError:
+                raise exceptions.InvalidSwaggerValueError(
+                    msg='Failed to find reference in swagger',
+                    key=ref_traces, value=ref_link)
+            props = props[2:]
+
+        for prop in props:
             assert prop != ''
             try:
                 if isinstance(ref, dict):
@@ -112,6 +258,28 @@ class SwaggerLoader:
         self._cache_loaded(ref, *traces)
         return ref, traces
 
+    def _resolve_ref_link(self, ref_traces, ref_link):
+        """Resolve the ref link in the file of ref_traces to canonical traces, the results are cached.
+
+        The local links starting with '#' are cached by the file path, others are cached by the folder path,
+        so the same link in the swagger files under the same folder is parsed only once.
+        """
+        file_path = ref_traces[0]
+        if ref_link.lstrip().startswith('#'):
+            key = (file_path, ref_link)
+        else:
+            key = (os.path.dirname(file_path), ref_link)
+        traces = self._ref_links.get(key, None)
+        if traces is not None:
+            self.stats['refLinkHits'] += 1
+            return traces
+        self.stats['refLinkMisses'] += 1
+        traces = self._parse_ref_link(ref_traces, ref_link)
+        # intern the strings to share them between the traces and speed up the lookup of loaded objects
+        traces = tuple(sys.intern(trace) for trace in traces)
+        self._ref_links[key] = traces
+        return traces
+
     @classmethod
     def _parse_ref_link(cls, ref_traces, ref_link):
         file_path = ref_traces[0]
@@ -128,17 +296,10 @@ class SwaggerLoader:
             traces = [trace for trace in parts[1].split('/') if trace]
             return file_path, *traces
 
-        # find ref_file_path
-        file_path = os.path.dirname(file_path)
-        for s in parts[0].split('/'):
-            if s == '.':
-                continue
-            elif s == '':
-                continue
-            elif s == '..':
-                file_path = os.path.dirname(file_path)
-            else:
-                file_path = os.path.join(file_path, s)
+        # find ref_file_path, the path is normalized so that the aliases such as `a/../b` share the same traces
+        file_path = os.path.normpath(os.path.join(
+            os.path.dirname(file_path), *[s for s in parts[0].split('/') if s not in ('', '.')]
+        ))
         if len(parts) == 2:
             traces = [trace for trace in parts[1].split('/') if trace]
             return file_path, *traces
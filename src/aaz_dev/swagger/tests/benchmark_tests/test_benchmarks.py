@@ -0,0 +1,36 @@
+import shutil
+import tempfile
+from unittest import TestCase
+
+from swagger.benchmarks.runner import run_benchmarks, compare_results, STAGES
+from swagger.benchmarks.spec_generator import SyntheticSpecsGenerator
+
+
+class BenchmarkTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_spec_generator(self):
+        file_paths = SyntheticSpecsGenerator(
+            rp_count=2, version_count=2, resource_count=1, ref_depth=2).generate(self.folder)
+        self.assertEqual(len(file_paths), 4)
+
+    def test_run_benchmarks(self):
+        SyntheticSpecsGenerator(rp_count=1, version_count=1, resource_count=1, ref_depth=2).generate(self.folder)
+        results = run_benchmarks(self.folder, repeat=1)
+        self.assertEqual(set(results.keys()), set(STAGES.keys()))
+        for metrics in results.values():
+            self.assertGreater(metrics['wallTime'], 0)
+            self.assertGreater(metrics['tracedPeak'], 0)
+            self.assertIn('allocatedBlocks', metrics)
+
+    def test_compare_results(self):
+        baseline = {"loadAndLink": {"wallTime": 1.0, "tracedPeak": 100}}
+        self.assertEqual(compare_results({"loadAndLink": {"wallTime": 1.2, "tracedPeak": 100}}, baseline, 0.25), [])
+        regressions = compare_results({"loadAndLink": {"wallTime": 1.5, "tracedPeak": 90}}, baseline, 0.25)
+        self.assertEqual([(name, metric) for name, metric, *_ in regressions], [("loadAndLink", "wallTime")])
+        self.assertEqual(compare_results({"resourceMap": {"wallTime": 9.0}}, baseline, 0.25), [])
@@ -0,0 +1,89 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+
+from swagger.controller.specs_manager import SwaggerSpecsManager
+from utils.config import Config
+from utils.plane import PlaneEnum
+
+
+class SwaggerSpecsManagerCacheTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.rp_folder = os.path.join(
+            self.folder, 'specification', 'demo', 'resource-manager', 'Microsoft.Demo')
+        self.swagger_path = os.path.join(self.rp_folder, 'stable', '2021-01-01', 'demo.json')
+        self._write_swagger(['/subscriptions/{subscriptionId}/providers/Microsoft.Demo/foos'])
+        self._swagger_path_config = Config.SWAGGER_PATH
+        self._cache_folder_config = Config.AAZ_DEV_CACHE_FOLDER
+        Config.SWAGGER_PATH = self.folder
+        Config.AAZ_DEV_CACHE_FOLDER = os.path.join(self.folder, 'cache')
+
+    def tearDown(self):
+        Config.SWAGGER_PATH = self._swagger_path_config
+        Config.AAZ_DEV_CACHE_FOLDER = self._cache_folder_config
+        shutil.rmtree(self.folder)
+
+    def _write_swagger(self, paths):
+        os.makedirs(os.path.dirname(self.swagger_path), exist_ok=True)
+        body = {
+            "swagger": "2.0",
+            "info": {"version": "2021-01-01"},
+            "paths": {
+                path: {"get": {"operationId": f"Foos_Get{idx}"}} for idx, path in enumerate(paths)
+            }
+        }
+        with open(self.swagger_path, 'w', encoding='utf-8') as f:
+            json.dump(body, f)
+        # make sure the mtime is changed in the file systems with coarse timestamps
+        mtime = time.time() + len(paths)
+        os.utime(self.swagger_path, (mtime, mtime))
+
+    def test_shared_manager(self):
+        manager = SwaggerSpecsManager.get_shared()
+        self.assertIs(manager, SwaggerSpecsManager.get_shared())
+
+    def test_resource_map_invalidation(self):
+        manager = SwaggerSpecsManager()
+        self.assertEqual(len(manager.get_modules(PlaneEnum.Mgmt)), 1)
+        self.assertEqual(len(manager.get_modules(PlaneEnum.Mgmt)), 1)
+
+        module_manager = manager.get_module_manager(PlaneEnum.Mgmt, ['demo'])
+        rp = module_manager.get_openapi_resource_provider('Microsoft.Demo')
+        self.assertEqual(len(module_manager.get_resource_map(rp)), 1)
+        self.assertEqual(len(module_manager.get_resource_map(rp)), 1)
+        self.assertIs(manager.get_module_manager(PlaneEnum.Mgmt, ['demo']), module_manager)
+
+        self._write_swagger([
+            '/subscriptions/{subscriptionId}/providers/Microsoft.Demo/foos',
+            '/subscriptions/{subscriptionId}/providers/Microsoft.Demo/bars',
+        ])
+        # the module structure is not changed, so the module manager is reused
+        self.assertIs(manager.get_module_manager(PlaneEnum.Mgmt, ['demo']), module_manager)
+        self.assertEqual(len(module_manager.get_resource_map(rp)), 2)
+
+        stats = manager.get_cache_stats()
+        self.assertEqual(stats['modulesMisses'], 1)
+        self.assertEqual(stats['modulesHits'], 1)
+        self.assertEqual(stats['moduleManagerHits'], 2)
+        self.assertEqual(stats['resourceMapMisses'], 2)
+        self.assertEqual(stats['resourceMapHits'], 1)
+        self.assertEqual(stats['resourceMapInvalidations'], 1)
+
+        # the example files are not checked
+        examples_folder = os.path.join(os.path.dirname(self.swagger_path), 'examples')
+        os.makedirs(os.path.join(examples_folder, 'sub'))
+        with open(os.path.join(examples_folder, 'Foos_Get.json'), 'w', encoding='utf-8') as f:
+            json.dump({"parameters": {}}, f)
+        self.assertIs(manager.get_module_manager(PlaneEnum.Mgmt, ['demo']), module_manager)
+
+        # add a new resource provider
+        os.makedirs(os.path.join(os.path.dirname(self.rp_folder), 'Microsoft.Demo2'))
+        new_module_manager = manager.get_module_manager(PlaneEnum.Mgmt, ['demo'])
+        self.assertIsNot(new_module_manager, module_manager)
+        self.assertEqual(len(new_module_manager.get_resource_providers()), 2)
+        self.assertEqual(manager.get_cache_stats()['moduleManagerInvalidations'], 1)
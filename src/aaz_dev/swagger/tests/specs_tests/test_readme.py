@@ -0,0 +1,100 @@
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+
+from swagger.model.specs import OpenAPIResourceProvider
+from utils.readme_helper import load_readme_file, parse_readme_file
+
+README = """# Demo
+
+> see https://aka.ms/autorest
+
+``` yaml
+openapi-type: arm
+tag: package-2022-01
+```
+
+``` yaml
+directive:
+  - from: demo.json
+```
+
+### Tag: package-2022-01
+
+``` yaml $(tag) == 'package-2022-01'
+input-file:
+  - $(this-folder)/Microsoft.Demo/stable/2022-01-01/demo.json
+  - Microsoft.Demo/stable/2022-01-01/missing.json
+```
+
+### Tag: package-2021-01
+
+```yaml $(tag) == "package-2021-01"
+input-file:
+  - Microsoft.Demo/stable/2021-01-01/demo.json
+
+  - Microsoft.Demo/stable/2021-01-01/extra.json
+```
+
+``` yaml $(python)
+input-file:
+  - Microsoft.Demo/stable/2021-01-01/demo.json
+python:
+  # ```
+  namespace: demo
+```
+"""
+
+
+class ReadmeTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.rp_folder = os.path.join(self.folder, 'Microsoft.Demo')
+        for version, names in (('2021-01-01', ('demo.json', 'extra.json')), ('2022-01-01', ('demo.json', ))):
+            os.makedirs(os.path.join(self.rp_folder, 'stable', version))
+            for name in names:
+                with open(os.path.join(self.rp_folder, 'stable', version, name), 'w') as f:
+                    f.write('{}')
+        self.readme_path = os.path.join(self.folder, 'readme.md')
+        with open(self.readme_path, 'w', encoding='utf-8') as f:
+            f.write(README)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_parse_readme_file(self):
+        result = parse_readme_file(self.readme_path)
+        self.assertEqual(result['title'], 'Demo')
+        self.assertEqual(result['config'], {
+            'openapi-type': 'arm',
+            'tag': 'package-2022-01',
+            'directive': [{'from': 'demo.json'}],
+        })
+        # the config returned is a copy of the cached one
+        result['config']['directive'].append({'from': 'other.json'})
+        self.assertEqual(len(parse_readme_file(self.readme_path)['config']['directive']), 1)
+
+        readme_file = load_readme_file(self.readme_path)
+        self.assertEqual([tag for tag, _ in readme_file.tag_input_files], ['package-2022-01', 'package-2021-01'])
+        self.assertIs(load_readme_file(self.readme_path), readme_file)
+
+        with open(self.readme_path, 'a', encoding='utf-8') as f:
+            f.write("\n``` yaml\nlibrary-name: demo\n```\n")
+        mtime = time.time() + 10
+        os.utime(self.readme_path, (mtime, mtime))
+        self.assertIsNot(load_readme_file(self.readme_path), readme_file)
+        self.assertEqual(parse_readme_file(self.readme_path)['config']['library-name'], 'demo')
+
+    def test_resource_provider_tags(self):
+        rp = OpenAPIResourceProvider('Microsoft.Demo', self.rp_folder, [self.readme_path], swagger_module='mgmt-plane/demo')
+        tags = {str(tag): files for tag, files in rp.tags.items()}
+        self.assertEqual(tags, {
+            'package-2022-01': {os.path.join(self.rp_folder, 'stable', '2022-01-01', 'demo.json')},
+            'package-2021-01': {
+                os.path.join(self.rp_folder, 'stable', '2021-01-01', 'demo.json'),
+                os.path.join(self.rp_folder, 'stable', '2021-01-01', 'extra.json'),
+            },
+        })
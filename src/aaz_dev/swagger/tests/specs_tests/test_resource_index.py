@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from swagger.model.specs import OpenAPIResourceProvider
+from swagger.model.specs._resource_index import SwaggerResourceIndex, get_swagger_resource_index
+from swagger.model.specs._resource_provider import extract_resource_entries
+from utils.config import Config
+
+
+class SwaggerResourceIndexTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.rp_folder = os.path.join(
+            self.folder, 'specification', 'demo', 'resource-manager', 'Microsoft.Demo')
+        self.swagger_path = os.path.join(self.rp_folder, 'stable', '2021-01-01', 'demo.json')
+        os.makedirs(os.path.dirname(self.swagger_path))
+        with open(self.swagger_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "swagger": "2.0",
+                "info": {"version": "2021-01-01"},
+                "paths": {
+                    "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/foos/{fooName}": {
+                        "get": {"operationId": "Foos_Get"},
+                        "put": {"operationId": "Foos_Create"},
+                        "parameters": [],
+                    }
+                },
+                "x-ms-paths": {
+                    "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/foos/{fooName}?op=list": {
+                        "post": {"operationId": "Foos_List"},
+                    }
+                },
+                "definitions": {}
+            }, f)
+        self._cache_folder_config = Config.AAZ_DEV_CACHE_FOLDER
+        Config.AAZ_DEV_CACHE_FOLDER = os.path.join(self.folder, 'cache')
+
+    def tearDown(self):
+        index = get_swagger_resource_index()
+        if index is not None:
+            index.close()
+        Config.AAZ_DEV_CACHE_FOLDER = self._cache_folder_config
+        shutil.rmtree(self.folder)
+
+    def test_extract_resource_entries(self):
+        entries = extract_resource_entries(self.swagger_path)
+        self.assertEqual(entries, [
+            (
+                "/subscriptions/{}/providers/microsoft.demo/foos/{}",
+                "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/foos/{fooName}",
+                "2021-01-01",
+                {"Foos_Get": "get", "Foos_Create": "put"}
+            ),
+            (
+                "/subscriptions/{}/providers/microsoft.demo/foos/{}?op=list",
+                "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/foos/{fooName}?op=list",
+                "2021-01-01",
+                {"Foos_List": "post"}
+            ),
+        ])
+
+    def test_index_file_key(self):
+        index = SwaggerResourceIndex(os.path.join(self.folder, 'cache', 'test.db'))
+        entries = extract_resource_entries(self.swagger_path)
+        file_key = index.get_file_key(self.swagger_path)
+        self.assertIsNone(index.get(self.swagger_path, file_key))
+        index.update([(self.swagger_path, file_key, entries)])
+        self.assertEqual(index.get(self.swagger_path, file_key), entries)
+        self.assertIsNone(index.get(self.swagger_path, (file_key[0] + 1, file_key[1])))
+        index.remove([self.swagger_path])
+        self.assertIsNone(index.get(self.swagger_path, file_key))
+        index.close()
+
+    def test_resource_map_with_index(self):
+        rp = OpenAPIResourceProvider('Microsoft.Demo', self.rp_folder, [], swagger_module='mgmt-plane/demo')
+        resource_map = rp.get_resource_map()
+        index = get_swagger_resource_index()
+        self.assertEqual(
+            index.get(self.swagger_path, index.get_file_key(self.swagger_path)),
+            extract_resource_entries(self.swagger_path)
+        )
+
+        # the resources are loaded from index
+        rp = OpenAPIResourceProvider('Microsoft.Demo', self.rp_folder, [], swagger_module='mgmt-plane/demo')
+        indexed_resource_map = rp.get_resource_map()
+        self.assertEqual(indexed_resource_map.keys(), resource_map.keys())
+        for resource_id, version_map in resource_map.items():
+            for version, resource in version_map.items():
+                indexed_resource = indexed_resource_map[resource_id][version]
+                self.assertEqual(indexed_resource.path, resource.path)
+                self.assertEqual(indexed_resource.operations, resource.operations)
+                self.assertEqual(indexed_resource.file_path, resource.file_path)
+
+    def test_resource_map_with_executor(self):
+        for version in ('2021-01-01', '2022-01-01'):
+            swagger_path = os.path.join(self.rp_folder, 'stable', version, 'demo.json')
+            if not os.path.exists(swagger_path):
+                os.makedirs(os.path.dirname(swagger_path))
+                shutil.copyfile(self.swagger_path, swagger_path)
+
+        # disable index to make sure all files are parsed in executor
+        resource_index_config = Config.SWAGGER_RESOURCE_INDEX
+        Config.SWAGGER_RESOURCE_INDEX = False
+        try:
+            rp = OpenAPIResourceProvider('Microsoft.Demo', self.rp_folder, [], swagger_module='mgmt-plane/demo')
+            resource_map = rp.get_resource_map()
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                rp = OpenAPIResourceProvider('Microsoft.Demo', self.rp_folder, [], swagger_module='mgmt-plane/demo')
+                parallel_resource_map = rp.get_resource_map(executor=executor)
+        finally:
+            Config.SWAGGER_RESOURCE_INDEX = resource_index_config
+        self.assertEqual(parallel_resource_map.keys(), resource_map.keys())
+        for resource_id, version_map in resource_map.items():
+            self.assertEqual(parallel_resource_map[resource_id].keys(), version_map.keys())
+            for version, resource in version_map.items():
+                self.assertEqual(parallel_resource_map[resource_id][version].file_path, resource.file_path)
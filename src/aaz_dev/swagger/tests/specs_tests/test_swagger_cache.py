@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase, mock
+
+from swagger.model.specs import LinkedSwaggerCache, SwaggerLoader
+from utils.config import Config
+
+
+class LinkedSwaggerCacheTest(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.common_path = os.path.join(self.folder, 'common.json')
+        self._write_swagger(self.common_path, {}, {
+            "Foo": {"type": "object", "properties": {"name": {"type": "string"}}}
+        })
+        self.swagger_paths = []
+        for name in ('a', 'b'):
+            swagger_path = os.path.join(self.folder, f'{name}.json')
+            self._write_swagger(swagger_path, {
+                f"/subscriptions/{{subscriptionId}}/providers/Microsoft.Demo/{name}": {
+                    "get": {
+                        "operationId": f"{name}_Get",
+                        "responses": {"200": {"description": "OK", "schema": {"$ref": "./common.json#/definitions/Foo"}}}
+                    }
+                }
+            }, {})
+            self.swagger_paths.append(swagger_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    @staticmethod
+    def _write_swagger(file_path, paths, definitions, mtime=None):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "swagger": "2.0",
+                "info": {"title": "Demo", "version": "2021-01-01"},
+                "paths": paths,
+                "definitions": definitions,
+            }, f)
+        if mtime is not None:
+            # make sure the mtime is changed in the file systems with coarse timestamps
+            os.utime(file_path, (mtime, mtime))
+
+    def test_cache_hit_and_invalidation(self):
+        cache = LinkedSwaggerCache(max_size=1024 * 1024)
+        a_path = self.swagger_paths[0]
+        path = "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/a"
+        loader = cache.load(a_path)
+        self.assertTrue(loader.link_path_item(a_path, path).is_linked())
+        self.assertIsNotNone(loader.get_loaded(self.common_path))
+        self.assertIs(cache.load(a_path), loader)
+
+        self._write_swagger(self.common_path, {}, {
+            "Foo": {"type": "object", "properties": {"name": {"type": "integer"}}}
+        }, mtime=time.time() + 10)
+        new_loader = cache.load(a_path)
+        self.assertIsNot(new_loader, loader)
+        new_loader.link_path_item(a_path, path)
+        self.assertIs(cache.load(a_path), new_loader)
+
+        stats = cache.get_stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['invalidations'], 1)
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['size'], os.path.getsize(a_path) + os.path.getsize(self.common_path))
+
+    def test_cached_loader_not_modified(self):
+        a_path = self.swagger_paths[0]
+        path = "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/a"
+        for lazy in (False, True):
+            with mock.patch.object(Config, 'SWAGGER_LAZY_LINK', lazy):
+                loader = LinkedSwaggerCache(max_size=1024 * 1024).load(a_path)
+            foo = loader.get_loaded(self.common_path, 'definitions', 'Foo') or \
+                loader.get_loaded(self.common_path).definitions['Foo']
+            loaded = dict(loader._loaded)
+            templates = set(foo.resource_id_templates)
+            with mock.patch.object(SwaggerLoader, 'load_ref', side_effect=AssertionError("modified")):
+                loader.link_path_item(a_path, path)
+            self.assertEqual(loader._loaded, loaded)
+            self.assertEqual(foo.resource_id_templates, templates)
+            self.assertEqual(len(templates), 1)
+
+    def test_cache_eviction(self):
+        a_path, b_path = self.swagger_paths
+        # the size of an entry includes the referenced files
+        cache = LinkedSwaggerCache(max_size=os.path.getsize(a_path) + os.path.getsize(self.common_path) + 1)
+        a_loader = cache.load(a_path)
+        cache.load(b_path)
+        stats = cache.get_stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['entries'], 1)
+        self.assertLessEqual(stats['size'], stats['maxSize'])
+        self.assertIsNot(cache.load(a_path), a_loader)
+
+        cache = LinkedSwaggerCache(max_size=0)
+        self.assertIsNot(cache.load(a_path), cache.load(a_path))
+        self.assertEqual(cache.get_stats()['entries'], 0)
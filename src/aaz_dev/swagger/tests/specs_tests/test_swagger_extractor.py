@@ -0,0 +1,83 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from swagger.model.specs import _resource_provider
+from swagger.model.specs._resource_provider import extract_resource_entries
+from swagger.model.specs._swagger_extractor import extract_swagger_paths, parse_path_item_operations
+
+
+class SwaggerExtractorTest(TestCase):
+
+    BODY = {
+        "swagger": "2.0",
+        "info": {"version": "2021-01-01", "title": "Demo \"Client\" {[\\"},
+        "host": "management.azure.com",
+        "consumes": ["application/json"],
+        "paths": {
+            "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/foos/{fooName}": {
+                "parameters": [{"$ref": "#/parameters/FooName"}],
+                "get": {
+                    "operationId": "Foos_Get",
+                    "description": "Get a foo with \"name\" in { or [ 中文",
+                    "parameters": [{"name": "a", "in": "query", "type": "string", "enum": ["{", "]"]}],
+                    "responses": {"200": {"schema": {"$ref": "#/definitions/Foo"}}},
+                },
+                "delete": {"responses": {}},
+                "x-ms-extension": True,
+            },
+            "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/bars": {
+                "get": {"operationId": "Bars_List"},
+            },
+        },
+        "x-ms-paths": {
+            "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/bars?op=list": {
+                "post": {"operationId": "Bars_ListPost"},
+            },
+        },
+        "definitions": {
+            "Foo": {
+                "type": "object",
+                "description": "\\\"}]",
+                "properties": {"name": {"type": "string", "x-nullable": None, "default": 1.5e3}},
+                "allOf": [[], {}, {"$ref": "#/definitions/Bar"}],
+            },
+        },
+        "parameters": {"FooName": {"name": "fooName", "in": "path", "type": "string"}},
+    }
+
+    def test_extract_swagger_paths(self):
+        body = self.BODY
+        for text in (json.dumps(body), json.dumps(body, indent=2), json.dumps(body, ensure_ascii=False)):
+            result = extract_swagger_paths(text)
+            self.assertEqual(result['swagger'], body['swagger'])
+            self.assertEqual(result['info'], body['info'])
+            for key in ('paths', 'x-ms-paths'):
+                self.assertEqual(list(result[key].items()), [
+                    (path, parse_path_item_operations(value)) for path, value in body[key].items()
+                ])
+            self.assertNotIn('definitions', result)
+
+    def test_extract_invalid_swagger(self):
+        text = json.dumps(self.BODY)
+        for invalid_text in (text[:-1], text[:len(text) // 2], text + '{', '[]', '{"swagger": "2.0",}'):
+            with self.assertRaises(ValueError):
+                extract_swagger_paths(invalid_text)
+
+    def test_extract_resource_entries(self):
+        folder = tempfile.mkdtemp()
+        file_path = os.path.join(folder, 'demo.json')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.BODY, f, indent=2)
+        min_size = _resource_provider.STREAMING_EXTRACT_MIN_SIZE
+        try:
+            entries = extract_resource_entries(file_path)
+            _resource_provider.STREAMING_EXTRACT_MIN_SIZE = 0
+            streaming_entries = extract_resource_entries(file_path)
+        finally:
+            _resource_provider.STREAMING_EXTRACT_MIN_SIZE = min_size
+            shutil.rmtree(folder)
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(streaming_entries, entries)
@@ -0,0 +1,267 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from swagger.controller.command_generator import SwaggerCommandGenerator
+from swagger.model.schema.cmd_builder import CMDBuilder
+from swagger.model.schema.fields import MutabilityEnum
+from swagger.model.specs import LinkedSwaggerCache, SwaggerLoader
+from utils.config import Config
+
+
+class SwaggerLazyLinkTest(TestCase):
+
+    FOO_PATH = "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/foos/{fooName}"
+    BAR_PATH = "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/bars"
+    ZOO_PATH = "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/zoos/{zooName}"
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.common_path = os.path.join(self.folder, 'common.json')
+        self.swagger_path = os.path.join(self.folder, 'demo.json')
+        self._dump(self.common_path, {}, {
+            "Resource": {
+                "type": "object",
+                "properties": {"id": {"type": "string", "readOnly": True}},
+                "x-ms-azure-resource": True,
+            },
+            "Unused": {"type": "object", "properties": {"name": {"type": "string"}}},
+            "Cat": {
+                "type": "object",
+                "x-ms-discriminator-value": "cat",
+                "allOf": [{"$ref": "./demo.json#/definitions/Pet"}],
+                "properties": {"meow": {"type": "boolean"}},
+            },
+        })
+        self._dump(self.swagger_path, {
+            self.FOO_PATH: {
+                "get": {
+                    "operationId": "Foos_Get",
+                    "parameters": [{"$ref": "#/parameters/FooNameParameter"}],
+                    "responses": {"200": {"description": "OK", "schema": {"$ref": "#/definitions/Foo"}}},
+                }
+            },
+            self.BAR_PATH: {
+                "get": {
+                    "operationId": "Bars_List",
+                    "responses": {"200": {"description": "OK", "schema": {"$ref": "#/definitions/Bar"}}},
+                }
+            },
+        }, {
+            "Foo": {
+                "type": "object",
+                "allOf": [{"$ref": "./common.json#/definitions/Resource"}],
+                "properties": {"pet": {"$ref": "#/definitions/Pet"}},
+            },
+            "Pet": {
+                "type": "object",
+                "discriminator": "kind",
+                "required": ["kind"],
+                "properties": {"kind": {"type": "string"}},
+            },
+            "Dog": {
+                "type": "object",
+                "x-ms-discriminator-value": "dog",
+                "allOf": [{"$ref": "#/definitions/Pet"}],
+                "properties": {"bark": {"type": "boolean"}},
+            },
+            "Bar": {"type": "object", "properties": {"name": {"type": "string"}}},
+        }, parameters={
+            "FooNameParameter": {"name": "fooName", "in": "path", "required": True, "type": "string"},
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    @staticmethod
+    def _dump(file_path, paths, definitions, parameters=None):
+        body = {
+            "swagger": "2.0",
+            "info": {"title": "Demo", "version": "2021-01-01"},
+            "paths": paths,
+            "definitions": definitions,
+        }
+        if parameters:
+            body["parameters"] = parameters
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(body, f)
+
+    def test_lazy_link_path_item(self):
+        loader = SwaggerLoader(lazy=True)
+        loader.load_file(self.swagger_path)
+        loader.link_swaggers()
+        # the items with references are linked with the swaggers, so path items are not changed after that
+        foo = loader.get_loaded(self.swagger_path, 'definitions', 'Foo')
+        self.assertTrue(foo.is_linked())
+        self.assertTrue(loader.get_loaded(self.swagger_path).paths[self.BAR_PATH].is_linked())
+
+        path_item = loader.link_path_item(self.swagger_path, self.FOO_PATH)
+        self.assertTrue(path_item.is_linked())
+        self.assertEqual(path_item.get.parameters[0].name, 'fooName')
+        self.assertIsNone(loader.link_path_item(self.swagger_path, '/not/exist'))
+        self.assertIs(path_item.get.responses['200'].schema.ref_instance, foo)
+        self.assertTrue(foo.x_ms_azure_resource)
+        pet = loader.get_loaded(self.swagger_path, 'definitions', 'Pet')
+        self.assertEqual(set(pet.disc_children.keys()), {'cat', 'dog'})
+        # the definitions without reference are kept raw until they're referenced
+        self.assertIsNone(loader.get_loaded(self.common_path, 'definitions', 'Unused'))
+
+    def test_lazy_link_equivalence(self):
+        eager_loader = SwaggerLoader()
+        eager_loader.load_file(self.swagger_path)
+        eager_loader.link_swaggers()
+        lazy_loader = SwaggerLoader(lazy=True)
+        lazy_loader.load_file(self.swagger_path)
+        lazy_loader.link_swaggers()
+
+        for path in (self.FOO_PATH, self.BAR_PATH):
+            eager_path_item = eager_loader.link_path_item(self.swagger_path, path)
+            lazy_path_item = lazy_loader.link_path_item(self.swagger_path, path)
+            self.assertEqual(lazy_path_item.traces, eager_path_item.traces)
+            self.assertEqual(
+                [param.name for param in lazy_path_item.get.parameters or []],
+                [param.name for param in eager_path_item.get.parameters or []],
+            )
+            eager_schema = eager_path_item.get.responses['200'].schema.ref_instance
+            lazy_schema = lazy_path_item.get.responses['200'].schema.ref_instance
+            self.assertEqual(lazy_schema.traces, eager_schema.traces)
+            self.assertEqual(lazy_schema.x_ms_azure_resource, eager_schema.x_ms_azure_resource)
+            self.assertEqual(
+                {k: v.ref_instance.traces if v.ref_instance else v.traces for k, v in lazy_schema.properties.items()},
+                {k: v.ref_instance.traces if v.ref_instance else v.traces for k, v in eager_schema.properties.items()},
+            )
+
+        eager_pet = eager_loader.get_loaded(self.swagger_path).definitions['Pet']
+        lazy_pet = lazy_loader.get_loaded(self.swagger_path, 'definitions', 'Pet')
+        self.assertEqual(
+            {k: v.traces for k, v in lazy_pet.disc_children.items()},
+            {k: v.traces for k, v in eager_pet.disc_children.items()},
+        )
+
+    def _dump_zoo(self):
+        """The discriminator child Bird is in a file which is only referenced by an unused definition."""
+        zoo_path = os.path.join(self.folder, 'zoo.json')
+        self._dump(zoo_path, {
+            self.ZOO_PATH: {
+                "get": {
+                    "operationId": "Zoos_Get",
+                    "parameters": [{"name": "zooName", "in": "path", "required": True, "type": "string"}],
+                    "responses": {"200": {"description": "OK", "schema": {"$ref": "#/definitions/Zoo"}}},
+                }
+            },
+        }, {
+            "Zoo": {"type": "object", "properties": {"pet": {"$ref": "./demo.json#/definitions/Pet"}}},
+            "Cage": {"type": "object", "properties": {"perch": {"$ref": "./birds.json#/definitions/Perch"}}},
+        })
+        self._dump(os.path.join(self.folder, 'birds.json'), {}, {
+            "Perch": {"type": "object", "properties": {"height": {"type": "integer"}}},
+            "Bird": {
+                "type": "object",
+                "x-ms-discriminator-value": "bird",
+                "allOf": [{"$ref": "./demo.json#/definitions/Pet"}],
+                "properties": {"wings": {"type": "integer"}},
+            },
+        })
+        return zoo_path
+
+    @staticmethod
+    def _generate_operations(file_path, paths):
+        """Return the operations generated from the path items in eager and lazy mode."""
+        operations = {}
+        for lazy in (False, True):
+            with mock.patch.object(Config, 'SWAGGER_LAZY_LINK', lazy):
+                cache = LinkedSwaggerCache(max_size=0)
+                with mock.patch.object(LinkedSwaggerCache, 'get_shared', return_value=cache):
+                    generator = SwaggerCommandGenerator()
+                loader = cache.load(file_path)
+            operations[lazy] = []
+            for path in paths:
+                cmd_builder = CMDBuilder(path=path, method='get', mutability=MutabilityEnum.Read)
+                path_item = loader.link_path_item(file_path, path)
+                operations[lazy].append(generator.generate_operation(cmd_builder, path_item, None).to_primitive())
+        return operations[False], operations[True]
+
+    def test_lazy_link_cross_file_disc_children(self):
+        zoo_path = self._dump_zoo()
+        eager_operations, lazy_operations = self._generate_operations(zoo_path, [self.ZOO_PATH])
+        self.assertIn('bird', json.dumps(lazy_operations))
+        self.assertEqual(lazy_operations, eager_operations)
+
+    def test_lazy_link_shared_response_schema(self):
+        swagger_path = os.path.join(self.folder, 'shared.json')
+        paths = [
+            "/subscriptions/{subscriptionId}/providers/Microsoft.Demo/foos/{fooName}",
+            "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Demo/foos/{fooName}",
+        ]
+        self._dump(swagger_path, {
+            path: {
+                "get": {
+                    "operationId": f"Foos_Get{idx}",
+                    "responses": {"200": {"description": "OK", "schema": {"$ref": "#/definitions/Foo"}}},
+                }
+            } for idx, path in enumerate(paths)
+        }, {
+            "Foo": {
+                "type": "object",
+                "properties": {"id": {"type": "string", "readOnly": True}, "name": {"type": "string"}},
+                "x-ms-azure-resource": True,
+            },
+        })
+        # the templates of all the get paths are collected, whichever path is used in generation
+        for used_paths in (paths[:1], paths[1:]):
+            eager_operations, lazy_operations = self._generate_operations(swagger_path, used_paths)
+            self.assertEqual(lazy_operations, eager_operations)
+        self.assertNotIn('template', json.dumps(lazy_operations))
+
+    def test_link_path_item_once(self):
+        loader = SwaggerLoader(lazy=True)
+        loader.load_file(self.swagger_path)
+        loader.link_swaggers()
+        path_item = loader.link_path_item(self.swagger_path, self.FOO_PATH)
+        with mock.patch.object(type(path_item), 'link') as link:
+            self.assertIs(loader.link_path_item(self.swagger_path, self.FOO_PATH), path_item)
+        link.assert_not_called()
+
+    def test_loader_stats(self):
+        for lazy in (False, True):
+            loader = SwaggerLoader(lazy=lazy)
+            loader.load_file(self.swagger_path)
+            loader.link_swaggers()
+            loader.link_path_item(self.swagger_path, self.FOO_PATH)
+            self.assertTrue(all(swagger.is_linked() for swagger in loader.loaded_swaggers.values()))
+            self.assertEqual([*loader.loaded_swaggers.keys()], [self.swagger_path, self.common_path])
+
+            stats = loader.get_stats()
+            self.assertEqual(stats['filesLoaded'], 2)
+            self.assertGreater(stats['refsResolved'], stats['refCacheHits'])
+            self.assertGreater(stats['refCacheHits'], 0)
+            self.assertIn(self.swagger_path, loader.link_times)
+            with self.assertLogs('backend', level='DEBUG') as logs:
+                loader.log_stats()
+            self.assertIn('files loaded: 2', logs.output[0])
+
+    def test_resolve_ref_link(self):
+        loader = SwaggerLoader()
+        sub_file_path = os.path.join(self.folder, 'sub', 'demo.json')
+        common_traces = (self.common_path, 'definitions', 'Resource')
+        self.assertEqual(
+            loader._resolve_ref_link((self.swagger_path, 'paths'), './common.json#/definitions/Resource'),
+            common_traces)
+        self.assertEqual(
+            loader._resolve_ref_link((sub_file_path, 'paths'), '../sub/../common.json#/definitions/Resource'),
+            common_traces)
+        # the same link in the files under the same folder is cached
+        self.assertIs(
+            loader._resolve_ref_link((self.common_path, 'definitions'), './common.json#/definitions/Resource'),
+            loader._resolve_ref_link((self.swagger_path, 'paths'), './common.json#/definitions/Resource'))
+        # the local links are cached by file
+        self.assertEqual(
+            loader._resolve_ref_link((self.swagger_path, 'paths'), '#/definitions/Pet'),
+            (self.swagger_path, 'definitions', 'Pet'))
+        self.assertEqual(
+            loader._resolve_ref_link((self.common_path, 'paths'), '#/definitions/Pet'),
+            (self.common_path, 'definitions', 'Pet'))
+        self.assertEqual(loader.stats['refLinkMisses'], 4)
+        self.assertEqual(loader.stats['refLinkHits'], 2)
@@ -24,6 +24,30 @@ class Config:
     AAZ_DEV_WORKSPACE_FOLDER = os.path.expanduser(
         os.environ.get("AAZ_DEV_WORKSPACE_FOLDER", os.path.join(AAZ_DEV_FOLDER, "workspaces"))
     )
+    # the folder to persist caches, it's in AAZ_DEV_FOLDER by default
+    AAZ_DEV_CACHE_FOLDER = os.environ.get("AAZ_DEV_CACHE_FOLDER", None)
+
+    SWAGGER_RESOURCE_INDEX = os.environ.get("AAZ_SWAGGER_RESOURCE_INDEX", "true").lower() not in ("false", "0", "no")
+    # the budget in MB of the swagger files whose linked documents are kept in memory, 0 to disable the cache
+    SWAGGER_CACHE_MAX_SIZE = int(os.environ.get("AAZ_SWAGGER_CACHE_MAX_SIZE", 256))
+    # keep the definitions and parameters without reference unconverted until they are referenced
+    SWAGGER_LAZY_LINK = os.environ.get("AAZ_SWAGGER_LAZY_LINK", "true").lower() not in ("false", "0", "no")
+    # claim all the candidate models when deserializing polymorphic fields to detect ambiguous models
+    STRICT_POLYMORPHIC_CLAIM = os.environ.get("AAZ_STRICT_POLYMORPHIC_CLAIM", "false").lower() in ("true", "1", "yes")
+    # the number of resource cfg readers kept in memory for read only consumers, 0 to disable the cache
+    CFG_READER_CACHE_SIZE = int(os.environ.get("AAZ_CFG_READER_CACHE_SIZE", 512))
+    # the number of parsed readme files of aaz command tree shared by read only consumers, 0 to disable the cache
+    SPECS_COMMAND_TREE_CACHE_SIZE = int(os.environ.get("AAZ_SPECS_COMMAND_TREE_CACHE_SIZE", 32768))
+    # record the inputs of generated command files in the cache folder to skip rendering the unchanged commands
+    CLI_GENERATION_MANIFEST = os.environ.get("AAZ_CLI_GENERATION_MANIFEST", "true").lower() not in ("false", "0", "no")
+    # max number of aaz files and folders in the shared view index used to load modules, 0 to disable the index
+    CLI_VIEW_INDEX_SIZE = int(os.environ.get("AAZ_CLI_VIEW_INDEX_SIZE", 65536))
+    # the number of workspace resource cfg files indexed to find similar arguments, 0 to disable the index
+    WORKSPACE_ARG_INDEX_SIZE = int(os.environ.get("AAZ_WORKSPACE_ARG_INDEX_SIZE", 512))
+    # the number of loaded workspaces kept in memory between editor requests, 0 to disable the sessions
+    WORKSPACE_SESSION_CACHE_SIZE = int(os.environ.get("AAZ_WORKSPACE_SESSION_CACHE_SIZE", 16))
+    # the seconds a workspace session can be idle before it's evicted
+    WORKSPACE_SESSION_IDLE_TIMEOUT = int(os.environ.get("AAZ_WORKSPACE_SESSION_IDLE_TIMEOUT", 600))
 
     # Flask configurations
     HOST = os.environ.get("AAZ_HOST", '127.0.0.1')
@@ -115,6 +139,18 @@ class Config:
                 raise ValueError(f"Path '{cls.AAZ_DEV_WORKSPACE_FOLDER}' is not a folder.")
         return cls.AAZ_DEV_WORKSPACE_FOLDER
     
+    @classmethod
+    def get_cache_folder(cls):
+        if cls.AAZ_DEV_CACHE_FOLDER:
+            return os.path.expanduser(cls.AAZ_DEV_CACHE_FOLDER)
+        return os.path.join(cls.AAZ_DEV_FOLDER, "cache")
+
+    @classmethod
+    def get_swagger_resource_index_path(cls):
+        if not cls.SWAGGER_RESOURCE_INDEX:
+            return None
+        return os.path.join(cls.get_cache_folder(), "swagger_resources.db")
+
     @classmethod
     def get_swagger_root(cls):
         if cls.SWAGGER_PATH:
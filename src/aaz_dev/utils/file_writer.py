@@ -0,0 +1,343 @@
+import hashlib
+import itertools
+import json
+import logging
+import os
+import re
+import shutil
+import stat
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # not supported on windows, the folder lock only works in current process
+    fcntl = None
+
+logger = logging.getLogger('backend')
+
+_tmp_file_counter = itertools.count()
+
+# the temp file of `AtomicFileWriter.write`: .<name>.<pid>.<n>.tmp
+_tmp_file_re = re.compile(r'^\..+\.(?P<pid>\d+)\.\d+\.tmp$')
+
+_folder_locks = {}
+_folder_locks_lock = threading.Lock()
+
+
+def _digest(content):
+    return hashlib.sha256(content).digest()
+
+
+class AtomicFileWriter:
+    """Write files through temp files and os.replace, the files with the same content on disk are skipped.
+
+    The temp file is synced to disk before it's moved in place, so is the folder after that. The temp files left by
+    the crashed processes are removed when the folder is written next time.
+    The stats counts the files and bytes written, skipped and removed.
+    """
+
+    def __init__(self, encoding="utf-8"):
+        self.encoding = encoding
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._cleaned_folders = set()
+
+    def write(self, path, data):
+        """Write text data to file, return False if the file is not changed."""
+        content = self._encode(data)
+        file_stat = self._stat(path)
+        if self._is_unchanged(path, file_stat, content):
+            self._count('skipped', len(content))
+            return False
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._clean_stale_tmp_files(folder)
+        tmp_path = os.path.join(folder, f".{os.path.basename(path)}.{os.getpid()}.{next(_tmp_file_counter)}.tmp")
+        try:
+            with open(tmp_path, 'xb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            if file_stat is not None:
+                os.chmod(tmp_path, stat.S_IMODE(file_stat.st_mode))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        # the rename is durable after the folder is synced
+        _fsync_folder(folder or os.curdir)
+        self._count('written', len(content))
+        return True
+
+    def remove(self, path):
+        """Remove file, return False if it's not exist."""
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        self._count('removed', size)
+        return True
+
+    def remove_folder(self, path):
+        if not os.path.exists(path):
+            return False
+        shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            self.stats['removedFolders'] += 1
+        return True
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats)
+
+    def log_stats(self, name, level=logging.DEBUG):
+        if not logger.isEnabledFor(level):
+            return
+        stats = self.get_stats()
+        logger.log(
+            level,
+            f"{name}: written {stats.get('written', 0)} files ({stats.get('writtenBytes', 0)} bytes), "
+            f"skipped {stats.get('skipped', 0)} unchanged files ({stats.get('skippedBytes', 0)} bytes), "
+            f"removed {stats.get('removed', 0)} files ({stats.get('removedBytes', 0)} bytes) "
+            f"and {stats.get('removedFolders', 0)} folders"
+        )
+
+    def _encode(self, data):
+        if os.linesep != '\n':
+            # keep the line endings of text mode writing
+            data = data.replace('\n', os.linesep)
+        return data.encode(self.encoding)
+
+    @staticmethod
+    def _stat(path):
+        try:
+            return os.stat(path)
+        except FileNotFoundError:
+            return None
+
+    def _is_unchanged(self, path, file_stat, content):
+        return file_stat is not None and file_stat.st_size == len(content) and \
+            self._read_digest(path) == _digest(content)
+
+    def _read_digest(self, path):
+        try:
+            with open(path, 'rb') as f:
+                return _digest(f.read())
+        except OSError:
+            return None
+
+    def _count(self, key, size):
+        with self._lock:
+            self.stats[key] += 1
+            self.stats[f'{key}Bytes'] += size
+
+    def _clean_stale_tmp_files(self, folder):
+        """Remove the temp files in folder left by the processes which are not running, once per folder."""
+        with self._lock:
+            if folder in self._cleaned_folders:
+                return
+            self._cleaned_folders.add(folder)
+        for name in os.listdir(folder or os.curdir):
+            match = _tmp_file_re.match(name)
+            if not match or _is_process_running(int(match.group('pid'))):
+                continue
+            try:
+                os.remove(os.path.join(folder, name))
+            except OSError:
+                continue
+            with self._lock:
+                self.stats['removedTmpFiles'] += 1
+
+
+@contextmanager
+def folder_lock(folder):
+    """Hold an exclusive advisory lock of the folder, it's shared by the threads and processes on the same folder."""
+    key = os.path.realpath(folder)
+    with _folder_locks_lock:
+        lock = _folder_locks.setdefault(key, threading.Lock())
+    with lock:
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(folder, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # the lock is released when the file descriptor is closed
+            os.close(fd)
+
+
+def _is_process_running(pid):
+    if pid == os.getpid():
+        # the temp files of current process are removed when the writing fails
+        return True
+    if os.name == 'nt':
+        # os.kill terminates the process on windows, the temp files are kept
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # the process of other users is running
+        return True
+    return True
+
+
+def _fsync_folder(folder):
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        # folder is not able to be opened on windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class JournaledFileWriter(AtomicFileWriter):
+    """Write the files under a folder together, the changed files are committed by a journal.
+
+    The files added by `add_file` are written into a staging folder in parallel and synced to disk by `commit`, then
+    a journal of the operations is saved before they're moved in place in the order they're added, so the file which
+    marks the commit should be added last. The inherited `write`, `remove` and `remove_folder` still take effect
+    immediately. The commit interrupted by a crash is rolled forward by `recover` from the journal. It should be used with
+    `folder_lock` to serialize the commits of the folder.
+    """
+
+    JOURNAL_NAME = ".journal.json"
+    STAGING_PREFIX = ".staging."
+
+    def __init__(self, folder, encoding="utf-8", jobs=None):
+        super().__init__(encoding=encoding)
+        self.folder = folder
+        self._jobs = jobs or min(8, os.cpu_count() or 1)
+        self._update_files = []
+        self._remove_folders = []
+
+    def add_file(self, path, data):
+        """Add text data of file to commit, the unchanged file is skipped in commit."""
+        self._update_files.append((path, data))
+
+    def add_folder_removal(self, path):
+        """Add folder to remove in commit, the folders are removed before the files are moved in place."""
+        self._remove_folders.append(path)
+
+    def commit(self):
+        self.recover(self.folder)
+        staging_folder = os.path.join(
+            self.folder, f"{self.STAGING_PREFIX}{os.getpid()}.{next(_tmp_file_counter)}")
+        os.makedirs(staging_folder)
+        journal_path = os.path.join(self.folder, self.JOURNAL_NAME)
+        try:
+            staged_paths = [os.path.join(staging_folder, str(idx)) for idx in range(len(self._update_files))]
+            with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+                staged = [
+                    (staged_path, path)
+                    for staged_path, (path, _), changed in zip(
+                        staged_paths, self._update_files,
+                        executor.map(self._stage, staged_paths, self._update_files))
+                    if changed
+                ]
+            _fsync_folder(staging_folder)
+
+            journal = {
+                "removeFolders": [
+                    os.path.relpath(path, self.folder) for path in self._remove_folders if os.path.exists(path)
+                ],
+                "replaces": [
+                    [os.path.relpath(staged_path, self.folder), os.path.relpath(path, self.folder)]
+                    for staged_path, path in staged
+                ],
+            }
+            if journal["removeFolders"] or journal["replaces"]:
+                tmp_path = os.path.join(staging_folder, self.JOURNAL_NAME)
+                with open(tmp_path, 'x', encoding="utf-8") as f:
+                    json.dump(journal, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # the journal is committed atomically, the operations after it will be rolled forward after crash
+                os.replace(tmp_path, journal_path)
+                _fsync_folder(self.folder)
+                self._apply_journal(self.folder, journal)
+                os.remove(journal_path)
+            with self._lock:
+                self.stats['removedFolders'] += len(journal["removeFolders"])
+        except BaseException:
+            if not os.path.exists(journal_path):
+                # the staging folder of the committed journal is kept to roll forward
+                shutil.rmtree(staging_folder, ignore_errors=True)
+            raise
+        shutil.rmtree(staging_folder, ignore_errors=True)
+        self._update_files = []
+        self._remove_folders = []
+
+    def _stage(self, staged_path, update_file):
+        """Write the file data into staging folder and sync it to disk, return False if the file is not changed."""
+        path, data = update_file
+        content = self._encode(data)
+        file_stat = self._stat(path)
+        if self._is_unchanged(path, file_stat, content):
+            self._count('skipped', len(content))
+            return False
+        with open(staged_path, 'xb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if file_stat is not None:
+            os.chmod(staged_path, stat.S_IMODE(file_stat.st_mode))
+        self._count('written', len(content))
+        return True
+
+    @classmethod
+    def recover(cls, folder):
+        """Roll forward the commit interrupted in folder and clean the staging folders, return True if it's recovered."""
+        journal_path = os.path.join(folder, cls.JOURNAL_NAME)
+        recovered = False
+        if os.path.exists(journal_path):
+            with open(journal_path, 'r', encoding="utf-8") as f:
+                journal = json.load(f)
+            logger.warning(f"Recover the interrupted commit in folder: {folder}")
+            cls._apply_journal(folder, journal)
+            os.remove(journal_path)
+            recovered = True
+        if os.path.isdir(folder):
+            for name in os.listdir(folder):
+                if name.startswith(cls.STAGING_PREFIX):
+                    shutil.rmtree(os.path.join(folder, name), ignore_errors=True)
+        return recovered
+
+    @classmethod
+    def has_journal(cls, folder):
+        return os.path.exists(os.path.join(folder, cls.JOURNAL_NAME))
+
+    @staticmethod
+    def _apply_journal(folder, journal):
+        for rel_path in journal["removeFolders"]:
+            shutil.rmtree(os.path.join(folder, rel_path), ignore_errors=True)
+        updated_folders = set()
+        for staged_rel_path, rel_path in journal["replaces"]:
+            staged_path = os.path.join(folder, staged_rel_path)
+            if not os.path.exists(staged_path):
+                # it's moved in place before the commit is interrupted
+                continue
+            path = os.path.join(folder, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(staged_path, path)
+            updated_folders.add(os.path.dirname(path))
+        for updated_folder in updated_folders:
+            _fsync_folder(updated_folder)
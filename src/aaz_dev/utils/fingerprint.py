@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+
+logger = logging.getLogger('backend')
+
+
+def file_fingerprint(path):
+    """Return the (mtime_ns, size, inode) tuple of a file, or None if it's not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def folder_fingerprint(folder_path, file_filter=None, dir_filter=None):
+    """Return a digest of the directory structure under the folder and the stat of the files accepted by file_filter.
+
+    The digest changes when a sub folder or an accepted file is added, removed, renamed or modified.
+    """
+    if not folder_path or not os.path.isdir(folder_path):
+        return None
+    digest = hashlib.sha1()
+    _update_folder_digest(digest, folder_path, '', file_filter, dir_filter)
+    return digest.hexdigest()
+
+
+def _update_folder_digest(digest, path, rel_path, file_filter, dir_filter):
+    try:
+        entries = sorted(os.scandir(path), key=lambda e: e.name)
+    except OSError:
+        return
+    digest.update(f"d:{rel_path}\n".encode('utf-8'))
+    for entry in entries:
+        entry_rel_path = f"{rel_path}/{entry.name}"
+        if entry.is_dir():
+            if dir_filter is None or dir_filter(entry.name):
+                _update_folder_digest(digest, entry.path, entry_rel_path, file_filter, dir_filter)
+        elif file_filter is None or file_filter(entry.name):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            digest.update(f"f:{entry_rel_path}:{stat.st_mtime_ns}:{stat.st_size}:{stat.st_ino}\n".encode('utf-8'))
+
+
+class FingerprintCache:
+    """Thread safe LRU cache of the values loaded from files, an entry is invalidated when its files are modified.
+
+    The least recently used entries are evicted when there are more than max_entries, 0 to disable the cache. The
+    cached values are shared by all the callers, they should not be modified.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.stats = Counter()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path, loader, key=None, dependencies=None):
+        """Return the value loaded from the file by loader(path), the loader is called when it's not cached.
+
+        :param key: the key of the entry, it's the path by default.
+        :param dependencies: return the paths of the other files which the loaded value depends on, the entry is
+            invalidated when any of them is modified too.
+        """
+        if key is None:
+            key = path
+        fingerprint = file_fingerprint(path)
+        with self._lock:
+            entry = self._entries.get(key, None)
+        if entry is not None:
+            fingerprints, value = entry
+            if fingerprint is not None and fingerprints[0] == (path, fingerprint) and \
+                    all(file_fingerprint(p) == f for p, f in fingerprints[1:]):
+                with self._lock:
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                    self.stats['hits'] += 1
+                return value
+            with self._lock:
+                if self._entries.get(key, None) is entry:
+                    del self._entries[key]
+                self.stats['invalidations'] += 1
+
+        value = loader(path)
+        fingerprints = ((path, fingerprint), )
+        if dependencies is not None:
+            fingerprints += tuple((p, file_fingerprint(p)) for p in dependencies(value))
+
+        with self._lock:
+            self.stats['misses'] += 1
+            if all(f is not None for _, f in fingerprints):
+                self._put(key, (fingerprints, value))
+        return value
+
+    def is_cached(self, path, fingerprint, key=None):
+        """Whether the value loaded from the file of the fingerprint is in cache."""
+        if key is None:
+            key = path
+        with self._lock:
+            entry = self._entries.get(key, None)
+        return entry is not None and entry[0][0] == (path, fingerprint) and \
+            all(file_fingerprint(p) == f for p, f in entry[0][1:])
+
+    def add(self, path, fingerprint, value, key=None):
+        """Put the value loaded from the file of the fingerprint in cache, the fingerprint should be taken before the
+        file is read."""
+        if key is None:
+            key = path
+        if fingerprint is None:
+            return
+        with self._lock:
+            self._put(key, (((path, fingerprint), ), value))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                **self.stats,
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+            }
+
+    def _put(self, key, entry):
+        # should be called with the lock acquired
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+            logger.debug(f"{self.__class__.__name__}: evict {evicted}")
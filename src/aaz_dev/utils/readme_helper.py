@@ -1,5 +1,24 @@
+import copy
+import logging
+import re
+import threading
+from collections import namedtuple
+
 import yaml
 
+from utils.fingerprint import file_fingerprint
+
+logger = logging.getLogger('backend')
+
+# use the libyaml based loader when it's available, which is much faster than the pure python one
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_YAML_FENCE_RE = re.compile(r'```\s*yaml(.*)$')
+_TAG_CONDITION_RE = re.compile(r'\$\(\s*tag\s*\)\s*==\s*[\'"]\s*(.*)\s*[\'"]')
+
+ReadmeYamlBlock = namedtuple('ReadmeYamlBlock', ['condition', 'text'])
+
+
 def _update_config(config, yaml_content):
     for key, value in yaml_content.items():
         if key not in config:
@@ -12,39 +31,113 @@ def _update_config(config, yaml_content):
         else:
             config[key] = value
 
-def parse_readme_file(readme_path: str):
-    """Parse the readme file title and combine basic config in the yaml section."""
-    readme_config = {}
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        content = f.readlines()
-    # content.append("```") # append a fake yaml section to make sure the last yaml section is ended
-    readme_title = None
-    in_yaml_section = False
-    yaml_content = []
-    for line in content:
-        if not readme_title and line.strip().startswith("# ") and not in_yaml_section:
-            readme_title = line.strip()[2:].strip()
-        if line.strip().startswith("```") and 'yaml' in line:
-            condition = line.split('yaml')[1].strip()
-            # Do not parse the yaml section if it has the condition
-            if not condition:
-                in_yaml_section = True
-        elif in_yaml_section:
-            if line.strip().startswith("```"):
+
+def safe_load_yaml(text):
+    return yaml.load(text, Loader=_YamlLoader)
+
+
+class ReadmeFile:
+    """The structured content of a readme file: the title and the yaml code blocks."""
+
+    def __init__(self, readme_path, title, blocks):
+        self.readme_path = readme_path
+        self.title = title
+        self.blocks = blocks
+        self._config = None
+        self._tag_input_files = None
+
+    @classmethod
+    def parse(cls, readme_path, content):
+        """Scan the lines of readme once, the yaml blocks are not decoded until they are used."""
+        title = None
+        blocks = []
+        condition = None
+        block_lines = None
+        for line in content.splitlines():
+            stripped = line.strip()
+            if block_lines is None:
+                if not title and stripped.startswith("# "):
+                    title = stripped[2:].strip()
+                match = _YAML_FENCE_RE.match(stripped)
+                if match:
+                    condition = match[1].strip()
+                    block_lines = []
+            elif stripped.startswith("```"):
+                blocks.append(ReadmeYamlBlock(condition, "\n".join(block_lines)))
+                block_lines = None
+            else:
+                block_lines.append(line)
+        return cls(readme_path, title, blocks)
+
+    @property
+    def config(self):
+        """The combined config of the yaml blocks without condition."""
+        if self._config is None:
+            config = {}
+            for block in self.blocks:
+                if block.condition:
+                    continue
                 try:
-                    yaml_config = yaml.safe_load("\n".join(yaml_content))
+                    yaml_config = safe_load_yaml(block.text)
                 except Exception as e:
-                    raise ValueError(f"Failed to parse autorest config: {e} for readme_file: {readme_path}")
-                _update_config(readme_config, yaml_config)
-                in_yaml_section = False
-                yaml_content = []
-            else:
-                if line.strip():
-                    yaml_content.append(line)
+                    raise ValueError(f"Failed to parse autorest config: {e} for readme_file: {self.readme_path}")
+                if yaml_config:
+                    _update_config(config, yaml_config)
+            self._config = config
+        return self._config
+
+    @property
+    def tag_input_files(self):
+        """The list of (tag, input files) in the yaml blocks, the tag of blocks without condition is ''."""
+        if self._tag_input_files is None:
+            tag_input_files = []
+            for block in self.blocks:
+                if block.condition:
+                    match = _TAG_CONDITION_RE.search(block.condition)
+                    if not match:
+                        continue
+                    tag = match[1].strip()
                 else:
-                    yaml_content.append("")
+                    tag = ''
+                if 'input-file' not in block.text:
+                    continue
+                try:
+                    body = safe_load_yaml(block.text)
+                    input_files = body['input-file']
+                except (yaml.YAMLError, KeyError, TypeError) as err:
+                    logger.error(f'ParseYamlFailed: {self.readme_path} {block.condition}: {err}')
+                    continue
+                if isinstance(input_files, str):
+                    input_files = [input_files]
+                tag_input_files.append((tag, input_files or []))
+            self._tag_input_files = tag_input_files
+        return self._tag_input_files
+
 
+_readme_files = {}
+_readme_files_lock = threading.Lock()
+
+
+def load_readme_file(readme_path):
+    """Load the structured readme file, it's cached until the file is modified."""
+    fingerprint = file_fingerprint(readme_path)
+    with _readme_files_lock:
+        cached = _readme_files.get(readme_path, None)
+    if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+        return cached[1]
+    with open(readme_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    readme_file = ReadmeFile.parse(readme_path, content)
+    with _readme_files_lock:
+        _readme_files[readme_path] = (fingerprint, readme_file)
+    return readme_file
+
+
+def parse_readme_file(readme_path: str):
+    """Parse the readme file title and combine basic config in the yaml section."""
+    readme_file = load_readme_file(readme_path)
     return {
-        "title": readme_title,
-        "config": readme_config
+        "title": readme_file.title,
+        # the config is shared in cache
+        "config": copy.deepcopy(readme_file.config)
     }